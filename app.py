@@ -32,8 +32,14 @@ app.config['WTF_CSRF_SECRET_KEY'] = app.secret_key
 app.config['WTF_CSRF_TIME_LIMIT'] = 3600  # 1 hour
 app.config['WTF_CSRF_SSL_STRICT'] = False  # Allow CSRF token without HTTPS
 
-# Initialize Socket.IO for real-time communication
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+# Initialize Socket.IO for real-time communication. With several workers, point
+# WORDWEAVER_SOCKETIO_QUEUE at a message queue (e.g. redis://localhost:6379/0) so
+# broadcasts reach clients connected to any worker, and WORDWEAVER_ROOM_STORE at a
+# shared room store (see room_store.py).
+# WORDWEAVER_ASYNC_MODE=gevent switches to cooperative workers (see serve.py).
+socketio = SocketIO(app, cors_allowed_origins="*",
+                    async_mode=os.environ.get('WORDWEAVER_ASYNC_MODE', 'threading'),
+                    message_queue=os.environ.get('WORDWEAVER_SOCKETIO_QUEUE'))
 
 # Initialize extensions
 class Base(DeclarativeBase):
@@ -87,5 +93,8 @@ with app.app_context():
     app.register_blueprint(main_blueprint)
     logger.info("Blueprints registered successfully")
 
+    # Register Socket.IO event handlers
+    import multiplayer  # noqa: F401
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,127 @@
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from lexicon_manager import lexicon_manager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+Pair = Tuple[Optional[str], str]
+
+
+class VerdictChunk(NamedTuple):
+    """Verdicts for a contiguous run of pairs; `start` is the index of the first pair"""
+    start: int
+    related: List[bool]
+    scores: List[float]
+
+
+def chunked(pairs: Iterable[Pair], chunk_size: int) -> Iterator[List[Pair]]:
+    iterator = iter(pairs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_chunk(pairs: List[Pair], backend=None) -> Tuple[List[bool], List[float]]:
+    """Validate a list of (previous_word, word) pairs without per-pair overhead
+
+    A pair without a previous word is the opening word of a chain and always passes.
+    """
+    snapshot = lexicon_manager.current()
+    backend = backend or snapshot.backend
+    lemmatize = snapshot.lemmatize
+    are_related = backend.are_related
+    score = backend.score
+    related: List[bool] = []
+    scores: List[float] = []
+    for previous_word, word in pairs:
+        if not previous_word:
+            related.append(True)
+            scores.append(0.0)
+            continue
+        previous_word, word = lemmatize(previous_word), lemmatize(word)
+        related.append(are_related(previous_word, word))
+        scores.append(score(previous_word, word))
+    return related, scores
+
+
+def validate_pairs(pairs: Iterable[Pair], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   backend=None) -> Iterator[VerdictChunk]:
+    """Stream verdicts for (previous_word, word) pairs in chunks"""
+    start = 0
+    for chunk in chunked(pairs, chunk_size):
+        related, scores = validate_chunk(chunk, backend)
+        yield VerdictChunk(start, related, scores)
+        start += len(chunk)
+
+
+def validate_pairs_parallel(pairs: Iterable[Pair], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            workers: Optional[int] = None) -> Iterator[VerdictChunk]:
+    """Stream verdicts in order while spreading chunks across a process pool
+
+    Each worker validates with its own copy of the active backend. At most two
+    chunks per worker are in flight, so arbitrarily long streams use bounded memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = 2 * workers
+        pending = deque()
+        start = 0
+        for chunk in chunked(pairs, chunk_size):
+            pending.append((start, executor.submit(validate_chunk, chunk)))
+            start += len(chunk)
+            if len(pending) >= window:
+                chunk_start, future = pending.popleft()
+                yield VerdictChunk(chunk_start, *future.result())
+        while pending:
+            chunk_start, future = pending.popleft()
+            yield VerdictChunk(chunk_start, *future.result())
+
+
+def iter_word_chain_rows(batch_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[int, Optional[str], str]]:
+    """Stream (id, previous_word, word) for every WordChain row; needs an app context"""
+    from models import WordChain
+
+    query = (WordChain.query
+             .with_entities(WordChain.id, WordChain.previous_word, WordChain.word)
+             .order_by(WordChain.id)
+             .yield_per(batch_size))
+    for row in query:
+        yield row.id, row.previous_word, row.word
+
+
+def revalidate_word_chains(chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           workers: Optional[int] = None) -> Iterator[Tuple[List[int], VerdictChunk]]:
+    """Revalidate every stored WordChain row, yielding (row ids, verdicts) per chunk"""
+    ids: List[int] = []
+
+    def pairs():
+        for row_id, previous_word, word in iter_word_chain_rows(chunk_size):
+            ids.append(row_id)
+            yield previous_word, word
+
+    if workers == 1:
+        verdicts = validate_pairs(pairs(), chunk_size)
+    else:
+        verdicts = validate_pairs_parallel(pairs(), chunk_size, workers)
+
+    total = 0
+    total_rejected = 0
+    for chunk in verdicts:
+        # Chunks arrive in order, so the oldest ids belong to this chunk
+        count = len(chunk.related)
+        chunk_ids = ids[:count]
+        del ids[:count]
+        total += count
+        total_rejected += chunk.related.count(False)
+        yield chunk_ids, chunk
+
+    logger.info(f"Revalidated word chains: {total} rows, {total_rejected} no longer related")
@@ -0,0 +1,42 @@
+import random
+import string
+import time
+
+from fuzzy_lookup import SymSpellIndex
+
+SIZES = [10_000, 50_000, 100_000, 500_000]
+LOOKUPS = 20_000
+
+
+def typo(word, rng):
+    """Apply one random edit to a word"""
+    position = rng.randrange(len(word))
+    kind = rng.randrange(3)
+    if kind == 0:
+        return word[:position] + word[position + 1:]
+    if kind == 1:
+        return word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1:]
+    return word[:position] + rng.choice(string.ascii_lowercase) + word[position:]
+
+
+def bench(size):
+    """Return (build seconds, mean lookup microseconds) for a vocabulary of `size` words"""
+    rng = random.Random(size)
+    words = {''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(size)}
+    start = time.perf_counter()
+    index = SymSpellIndex(words)
+    build_time = time.perf_counter() - start
+
+    vocabulary = index.words
+    queries = [typo(rng.choice(vocabulary), rng) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for query in queries:
+        index.lookup(query)
+    return build_time, (time.perf_counter() - start) / LOOKUPS * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{'words':>10} {'build s':>10} {'us/lookup':>10}")
+    for size in SIZES:
+        build_time, lookup_time = bench(size)
+        print(f"{size:>10} {build_time:>10.2f} {lookup_time:>10.1f}")
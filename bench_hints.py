@@ -0,0 +1,26 @@
+import random
+import time
+
+from hint_engine import hint_engine
+
+REQUESTS = 50_000
+
+
+def bench():
+    """Return (p50, p99) hint latency in microseconds over random words and histories"""
+    rng = random.Random(3)
+    words = [word for word in hint_engine.lexicon.words]
+    timings = []
+    for _ in range(REQUESTS):
+        word = rng.choice(words)
+        used = set(rng.sample(words, 20))
+        start = time.perf_counter()
+        hint_engine.hint(word, rng.randint(1, 3), used, 'medium')
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1e6, timings[int(len(timings) * 0.99)] * 1e6
+
+
+if __name__ == "__main__":
+    p50, p99 = bench()
+    print(f"hint latency: p50 {p50:.1f}us, p99 {p99:.1f}us")
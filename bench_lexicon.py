@@ -0,0 +1,54 @@
+import random
+import string
+import time
+
+from lexicon import Lexicon
+
+SIZES = [200, 2_000, 20_000, 200_000]
+CATEGORY_COUNT = 5
+LOOKUPS = 100_000
+# Same number of distinct keys at every size, so the working set stays in cache
+SAMPLE = 200
+# Best of several passes, to keep scheduler noise out of the comparison
+REPEATS = 5
+
+
+def build_categories(size, seed=42):
+    """Build a synthetic category table holding roughly `size` words"""
+    rng = random.Random(seed)
+    categories = {}
+    per_category = size // CATEGORY_COUNT
+    for index in range(CATEGORY_COUNT):
+        words = [''.join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(per_category)]
+        categories[f'category_{index}'] = {'words': words, 'common_words': []}
+    return categories
+
+
+def time_pairs(are_related, keys, rng):
+    pairs = [(rng.choice(keys), rng.choice(keys)) for _ in range(LOOKUPS)]
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for word1, word2 in pairs:
+            are_related(word1, word2)
+        best = min(best, time.perf_counter() - start)
+    return best / LOOKUPS * 1e9
+
+
+def bench(size):
+    """Return mean are_related latencies in ns: over a SAMPLE-word key set, and over the whole vocabulary"""
+    lex = Lexicon(build_categories(size))
+    rng = random.Random(7)
+    vocabulary = list(lex.words)
+    sample = rng.sample(vocabulary, min(SAMPLE, len(vocabulary)))
+    return time_pairs(lex.are_related, sample, rng), time_pairs(lex.are_related, vocabulary, rng)
+
+
+if __name__ == "__main__":
+    print(f"{'words':>10} {f'{SAMPLE}-key ns':>12} {'all-keys ns':>12}")
+    for size in SIZES:
+        sampled, spread = bench(size)
+        print(f"{size:>10} {sampled:>12.1f} {spread:>12.1f}")
+    print(f"{SAMPLE}-key: pairs drawn from {SAMPLE} random words of each vocabulary (cost of the lookup itself).")
+    print("all-keys: pairs drawn from the whole vocabulary; the growth with size is CPU cache misses "
+          "on a larger working set, not more work per lookup.")
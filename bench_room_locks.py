@@ -0,0 +1,57 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from room_state import PlayerState, Room
+from room_store import MemoryRoomStore
+
+ROOMS = 64
+EVENTS_PER_THREAD = 200
+# Time an event holds its room, standing in for I/O such as a database write
+HOLD_SECONDS = 0.001
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+class GlobalLockStore(MemoryRoomStore):
+    """Baseline: one lock for every room"""
+
+    def __init__(self):
+        super().__init__()
+        self._global = threading.Lock()
+
+    @contextmanager
+    def transaction(self, code):
+        with self._global:
+            yield self._rooms.get(code)
+
+
+def run(store, threads):
+    codes = [f'R{index:05d}' for index in range(ROOMS)]
+    for code in codes:
+        store.add(Room(code, 1, 'start', players=[PlayerState(1, 'a'), PlayerState(2, 'b')]))
+
+    def worker(offset):
+        for event in range(EVENTS_PER_THREAD):
+            with store.transaction(codes[(offset + event * threads) % ROOMS]) as room:
+                room.current_player.record_word(1)
+                time.sleep(HOLD_SECONDS)
+                room.advance_turn()
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = sum(player.score for code in codes for player in store.get(code).players)
+    assert total == threads * EVENTS_PER_THREAD
+    return total / elapsed
+
+
+if __name__ == "__main__":
+    print(f"{ROOMS} rooms, {HOLD_SECONDS * 1e3:.0f}ms per event")
+    for threads in THREAD_COUNTS:
+        striped = run(MemoryRoomStore(), threads)
+        global_lock = run(GlobalLockStore(), threads)
+        print(f"{threads:>3} threads: striped {striped:8.0f} events/s   global lock {global_lock:8.0f} events/s")
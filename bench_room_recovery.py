@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import time
+
+from room_snapshots import RoomSnapshotter
+from room_state import PlayerState, Room
+from room_store import MemoryRoomStore
+
+ROOMS = 10000
+PLAYERS = 4
+MOVES = 20
+CHANGED_FRACTION = 0.05
+
+
+def fill(store):
+    for index in range(ROOMS):
+        room = Room(f'R{index:05d}', index, 'rabbit', players=[
+            PlayerState(index * PLAYERS + seat, f'player{seat}', is_host=seat == 0) for seat in range(PLAYERS)
+        ])
+        for move in range(MOVES):
+            room.current_player.record_word(1 + move % 4)
+            room.play_word(f'word{index}-{move}')
+            room.advance_turn()
+            room.set_turn_deadline(time.time() + room.round_time)
+        store.add(room)
+
+
+def handler_latency_during(store, work):
+    """Worst time a handler waited for a room lock while `work` ran"""
+    worst = 0.0
+    done = threading.Event()
+
+    def handler():
+        nonlocal worst
+        index = 0
+        while not done.is_set():
+            start = time.perf_counter()
+            with store.transaction(f'R{index % ROOMS:05d}') as room:
+                room.touch()
+            worst = max(worst, time.perf_counter() - start)
+            index += 97
+
+    thread = threading.Thread(target=handler)
+    thread.start()
+    try:
+        work()
+    finally:
+        done.set()
+        thread.join()
+    return worst
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rooms.log')
+        store = MemoryRoomStore()
+        fill(store)
+        snapshots = RoomSnapshotter(path, store)
+
+        start = time.perf_counter()
+        worst = handler_latency_during(store, snapshots.snapshot)
+        print(f"full snapshot of {ROOMS} rooms:   {(time.perf_counter() - start) * 1000:8.1f} ms  "
+              f"log {os.path.getsize(path) / 1024 / 1024:.1f}MB  worst handler wait {worst * 1000:.2f} ms")
+
+        for index in range(0, ROOMS, int(1 / CHANGED_FRACTION)):
+            store.get(f'R{index:05d}').delta()
+        start = time.perf_counter()
+        written = snapshots.snapshot()
+        print(f"incremental ({written} changed):   {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        start = time.perf_counter()
+        snapshots.compact()
+        print(f"compaction:                   {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        restarted = MemoryRoomStore()
+        recovery = RoomSnapshotter(path, restarted)
+        start = time.perf_counter()
+        restored = recovery.restore()
+        print(f"recovery of {len(restored)} rooms:      {(time.perf_counter() - start) * 1000:8.1f} ms")
+        assert restarted.get('R00042').to_dict() == store.get('R00042').to_dict()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import json
+import time
+import tracemalloc
+
+from room_state import PlayerState, Room
+
+ROOMS = 50_000
+PLAYERS = 4
+WORDS = 20
+
+
+def dict_room(index):
+    """The plain-dict room layout multiplayer.py used before Room, plus the copy debug_monitor kept"""
+    room = {
+        'game_id': index,
+        'players': [{'id': index * PLAYERS + p, 'name': f'player{p}', 'score': 0, 'streak': 0, 'is_host': p == 0}
+                    for p in range(PLAYERS)],
+        'current_word': 'rabbit',
+        'used_words': {'rabbit'} | {f'word{w}' for w in range(WORDS)},
+        'turn_index': 0,
+        'round_time': 30,
+        'last_update': time.time(),
+        'is_paused': False,
+    }
+    return room, {**room, 'used_words': list(room['used_words'])}
+
+
+def slotted_room(index):
+    room = Room(f'{index:06d}', index, 'rabbit', players=[
+        PlayerState(index * PLAYERS + p, f'player{p}', is_host=p == 0) for p in range(PLAYERS)
+    ])
+    for w in range(WORDS):
+        room.play_word(f'word{w}')
+    return room
+
+
+def measure(factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rooms = [factory(index) for index in range(ROOMS)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rooms, size, elapsed
+
+
+def serialize_dicts(rooms):
+    return [{**room, 'used_words': list(room['used_words'])} for room, _ in rooms]
+
+
+def payload_sizes(words=200):
+    """JSON bytes of a word_accepted event carrying the full room vs only the delta"""
+    room = slotted_room(0)
+    full, delta = [], []
+    for w in range(words):
+        player = room.current_player
+        player.record_word(1)
+        room.play_word(f'long{w}')
+        room.advance_turn()
+        full.append(len(json.dumps({'word': f'long{w}', 'player': player.to_dict(), 'game_state': room.to_dict()})))
+        delta.append(len(json.dumps(room.delta(word=f'long{w}', player=player.to_dict(),
+                                               turn_index=room.turn_index, last_update=room.last_update))))
+    return full, delta
+
+
+if __name__ == "__main__":
+    for label, factory, serialize in (
+        ('dict', dict_room, serialize_dicts),
+        ('Room', slotted_room, lambda rooms: [room.to_dict() for room in rooms]),
+    ):
+        rooms, size, elapsed = measure(factory)
+        start = time.perf_counter()
+        serialize(rooms)
+        serialize_time = time.perf_counter() - start
+        print(f"{label:>4}: {size / ROOMS:,.0f} bytes/room at {ROOMS} rooms, "
+              f"built in {elapsed:.2f}s, serialized all in {serialize_time * 1e3:.1f}ms")
+        del rooms
+
+    full, delta = payload_sizes()
+    for move in (10, 50, 200):
+        print(f"word_accepted after {move} moves: full {full[move - 1]} bytes, delta {delta[move - 1]} bytes")
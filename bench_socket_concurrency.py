@@ -0,0 +1,145 @@
+"""Load test: how many concurrent Socket.IO clients one server process holds.
+
+Starts `serve.py` in each mode, opens websocket clients in growing steps and
+reports how many stayed connected, plus the server's thread count and RSS. A
+final phase has a batch of clients create rooms at once to time a handler that
+does database work. Needs aiohttp for the clients (pip install aiohttp).
+
+    python bench_socket_concurrency.py --steps 250 1000 2000 --modes threading gevent
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import urllib.request
+
+import aiohttp
+import psutil
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CONNECT_TIMEOUT = 10
+
+
+class Client:
+    """Minimal engine.io v4 / socket.io v5 websocket client"""
+
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+        self.ws = None
+        self.reader = None
+        self.events = asyncio.Queue()
+
+    async def connect(self):
+        self.ws = await self.session.ws_connect(self.url, autoping=False)
+        opened = await self.ws.receive_str(timeout=CONNECT_TIMEOUT)
+        assert opened.startswith('0'), opened
+        await self.ws.send_str('40')
+        while True:
+            message = await self.ws.receive_str(timeout=CONNECT_TIMEOUT)
+            if message.startswith('40'):
+                break
+        self.reader = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        async for message in self.ws:
+            data = message.data
+            if data == '2':
+                await self.ws.send_str('3')
+            elif data.startswith('42'):
+                self.events.put_nowait(json.loads(data[2:]))
+
+    async def emit(self, event, payload):
+        await self.ws.send_str('42' + json.dumps([event, payload]))
+
+    async def wait_for(self, event):
+        while True:
+            name, *args = await self.events.get()
+            if name == event:
+                return args
+
+    async def close(self):
+        if self.reader:
+            self.reader.cancel()
+        if self.ws:
+            await self.ws.close()
+
+
+def start_server(mode, port):
+    env = dict(os.environ, WORDWEAVER_DISCONNECT_GRACE='0')
+    process = subprocess.Popen([sys.executable, 'serve.py', '--mode', mode, '--port', str(port)],
+                               cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/ping', timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+async def run_mode(mode, port, steps, room_makers):
+    server = start_server(mode, port)
+    proc = psutil.Process(server.pid)
+    url = f'ws://127.0.0.1:{port}/socket.io/?EIO=4&transport=websocket'
+    clients = []
+    connector = aiohttp.TCPConnector(limit=0)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            for target in steps:
+                pending = [Client(session, url) for _ in range(target - len(clients))]
+                start = time.perf_counter()
+                results = await asyncio.gather(*(client.connect() for client in pending), return_exceptions=True)
+                elapsed = time.perf_counter() - start
+                clients += [client for client, result in zip(pending, results) if result is None]
+                failed = sum(result is not None for result in results)
+                await asyncio.sleep(1)
+                alive = sum(not client.ws.closed for client in clients)
+                print(f"{mode:>9} {target:>6} requested  {alive:>6} alive  {failed:>5} failed  "
+                      f"connect {elapsed:6.2f}s  threads {proc.num_threads():>5}  "
+                      f"rss {proc.memory_info().rss / 1024 / 1024:7.1f}MB")
+                if failed:
+                    break
+
+            makers = clients[:room_makers]
+            latencies = []
+
+            async def create_room(client, index):
+                start = time.perf_counter()
+                await client.emit('create_room', {'player_name': f'bench{index}'})
+                await client.wait_for('room_created')
+                latencies.append(time.perf_counter() - start)
+
+            await asyncio.gather(*(create_room(client, i) for i, client in enumerate(makers)))
+            latencies.sort()
+            if latencies:
+                print(f"{mode:>9} {len(latencies)} concurrent create_room: "
+                      f"p50 {latencies[len(latencies) // 2] * 1e3:.1f}ms  p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.1f}ms")
+            await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['threading', 'gevent'])
+    parser.add_argument('--steps', nargs='+', type=int, default=[250, 500, 1000, 2000])
+    parser.add_argument('--room-makers', type=int, default=100)
+    parser.add_argument('--port', type=int, default=5099)
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    for mode in args.modes:
+        asyncio.run(run_mode(mode, args.port, args.steps, args.room_makers))
+
+
+if __name__ == '__main__':
+    main()
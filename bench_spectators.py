@@ -0,0 +1,87 @@
+import json
+import time
+
+from room_state import PlayerState, Room
+from spectators import SpectatorHub
+
+ROOMS = 100
+SPECTATORS = 200
+MOVES_PER_SECOND = 10
+SECONDS = 5
+FPS = 4
+
+
+def make_rooms():
+    return {f'R{index:05d}': Room(f'R{index:05d}', index, 'rabbit', players=[
+        PlayerState(index * 4 + seat, f'player{seat}', is_host=seat == 0) for seat in range(4)
+    ]) for index in range(ROOMS)}
+
+
+def play(room, move):
+    room.play_word(f'word{move}')
+    room.advance_turn()
+    room.delta(word=f'word{move}')
+
+
+def fan_out(outbox, members, payload, skip=()):
+    """What the Socket.IO manager does per emit: one encoded packet queued per recipient"""
+    skip = set(skip)
+    for sid in members:
+        if sid not in skip:
+            outbox.append(payload)
+
+
+def per_move(rooms, members):
+    """Every move is encoded and sent to the spectators by the handler that made it"""
+    outbox = []
+    start = time.perf_counter()
+    for move in range(MOVES_PER_SECOND * SECONDS):
+        for room_code, room in rooms.items():
+            play(room, move)
+            fan_out(outbox, members[room_code], json.dumps({'seq': room.seq, 'game_state': room.to_dict()}))
+    return time.perf_counter() - start, 0.0, len(outbox)
+
+
+def coalesced(rooms, members):
+    """Handlers only update the room; the hub sends FPS frames a second"""
+    outbox = []
+
+    def load(room_code, known_seq):
+        room = rooms[room_code]
+        if room.seq == known_seq:
+            return room.seq, None
+        return room.seq, json.dumps({'seq': room.seq, 'game_state': room.to_dict()})
+
+    def send(event, payload, sids):
+        fan_out(outbox, sids, payload)
+
+    hub = SpectatorHub(load, send, max_fps=FPS)
+    for room_code in rooms:
+        for sid in members[room_code]:
+            hub.watch(sid, room_code, seq=0)
+    handler_time = pump_time = 0.0
+    for second in range(SECONDS):
+        for frame in range(FPS):
+            start = time.perf_counter()
+            for move in range(MOVES_PER_SECOND * frame // FPS, MOVES_PER_SECOND * (frame + 1) // FPS):
+                for room in rooms.values():
+                    play(room, move)
+            handler_time += time.perf_counter() - start
+            start = time.perf_counter()
+            hub.pump()
+            pump_time += time.perf_counter() - start
+    return handler_time, pump_time, len(outbox)
+
+
+def main():
+    print(f"{ROOMS} rooms x {SPECTATORS} spectators, {MOVES_PER_SECOND} moves/s per room for {SECONDS}s")
+    rooms = make_rooms()
+    members = {room_code: [f'{room_code}-{index}' for index in range(SPECTATORS)] for room_code in rooms}
+    for name, run in (('per-move broadcast', per_move), (f'coalesced @ {FPS} fps', coalesced)):
+        handler_time, pump_time, packets = run(make_rooms(), members)
+        print(f"{name:>19}: handlers {handler_time * 1000:8.1f} ms  pump {pump_time * 1000:8.1f} ms  "
+              f"{packets:>9} packets")
+
+
+if __name__ == '__main__':
+    main()
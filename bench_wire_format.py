@@ -0,0 +1,76 @@
+import random
+import time
+
+from socketio import packet
+
+import wire_format
+from lexicon_manager import lexicon_manager
+from room_state import PlayerState, Room
+
+PLAYER_COUNTS = (2, 8, 32)
+MOVES_PER_PLAYER = 5
+REPEAT = 2000
+
+
+def make_room(player_count, words):
+    room = Room('AB12CD', 1, words[0], players=[
+        PlayerState(1000 + seat, f'player{seat}', is_host=seat == 0) for seat in range(player_count)
+    ])
+    for move in range(player_count * MOVES_PER_PLAYER):
+        room.current_player.record_word(1 + move % 5)
+        room.play_word(words[move + 1])
+        room.advance_turn()
+        room.set_turn_deadline(time.time() + room.round_time)
+    return room
+
+
+def events(room, words):
+    player = room.current_player
+    return {
+        'room_snapshot': {'room_code': room.code, 'player_id': player.id, 'game_state': room.to_dict()},
+        'word_accepted': room.delta(word=words[-1], corrected_from=None, points=3, bonus_points=2,
+                                    strength=0.742, player=player.to_dict(), turn_index=room.turn_index,
+                                    turn_deadline=room.turn_deadline, last_update=room.last_update,
+                                    next_player=room.players[1].name),
+        'turn_timeout': room.delta(player=player.to_dict(), turn_index=room.turn_index,
+                                   turn_deadline=room.turn_deadline, next_player=room.players[1].name),
+    }
+
+
+def socketio_bytes(event, payload):
+    """Bytes on the wire: the Socket.IO text packet plus any binary attachment"""
+    encoded = packet.Packet(packet.EVENT, namespace='/', data=[event, payload]).encode()
+    if isinstance(encoded, list):
+        return sum(len(part) for part in encoded)
+    return len(encoded.encode('utf-8'))
+
+
+def time_per_call(func):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+def main():
+    snapshot = lexicon_manager.current()
+    table = wire_format.word_table(snapshot)
+    words = random.Random(7).sample(sorted(snapshot.lexicon.words), 32 * MOVES_PER_PLAYER + 2)
+    print(f"{'players':>7} {'event':>14} {'json B':>8} {'binary B':>9} {'ratio':>6} "
+          f"{'json us':>8} {'binary us':>10}")
+    for player_count in PLAYER_COUNTS:
+        room = make_room(player_count, words)
+        for event, payload in events(room, words).items():
+            json_bytes = socketio_bytes(event, payload)
+            binary_bytes = socketio_bytes(event, wire_format.encode(payload, table))
+            json_us = time_per_call(
+                lambda: packet.Packet(packet.EVENT, namespace='/', data=[event, payload]).encode())
+            binary_us = time_per_call(
+                lambda: packet.Packet(packet.EVENT, namespace='/',
+                                      data=[event, wire_format.encode(payload, table)]).encode())
+            print(f"{player_count:>7} {event:>14} {json_bytes:>8} {binary_bytes:>9} "
+                  f"{binary_bytes / json_bytes:>6.2f} {json_us:>8.1f} {binary_us:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
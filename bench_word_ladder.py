@@ -0,0 +1,36 @@
+import random
+import string
+import time
+
+from word_ladder import WordLadderEngine
+
+LEXICON_SIZE = 100_000
+PUZZLES = 200
+
+
+def build_words(size, seed=11):
+    """Random words of length 3-7, roughly the length mix of an English word list"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 7))))
+    return words
+
+
+if __name__ == "__main__":
+    words = build_words(LEXICON_SIZE)
+    start = time.perf_counter()
+    engine = WordLadderEngine(words)
+    print(f"built ladder graphs for {len(words)} words in {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(5)
+    for length in (3, 4, 5):
+        timings = []
+        generated = 0
+        for _ in range(PUZZLES):
+            start = time.perf_counter()
+            generated += engine.generate_puzzle(length, rng=rng) is not None
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f"length {length}: {generated}/{PUZZLES} puzzles, "
+              f"p50 {timings[len(timings) // 2] * 1e3:.2f}ms, p99 {timings[int(len(timings) * 0.99)] * 1e3:.2f}ms")
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from write_behind import WriteBehindQueue
+
+MOVES = 5000
+PRODUCERS = 8
+SCHEMA = ('CREATE TABLE word_chains (id INTEGER PRIMARY KEY, game_id INTEGER, word TEXT, '
+          'previous_word TEXT, points INTEGER, player_id INTEGER, timestamp TEXT)')
+INSERT = ('INSERT INTO word_chains (game_id, word, previous_word, points, player_id, timestamp) '
+          'VALUES (:game_id, :word, :previous_word, :points, :player_id, :timestamp)')
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute('PRAGMA synchronous=FULL')
+    return conn
+
+
+def run_producers(record):
+    latencies = []
+    lock = threading.Lock()
+
+    def producer(offset):
+        for move in range(offset, MOVES, PRODUCERS):
+            start = time.perf_counter()
+            record(move)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=producer, args=(offset,)) for offset in range(PRODUCERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def row(move):
+    return {'game_id': move % 50, 'word': f'word{move}', 'previous_word': f'word{move - 1}',
+            'points': 1, 'player_id': move % 200, 'timestamp': '2024-01-01 00:00:00'}
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = connect(os.path.join(tmp, 'per_row.db'))
+        conn.execute(SCHEMA)
+        commit_lock = threading.Lock()
+
+        def commit_each(move):
+            with commit_lock:
+                conn.execute(INSERT, row(move))
+                conn.commit()
+
+        elapsed, latencies = run_producers(commit_each)
+        print(f"commit per move: {MOVES / elapsed:8.0f} moves/s, handler p50 "
+              f"{latencies[len(latencies) // 2] * 1e3:.3f}ms p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.3f}ms")
+
+        conn = connect(os.path.join(tmp, 'batched.db'))
+        conn.execute(SCHEMA)
+
+        def writer(word_chains, players):
+            conn.executemany(INSERT, word_chains)
+            conn.commit()
+
+        queue = WriteBehindQueue(flush_interval_ms=50, batch_size=500, writer=writer)
+        elapsed, latencies = run_producers(lambda move: queue.record_word_chain(**row(move)))
+        start = time.perf_counter()
+        queue.close()
+        drain = time.perf_counter() - start
+        stats = queue.stats()
+        print(f"write-behind:    {MOVES / (elapsed + drain):8.0f} moves/s, handler p50 "
+              f"{latencies[len(latencies) // 2] * 1e3:.3f}ms p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.3f}ms, "
+              f"{stats['flushes']} flushes, flush p50 {stats['flush_ms_p50']}ms p99 {stats['flush_ms_p99']}ms")
+        assert conn.execute('SELECT COUNT(*) FROM word_chains').fetchone()[0] == MOVES
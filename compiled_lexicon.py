@@ -0,0 +1,476 @@
+"""Compiled, memory-mapped lexicon format.
+
+The compiler turns the vocabulary in game_config (plus optional external word
+files) into a single binary file. The reader maps that file read-only so every
+worker process shares the same pages, and answers lookups straight from the
+mapped arrays without materializing the vocabulary as Python objects.
+
+The lemma table (see morphology.py) and the SymSpell deletion dictionary (see
+fuzzy_lookup.py) are compiled into the same file, so workers look inflected
+forms and typos up instead of building those indexes at import.
+
+File layout (little-endian, every section 8-byte aligned):
+
+    header          magic, version and section offsets (HEADER_FORMAT)
+    category names  newline separated UTF-8
+    string offsets  uint32[word_count + 1] into the string blob
+    string blob     sorted, concatenated UTF-8 words
+    category masks  uint32[word_count], bit i set for category i
+    flags           uint8[word_count], FLAG_* bits
+    hash table      uint32[table_size], word id + 1 (0 = empty), crc32 probing
+    opposites       uint64[opposite_count], sorted (low id << 32 | high id)
+    form offsets    uint32[form_count + 1] into the form blob
+    form blob       sorted, concatenated UTF-8 inflected forms
+    form lemmas     uint32[form_count], word id of each form's lemma
+    form hash table uint32[form_table_size], form id + 1 (0 = empty), crc32 probing
+    variant offsets uint32[variant_count + 1] into the variant blob
+    variant blob    sorted, concatenated UTF-8 delete variants (max_edit_distance)
+    variant hash    uint32[variant_table_size], variant id + 1 (0 = empty), crc32 probing
+    posting offsets uint32[variant_count + 1] into the postings
+    postings        uint32[posting_count], ids of the words each variant came from
+    opposite list   uint32[2 * opposite_list_count], (word id, other id) in OPPOSITES order
+"""
+import argparse
+import bisect
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from lexicon import EMPTY_CATEGORIES, normalize_word
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'WWLX'
+FORMAT_VERSION = 4
+HEADER_FORMAT = '<4s12I17I'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAX_CATEGORIES = 32
+
+FLAG_START_WORD = 1   # Listed in WORD_LIST
+FLAG_DAILY = 2        # Listed in DAILY_CHALLENGE_WORDS
+FLAG_EXTERNAL = 4     # Came from an external word file
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _table_size(word_count: int) -> int:
+    size = 8
+    while size < word_count * 2:
+        size <<= 1
+    return size
+
+
+def _string_table(encoded: List[bytes]) -> Tuple[array, bytes, array]:
+    """Return the offsets, blob and crc32 hash table sections for a list of UTF-8 strings"""
+    offsets = array('I', [0])
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw))
+
+    table_size = _table_size(len(encoded))
+    table = array('I', bytes(4 * table_size))
+    for index, raw in enumerate(encoded):
+        slot = zlib.crc32(raw) & (table_size - 1)
+        while table[slot]:
+            slot = (slot + 1) & (table_size - 1)
+        table[slot] = index + 1
+    return offsets, b''.join(encoded), table
+
+
+def read_word_file(path: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (word, category) from a word file; lines are `word` or `word<TAB>category`"""
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            word, _, category = line.partition('\t')
+            yield normalize_word(word), (category.strip() or None)
+
+
+def compile_lexicon(output_path: str,
+                    categories: Dict[str, Dict[str, list]],
+                    opposites: Optional[Dict[str, List[str]]] = None,
+                    word_list: Iterable[str] = (),
+                    daily_words: Iterable[str] = (),
+                    word_files: Iterable[str] = (),
+                    external_words: Iterable[Tuple[str, Optional[str]]] = ()) -> int:
+    """Compile the vocabulary into a binary lexicon file and return its word count
+
+    `external_words` are (word, category) pairs treated like word file lines.
+    """
+    from fuzzy_lookup import DEFAULT_MAX_DISTANCE, build_delete_index
+    from morphology import build_lemma_table
+
+    category_names = list(categories.keys())
+    masks: Dict[str, int] = {}
+    flags: Dict[str, int] = {}
+
+    def add(word: str, category: Optional[str] = None, flag: int = 0) -> None:
+        word = normalize_word(word)
+        if not word:
+            return
+        mask = masks.get(word, 0)
+        if category is not None:
+            if category not in category_names:
+                category_names.append(category)
+            mask |= 1 << category_names.index(category)
+        masks[word] = mask
+        flags[word] = flags.get(word, 0) | flag
+
+    for category, content in categories.items():
+        for word in content.get('words', []) + content.get('common_words', []):
+            add(word, category)
+    for word in word_list:
+        add(word, flag=FLAG_START_WORD)
+    for word in daily_words:
+        add(word, flag=FLAG_DAILY)
+    for word, category in external_words:
+        add(word, category, FLAG_EXTERNAL)
+    for path in word_files:
+        for word, category in read_word_file(path):
+            add(word, category, FLAG_EXTERNAL)
+
+    opposite_pairs = []
+    for word, others in (opposites or {}).items():
+        add(word)
+        for other in others:
+            add(other)
+            opposite_pairs.append((normalize_word(word), normalize_word(other)))
+
+    if len(category_names) > MAX_CATEGORIES:
+        raise ValueError(f"Compiled lexicon supports at most {MAX_CATEGORIES} categories")
+
+    words = sorted(masks)
+    word_ids = {word: word_id for word_id, word in enumerate(words)}
+    string_offsets, blob, table = _string_table([word.encode('utf-8') for word in words])
+
+    lemma_table = build_lemma_table(words)
+    forms = sorted(lemma_table)
+    form_offsets, form_blob, form_table = _string_table([form.encode('utf-8') for form in forms])
+
+    delete_index = build_delete_index(words, DEFAULT_MAX_DISTANCE)
+    variants = sorted(delete_index)
+    variant_offsets, variant_blob, variant_table = _string_table([variant.encode('utf-8') for variant in variants])
+    posting_offsets = array('I', [0])
+    postings = array('I')
+    for variant in variants:
+        found = delete_index[variant]
+        postings.extend((found,) if isinstance(found, int) else found)
+        posting_offsets.append(len(postings))
+
+    # Each word's opposites are listed best first, so keep that order for opposite_table
+    opposite_list = array('I')
+    for a, b in opposite_pairs:
+        if a != b:
+            opposite_list.extend((word_ids[a], word_ids[b]))
+    opposite_keys = sorted({
+        (min(word_ids[a], word_ids[b]) << 32) | max(word_ids[a], word_ids[b])
+        for a, b in opposite_pairs if a != b
+    })
+
+    sections = [
+        '\n'.join(category_names).encode('utf-8'),
+        _to_le_bytes(string_offsets),
+        blob,
+        _to_le_bytes(array('I', (masks[word] for word in words))),
+        bytes(flags[word] for word in words),
+        _to_le_bytes(table),
+        _to_le_bytes(array('Q', opposite_keys)),
+        _to_le_bytes(form_offsets),
+        form_blob,
+        _to_le_bytes(array('I', (word_ids[lemma_table[form]] for form in forms))),
+        _to_le_bytes(form_table),
+        _to_le_bytes(variant_offsets),
+        variant_blob,
+        _to_le_bytes(variant_table),
+        _to_le_bytes(posting_offsets),
+        _to_le_bytes(postings),
+        _to_le_bytes(opposite_list),
+    ]
+
+    offsets = []
+    position = _align(HEADER_SIZE)
+    for section in sections:
+        offsets.append(position)
+        position = _align(position + len(section))
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, len(words), len(category_names),
+                         len(table), len(opposite_keys), len(forms), len(form_table), len(variants),
+                         len(variant_table), len(postings), DEFAULT_MAX_DISTANCE, len(opposite_list) // 2,
+                         *offsets)
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as handle:
+        handle.write(header)
+        for offset, section in zip(offsets, sections):
+            handle.write(b'\0' * (offset - handle.tell()))
+            handle.write(section)
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Compiled lexicon with {len(words)} words and {len(forms)} inflected forms to {output_path}")
+    return len(words)
+
+
+def recompile_lexicon(base_path: str, categories: Dict[str, Dict[str, list]],
+                      opposites: Optional[Dict[str, List[str]]] = None) -> str:
+    """Compile reloaded categories together with the external words of a compiled lexicon
+
+    The output sits next to `base_path`, named by a digest of its inputs, so every
+    worker reloading the same config maps the same file. Returns the output path.
+    """
+    import game_config
+
+    word_list, daily_words = list(game_config.WORD_LIST), list(game_config.DAILY_CHALLENGE_WORDS)
+    base = CompiledLexicon(base_path)
+    try:
+        key = repr((base.checksum(), len(base), categories, opposites, word_list, daily_words))
+        output_path = f"{base_path}.{hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()}"
+        if not os.path.exists(output_path):
+            compile_lexicon(output_path, categories, opposites, word_list, daily_words,
+                            external_words=list(base.external_words()))
+    finally:
+        base.close()
+    return output_path
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _StringTable:
+    """Strings and their crc32 hash table, read straight from a mapped file"""
+
+    def __init__(self, mm: mmap.mmap, view: memoryview, count: int,
+                 offsets_off: int, blob_off: int, table_off: int, table_size: int):
+        self._mm = mm
+        self.count = count
+        self.offsets = view[offsets_off:offsets_off + 4 * (count + 1)].cast('I')
+        self.blob_off = blob_off
+        self.table = view[table_off:table_off + 4 * table_size].cast('I')
+
+    def release(self) -> None:
+        self.offsets.release()
+        self.table.release()
+
+    def find(self, key: bytes) -> int:
+        """Return the index of a UTF-8 string, or -1 if it is not in the table"""
+        mask = len(self.table) - 1
+        slot = zlib.crc32(key) & mask
+        table, offsets, blob_off, mm = self.table, self.offsets, self.blob_off, self._mm
+        while True:
+            entry = table[slot]
+            if not entry:
+                return -1
+            index = entry - 1
+            start = blob_off + offsets[index]
+            end = blob_off + offsets[index + 1]
+            if end - start == len(key) and mm.find(key, start, end) == start:
+                return index
+            slot = (slot + 1) & mask
+
+    def at(self, index: int) -> str:
+        return self._mm[self.blob_off + self.offsets[index]:self.blob_off + self.offsets[index + 1]].decode('utf-8')
+
+
+class CompiledLexicon:
+    """Read-only lexicon backed by a memory-mapped compiled file"""
+
+    def __init__(self, path: str):
+        if sys.byteorder != 'little':
+            raise ValueError("Compiled lexicons can only be mapped on little-endian hosts")
+
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = struct.unpack_from('<4sI', self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} compiled lexicon")
+        (_, _, self._word_count, category_count, table_size, opposite_count, form_count,
+         form_table_size, variant_count, variant_table_size, posting_count, self.max_edit_distance,
+         opposite_list_count, *offsets) = struct.unpack_from(HEADER_FORMAT, self._mm, 0)
+
+        (names_off, str_off, blob_off, masks_off, flags_off, hash_off, opp_off,
+         form_str_off, form_blob_off, form_lemmas_off, form_hash_off, variant_str_off,
+         variant_blob_off, variant_hash_off, posting_offsets_off, postings_off, opp_list_off) = offsets
+        count = self._word_count
+        view = self._view = memoryview(self._mm)
+
+        self.category_names = tuple(
+            bytes(view[names_off:str_off]).rstrip(b'\0').decode('utf-8').split('\n')
+        )[:category_count]
+        self._words = _StringTable(self._mm, view, count, str_off, blob_off, hash_off, table_size)
+        self._masks = view[masks_off:masks_off + 4 * count].cast('I')
+        self._flags = view[flags_off:flags_off + count]
+        self._opposites = view[opp_off:opp_off + 8 * opposite_count].cast('Q')
+        self._forms = _StringTable(self._mm, view, form_count, form_str_off, form_blob_off,
+                                   form_hash_off, form_table_size)
+        self._form_lemmas = view[form_lemmas_off:form_lemmas_off + 4 * form_count].cast('I')
+        self._variants = _StringTable(self._mm, view, variant_count, variant_str_off, variant_blob_off,
+                                      variant_hash_off, variant_table_size)
+        self._posting_offsets = view[posting_offsets_off:posting_offsets_off + 4 * (variant_count + 1)].cast('I')
+        self._postings = view[postings_off:postings_off + 4 * posting_count].cast('I')
+        self._opposite_list = view[opp_list_off:opp_list_off + 8 * opposite_list_count].cast('I')
+        self._checksum = None
+        logger.info(f"Mapped compiled lexicon {path} with {count} words")
+
+    def close(self) -> None:
+        self._words.release()
+        self._forms.release()
+        self._variants.release()
+        for name in ('_masks', '_flags', '_opposites', '_form_lemmas', '_posting_offsets', '_postings',
+                     '_opposite_list', '_view'):
+            getattr(self, name).release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._word_count
+
+    def __contains__(self, word: str) -> bool:
+        return self.word_id(word) >= 0
+
+    def word_id(self, word: str) -> int:
+        """Return the word's id, or -1 if the word is not in the lexicon"""
+        key = normalize_word(word).encode('utf-8')
+        return self._words.find(key) if key else -1
+
+    def checksum(self) -> int:
+        """crc32 of the string table, used to pair companion files with this lexicon"""
+        if self._checksum is None:
+            words = self._words
+            blob = self._view[words.blob_off:words.blob_off + words.offsets[-1]]
+            self._checksum = zlib.crc32(blob, zlib.crc32(words.offsets))
+            blob.release()
+        return self._checksum
+
+    def word_at(self, word_id: int) -> str:
+        """Decode the word stored under an id"""
+        return self._words.at(word_id)
+
+    @property
+    def words(self) -> Iterator[str]:
+        return (self.word_at(word_id) for word_id in range(self._word_count))
+
+    @property
+    def form_count(self) -> int:
+        return self._forms.count
+
+    def lemma(self, word: str) -> Optional[str]:
+        """Return the lemma of a compiled inflected form, or None if the word is not one"""
+        key = normalize_word(word).encode('utf-8')
+        form_id = self._forms.find(key) if key else -1
+        return self._words.at(self._form_lemmas[form_id]) if form_id >= 0 else None
+
+    @property
+    def variant_count(self) -> int:
+        return self._variants.count
+
+    def variant_word_ids(self, variant: str) -> List[int]:
+        """Return the ids of the words a compiled delete variant was generated from"""
+        variant_id = self._variants.find(variant.encode('utf-8'))
+        if variant_id < 0:
+            return []
+        return self._postings[self._posting_offsets[variant_id]:self._posting_offsets[variant_id + 1]].tolist()
+
+    def category_table(self) -> Dict[str, Dict[str, list]]:
+        """The categories as a WORD_CATEGORIES-style table, rebuilt from the category masks"""
+        table = {name: {'words': [], 'common_words': []} for name in self.category_names}
+        for word_id in range(self._word_count):
+            mask = self._masks[word_id]
+            if not mask:
+                continue
+            word = self.word_at(word_id)
+            for bit, name in enumerate(self.category_names):
+                if mask >> bit & 1:
+                    table[name]['words'].append(word)
+        return table
+
+    def opposite_table(self) -> Dict[str, List[str]]:
+        """The opposites as an OPPOSITES-style table, in the order they were compiled"""
+        table: Dict[str, List[str]] = {}
+        pairs = self._opposite_list
+        for position in range(0, len(pairs), 2):
+            table.setdefault(self.word_at(pairs[position]), []).append(self.word_at(pairs[position + 1]))
+        return table
+
+    def external_words(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (word, category) for every word that came from a word file"""
+        for word_id in range(self._word_count):
+            if not self._flags[word_id] & FLAG_EXTERNAL:
+                continue
+            word, mask = self.word_at(word_id), self._masks[word_id]
+            if not mask:
+                yield word, None
+            for bit, name in enumerate(self.category_names):
+                if mask >> bit & 1:
+                    yield word, name
+
+    def category_mask(self, word: str) -> int:
+        word_id = self.word_id(word)
+        return self._masks[word_id] if word_id >= 0 else 0
+
+    def get_categories(self, word: str) -> FrozenSet[str]:
+        """Return every category a word belongs to"""
+        mask = self.category_mask(word)
+        if not mask:
+            return EMPTY_CATEGORIES
+        return frozenset(name for bit, name in enumerate(self.category_names) if mask >> bit & 1)
+
+    def get_primary_category(self, word: str) -> Optional[str]:
+        """Return the first category (in config order) a word belongs to"""
+        mask = self.category_mask(word)
+        if not mask:
+            return None
+        return self.category_names[(mask & -mask).bit_length() - 1]
+
+    def has_flag(self, word: str, flag: int) -> bool:
+        word_id = self.word_id(word)
+        return word_id >= 0 and bool(self._flags[word_id] & flag)
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        """Two words are related if their category bitmaps intersect"""
+        mask1 = self.category_mask(word1)
+        return bool(mask1) and bool(mask1 & self.category_mask(word2))
+
+    def shared_categories(self, word1: str, word2: str) -> FrozenSet[str]:
+        """Return the categories two words have in common"""
+        return self.get_categories(word1) & self.get_categories(word2)
+
+    def are_opposites(self, word1: str, word2: str) -> bool:
+        """Check the compiled OPPOSITES pairs"""
+        id1, id2 = self.word_id(word1), self.word_id(word2)
+        if id1 < 0 or id2 < 0:
+            return False
+        key = (min(id1, id2) << 32) | max(id1, id2)
+        position = bisect.bisect_left(self._opposites, key)
+        return position < len(self._opposites) and self._opposites[position] == key
+
+
+def main(argv=None):
+    from game_config import WORD_CATEGORIES, OPPOSITES, WORD_LIST, DAILY_CHALLENGE_WORDS
+
+    parser = argparse.ArgumentParser(description="Compile the WordWeaver vocabulary into a binary lexicon")
+    parser.add_argument('-o', '--output', default='lexicon.bin', help="Output file")
+    parser.add_argument('word_files', nargs='*', help="Extra word files (`word` or `word<TAB>category` per line)")
+    args = parser.parse_args(argv)
+
+    count = compile_lexicon(args.output, WORD_CATEGORIES, OPPOSITES, WORD_LIST,
+                            DAILY_CHALLENGE_WORDS, args.word_files)
+    print(f"Compiled {count} words to {args.output}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+from datetime import date, datetime
+from threading import Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from game_config import DAILY_CHALLENGE_WORDS, WORD_LIST
+
+logger = logging.getLogger(__name__)
+
+# Number of moves a strong player is expected to chain when computing par
+PAR_MOVES = 10
+BASE_POINTS = 10
+MAX_MULTIPLIER = 3
+CHALLENGE_DIFFICULTY = 'medium'
+
+
+class DailyChallengeData(NamedTuple):
+    day: date
+    word: str
+    follow_ups: Tuple[str, ...]
+    par_score: int
+
+
+def seed_index(day: date, size: int) -> int:
+    """Deterministic index for a date, identical across processes and restarts"""
+    digest = hashlib.sha256(day.isoformat().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % size
+
+
+def choose_daily_word(day: date, hints, candidates: Iterable[str] = ()) -> str:
+    """Pick the day's start word among candidates that have at least one valid follow-up"""
+    candidates = list(candidates) or DAILY_CHALLENGE_WORDS + WORD_LIST
+    playable = [word for word in dict.fromkeys(candidates) if hints.candidates(word, CHALLENGE_DIFFICULTY)]
+    pool = playable or candidates
+    return pool[seed_index(day, len(pool))]
+
+
+def compute_par(word: str, hints, moves: int = PAR_MOVES) -> int:
+    """Score of a greedy chain that always plays the top-ranked unused follow-up"""
+    used = {word}
+    current = word
+    score = 0
+    streak = 0
+    for _ in range(moves):
+        candidate = hints.best_candidate(current, used, CHALLENGE_DIFFICULTY)
+        if candidate is None:
+            break
+        current = candidate[0]
+        used.add(current)
+        # Same scoring as /submit_word
+        multiplier = min(MAX_MULTIPLIER, 1 + (streak * 0.5))
+        score += int(BASE_POINTS * multiplier)
+        streak += 1
+    return score
+
+
+def build_challenge(day: date, hints) -> DailyChallengeData:
+    word = choose_daily_word(day, hints)
+    follow_ups = tuple(hints.ranked_words(word, CHALLENGE_DIFFICULTY))
+    return DailyChallengeData(day, word, follow_ups, compute_par(word, hints))
+
+
+class DailyChallengeCache:
+    """Computes each day's challenge once, stores it in the database and keeps it in memory
+
+    The first request of the day builds (or loads) the challenge while holding a
+    lock; every other request, including those that arrive meanwhile, reuses it.
+    """
+
+    def __init__(self):
+        self._cache: Dict[date, DailyChallengeData] = {}
+        self._lock = Lock()
+
+    def get(self, day: Optional[date] = None) -> DailyChallengeData:
+        day = day or datetime.utcnow().date()
+        challenge = self._cache.get(day)
+        if challenge is not None:
+            return challenge
+        with self._lock:
+            challenge = self._cache.get(day)
+            if challenge is None:
+                challenge = self._load_or_build(day)
+                # Only the current day is ever requested, so drop older entries
+                self._cache = {day: challenge}
+        return challenge
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache = {}
+
+    def _load_or_build(self, day: date) -> DailyChallengeData:
+        from app import db
+        from models import DailyChallenge
+        from sqlalchemy.exc import IntegrityError
+
+        row = DailyChallenge.query.filter_by(day=day).first()
+        if row is None:
+            from lexicon_manager import lexicon_manager
+            challenge = build_challenge(day, lexicon_manager.current().hints)
+            row = DailyChallenge(
+                day=day,
+                word=challenge.word,
+                par_score=challenge.par_score,
+                follow_ups=json.dumps(list(challenge.follow_ups))
+            )
+            db.session.add(row)
+            try:
+                db.session.commit()
+                logger.info(f"Generated daily challenge for {day}: {challenge.word} (par {challenge.par_score})")
+                return challenge
+            except IntegrityError:
+                # Another worker stored today's challenge first; use theirs
+                db.session.rollback()
+                row = DailyChallenge.query.filter_by(day=day).first()
+
+        return DailyChallengeData(row.day, row.word, tuple(json.loads(row.follow_ups or '[]')), row.par_score)
+
+
+# Create singleton instance
+daily_challenge_cache = DailyChallengeCache()
+
+
+def top_daily_games(day: Optional[date] = None, limit: int = 10) -> List:
+    """Highest scoring daily challenge games started on a day"""
+    from models import Game
+
+    day = day or datetime.utcnow().date()
+    start = datetime.combine(day, datetime.min.time())
+    end = datetime.combine(day, datetime.max.time())
+    return (Game.query
+            .filter(Game.difficulty == 'daily', Game.start_time >= start, Game.start_time <= end)
+            .order_by(Game.final_score.desc())
+            .limit(limit)
+            .all())
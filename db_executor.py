@@ -0,0 +1,82 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+
+
+class BoundedExecutor:
+    """Runs blocking database work on a fixed pool of OS threads
+
+    Socket handlers call `run()`, which waits for the result. Under gevent the
+    pool is gevent's real-thread pool, so a slow query parks only the calling
+    greenlet instead of the whole event loop. At most `max_workers` calls run at
+    once and callers beyond that wait for a free slot, which bounds the load on
+    the database no matter how many sockets are connected.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS):
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor = None
+        self._init_lock = threading.Lock()
+        self.calls = 0
+        self.total_seconds = 0.0
+
+    def _pool(self):
+        if self._executor is None:
+            with self._init_lock:
+                if self._executor is None:
+                    from app import socketio
+                    if socketio.async_mode == 'gevent':
+                        from gevent.threadpool import ThreadPoolExecutor as GeventThreadPoolExecutor
+                        self._executor = GeventThreadPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                            thread_name_prefix='db-executor')
+        return self._executor
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run `func` inside an app context on the pool and return its result
+
+        Return plain values rather than ORM objects: the session is closed when
+        the call finishes, so returned instances would be detached.
+        """
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                return self._pool().submit(_call_in_app_context, func, args, kwargs).result()
+            finally:
+                self.calls += 1
+                self.total_seconds += time.perf_counter() - start
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'max_workers': self.max_workers,
+            'calls': self.calls,
+            'avg_ms': round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+        }
+
+
+def _call_in_app_context(func, args, kwargs):
+    from app import app, db
+
+    with app.app_context():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db.session.remove()
+
+
+# Create singleton instance
+db_executor = BoundedExecutor(int(os.environ.get('WORDWEAVER_DB_WORKERS', DEFAULT_WORKERS)))
@@ -14,12 +14,14 @@ logger = logging.getLogger(__name__)
 class DebugMonitor:
     def __init__(self):
         self.active_rooms = {}
+        self.room_activity = {}
         self.connection_count = 0
         self.error_count = 0
         self.start_time = time.time()
         self.last_check = time.time()
         self.monitoring = False
         self.monitor_thread = None
+        self.metric_sources = {}
 
     def start_monitoring(self):
         """Start the background monitoring thread"""
@@ -67,16 +69,15 @@ class DebugMonitor:
             current_time = time.time()
             for room_code, room in list(self.active_rooms.items()):
                 # Check for inactive rooms (no activity for 1 hour)
-                if current_time - room.get('last_update', 0) > 3600:
+                if current_time - self.room_activity.get(room_code, 0) > 3600:
                     logger.warning(f"Room {room_code} inactive for over an hour")
-                    if room_code in self.active_rooms:
-                        del self.active_rooms[room_code]
+                    self.remove_room(room_code)
+                    continue
 
                 # Check for player count consistency
-                if len(room.get('players', [])) == 0:
+                if len(room.players) == 0:
                     logger.warning(f"Room {room_code} has no players")
-                    if room_code in self.active_rooms:
-                        del self.active_rooms[room_code]
+                    self.remove_room(room_code)
         except Exception as e:
             logger.error(f"Error checking room health: {str(e)}")
 
@@ -109,8 +110,9 @@ class DebugMonitor:
     def update_room_state(self, room_code, room_state):
         """Update monitored room state"""
         try:
-            self.active_rooms[room_code] = room_state.copy()
-            self.active_rooms[room_code]['last_update'] = time.time()
+            # Rooms are live Room objects, so keep a reference rather than a copy
+            self.active_rooms[room_code] = room_state
+            self.room_activity[room_code] = time.time()
             logger.debug(f"Updated state for room {room_code}")
         except Exception as e:
             logger.error(f"Error updating room state: {str(e)}")
@@ -118,12 +120,28 @@ class DebugMonitor:
     def remove_room(self, room_code):
         """Remove room from monitoring"""
         try:
+            self.room_activity.pop(room_code, None)
             if room_code in self.active_rooms:
                 del self.active_rooms[room_code]
                 logger.info(f"Removed room {room_code} from monitoring")
         except Exception as e:
             logger.error(f"Error removing room: {str(e)}")
 
+    def register_metrics(self, name, source):
+        """Register a callable returning a dict of metrics for the dashboard"""
+        self.metric_sources[name] = source
+
+    def collect_metrics(self):
+        """Collect metrics from every registered source"""
+        metrics = {}
+        for name, source in list(self.metric_sources.items()):
+            try:
+                metrics[name] = source()
+            except Exception as e:
+                logger.error(f"Error collecting metrics from {name}: {str(e)}")
+                metrics[name] = {}
+        return metrics
+
 # Create singleton instance
 debug_monitor = DebugMonitor()
 
@@ -0,0 +1,177 @@
+"""Offline dictionary of definitions and etymologies.
+
+Entries are keyed by the word ids of a compiled lexicon (see compiled_lexicon.py).
+Each entry is compressed on its own, so a lookup decompresses only the entry it
+needs; the offset index is memory-mapped and decoded entries sit in a small LRU.
+
+File layout (little-endian):
+
+    header   magic, version, word count, lexicon checksum (HEADER_FORMAT)
+    offsets  uint64[word_count + 1] into the entry blob (equal neighbours = no entry)
+    entries  zlib-compressed `definition\\0etymology` UTF-8 per word id
+"""
+import argparse
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from compiled_lexicon import CompiledLexicon
+from relatedness_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'WWDC'
+FORMAT_VERSION = 1
+HEADER_FORMAT = '<4sIII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+DEFAULT_CACHE_SIZE = 4096
+COMPRESSION_LEVEL = 9
+
+
+class DictionaryEntry(NamedTuple):
+    definition: str
+    etymology: str
+
+
+def read_entry_file(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (word, definition, etymology) from `word<TAB>definition[<TAB>etymology]` lines"""
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            yield parts[0], parts[1] if len(parts) > 1 else '', parts[2] if len(parts) > 2 else ''
+
+
+def compile_dictionary(output_path: str, lexicon: CompiledLexicon,
+                       entries: Iterable[Tuple[str, str, str]]) -> int:
+    """Write a dictionary file for a compiled lexicon and return the number of entries"""
+    by_id: Dict[int, bytes] = {}
+    for word, definition, etymology in entries:
+        word_id = lexicon.word_id(word)
+        if word_id < 0:
+            logger.debug(f"Skipping dictionary entry for unknown word {word}")
+            continue
+        payload = f"{definition}\0{etymology}".encode('utf-8')
+        by_id[word_id] = zlib.compress(payload, COMPRESSION_LEVEL)
+
+    offsets = array('Q', [0])
+    blobs = []
+    for word_id in range(len(lexicon)):
+        blob = by_id.get(word_id, b'')
+        blobs.append(blob)
+        offsets.append(offsets[-1] + len(blob))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as handle:
+        handle.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, len(lexicon), lexicon.checksum()))
+        handle.write(offsets.tobytes())
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Compiled {len(by_id)} dictionary entries to {output_path}")
+    return len(by_id)
+
+
+class DictionaryStore:
+    """Memory-mapped dictionary with on-demand decompression and an LRU of decoded entries"""
+
+    def __init__(self, path: str, lexicon: CompiledLexicon, cache_size: int = DEFAULT_CACHE_SIZE):
+        if sys.byteorder != 'little':
+            raise ValueError("Dictionary files can only be mapped on little-endian hosts")
+
+        self.path = path
+        self.lexicon = lexicon
+        with open(path, 'rb') as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, word_count, checksum = struct.unpack_from(HEADER_FORMAT, self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} dictionary file")
+        if word_count != len(lexicon) or checksum != lexicon.checksum():
+            self._mm.close()
+            raise ValueError(f"{path} was compiled for a different lexicon than {lexicon.path}")
+
+        self._view = memoryview(self._mm)
+        self._offsets = self._view[HEADER_SIZE:HEADER_SIZE + 8 * (word_count + 1)].cast('Q')
+        self._entries_off = HEADER_SIZE + 8 * (word_count + 1)
+        self.cache = LRUCache(cache_size)
+        logger.info(f"Mapped dictionary {path} for {word_count} words")
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._view.release()
+        self._mm.close()
+
+    def lookup(self, word: str) -> Optional[DictionaryEntry]:
+        """Return the entry for a word, or None if it has none"""
+        word_id = self.lexicon.word_id(word)
+        if word_id < 0:
+            return None
+        entry = self.cache.get(word_id)
+        if entry is not None:
+            return entry
+        start, end = self._offsets[word_id], self._offsets[word_id + 1]
+        if start == end:
+            return None
+        payload = zlib.decompress(self._mm[self._entries_off + start:self._entries_off + end])
+        definition, _, etymology = payload.decode('utf-8').partition('\0')
+        entry = DictionaryEntry(definition, etymology)
+        self.cache.put(word_id, entry)
+        return entry
+
+    def definition(self, word: str) -> Optional[str]:
+        entry = self.lookup(word)
+        return entry.definition if entry and entry.definition else None
+
+    def etymology(self, word: str) -> Optional[str]:
+        entry = self.lookup(word)
+        return entry.etymology if entry and entry.etymology else None
+
+
+def load_dictionary() -> Optional[DictionaryStore]:
+    """Open WORDWEAVER_DICTIONARY_PATH against the WORDWEAVER_LEXICON_PATH lexicon, if configured"""
+    path = os.environ.get('WORDWEAVER_DICTIONARY_PATH')
+    lexicon_path = os.environ.get('WORDWEAVER_LEXICON_PATH')
+    if not path:
+        return None
+    if not lexicon_path:
+        logger.warning("WORDWEAVER_DICTIONARY_PATH needs WORDWEAVER_LEXICON_PATH; dictionary disabled")
+        return None
+    try:
+        return DictionaryStore(path, CompiledLexicon(lexicon_path))
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading dictionary: {str(e)}")
+        return None
+
+
+# Create singleton instance (None when no dictionary is configured)
+dictionary_store = load_dictionary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile definitions and etymologies into a dictionary file")
+    parser.add_argument('-l', '--lexicon', default='lexicon.bin', help="Compiled lexicon the ids refer to")
+    parser.add_argument('-o', '--output', default='dictionary.bin', help="Output file")
+    parser.add_argument('entry_files', nargs='+', help="`word<TAB>definition<TAB>etymology` files")
+    args = parser.parse_args(argv)
+
+    lexicon = CompiledLexicon(args.lexicon)
+    entries = (entry for path in args.entry_files for entry in read_entry_file(path))
+    count = compile_dictionary(args.output, lexicon, entries)
+    print(f"Compiled {count} entries to {args.output}")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
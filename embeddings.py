@@ -0,0 +1,131 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+from lexicon import normalize_word
+from relatedness import RelatednessBackend, CategoryBackend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.5
+
+
+def load_vectors(path: str) -> Tuple[List[str], 'np.ndarray']:
+    """Load a word2vec/GloVe style text file into (words, float32 matrix)
+
+    Each line is `word v1 v2 ... vn`. An optional first line `count dim` is skipped.
+    """
+    if np is None:
+        raise ImportError("The embedding backend requires numpy (pip install numpy)")
+
+    words: List[str] = []
+    rows: List[List[float]] = []
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle):
+            parts = line.rstrip().split(' ')
+            if line_number == 0 and len(parts) == 2:
+                continue
+            if len(parts) < 2:
+                continue
+            words.append(normalize_word(parts[0]))
+            rows.append(parts[1:])
+
+    matrix = np.asarray(rows, dtype=np.float32)
+    logger.info(f"Loaded {len(words)} word vectors of dimension {matrix.shape[1] if rows else 0} from {path}")
+    return words, matrix
+
+
+class EmbeddingBackend(RelatednessBackend):
+    """Cosine similarity over local word vectors, falling back for unknown words"""
+
+    name = 'embedding'
+
+    def __init__(self, words: Sequence[str], matrix: 'np.ndarray',
+                 threshold: float = DEFAULT_THRESHOLD,
+                 fallback: Optional[RelatednessBackend] = None):
+        if np is None:
+            raise ImportError("The embedding backend requires numpy (pip install numpy)")
+
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        # Rows are unit length, so a dot product is the cosine similarity
+        self.matrix = np.ascontiguousarray(matrix / norms, dtype=np.float32)
+        self.words = list(words)
+        self.index: Dict[str, int] = {word: row for row, word in enumerate(self.words)}
+        self.threshold = threshold
+        self.fallback = fallback or CategoryBackend()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'EmbeddingBackend':
+        words, matrix = load_vectors(path)
+        return cls(words, matrix, **kwargs)
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_word(word) in self.index
+
+    def similarity(self, word1: str, word2: str) -> Optional[float]:
+        """Return the cosine similarity, or None if either word has no vector"""
+        row1 = self.index.get(normalize_word(word1))
+        row2 = self.index.get(normalize_word(word2))
+        if row1 is None or row2 is None:
+            return None
+        return float(self.matrix[row1] @ self.matrix[row2])
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        similarity = self.similarity(word1, word2)
+        if similarity is None:
+            return self.fallback.are_related(word1, word2)
+        return similarity >= self.threshold
+
+    def score(self, word1: str, word2: str) -> float:
+        similarity = self.similarity(word1, word2)
+        if similarity is None:
+            return self.fallback.score(word1, word2)
+        return max(similarity, 0.0)
+
+    def _batch_similarities(self, word: str, candidates: Iterable[str]):
+        """Return (candidates, similarities, known mask) using one matrix-vector product"""
+        candidates = list(candidates)
+        rows = np.fromiter((self.index.get(normalize_word(c), -1) for c in candidates),
+                           dtype=np.int64, count=len(candidates))
+        known = rows >= 0
+        similarities = np.zeros(len(candidates), dtype=np.float32)
+        row = self.index.get(normalize_word(word))
+        if row is not None and known.any():
+            similarities[known] = self.matrix[rows[known]] @ self.matrix[row]
+        else:
+            known[:] = False
+        return candidates, similarities, known
+
+    def score_many(self, word: str, candidates: Iterable[str]) -> List[float]:
+        candidates, similarities, known = self._batch_similarities(word, candidates)
+        scores = np.maximum(similarities, 0.0).tolist()
+        for position in np.flatnonzero(~known):
+            scores[position] = self.fallback.score(word, candidates[position])
+        return scores
+
+    def related_many(self, word: str, candidates: Iterable[str]) -> List[bool]:
+        candidates, similarities, known = self._batch_similarities(word, candidates)
+        verdicts = (similarities >= self.threshold).tolist()
+        for position in np.flatnonzero(~known):
+            verdicts[position] = self.fallback.are_related(word, candidates[position])
+        return verdicts
+
+    def most_similar(self, word: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Return the `limit` nearest words by cosine similarity"""
+        row = self.index.get(normalize_word(word))
+        if row is None:
+            return []
+        similarities = self.matrix @ self.matrix[row]
+        similarities[row] = -np.inf
+        limit = min(limit, len(self.words) - 1)
+        if limit <= 0:
+            return []
+        top = np.argpartition(-similarities, limit - 1)[:limit]
+        top = top[np.argsort(-similarities[top], kind='stable')]
+        return [(self.words[i], float(similarities[i])) for i in top]
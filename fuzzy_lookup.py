@@ -0,0 +1,141 @@
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from lexicon import lexicon, normalize_word
+from word_graph import word_graph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DISTANCE = 1
+
+
+def deletes(word: str, distance: int) -> Set[str]:
+    """Return every string reachable from `word` by deleting up to `distance` characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {term[:i] + term[i + 1:] for term in frontier for i in range(len(term))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance (adjacent swaps cost 1), capped at max_distance + 1"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def build_delete_index(words: List[str], max_distance: int) -> Dict[str, Union[int, Tuple[int, ...]]]:
+    """Map every delete variant to the id of the word it came from, or a tuple of ids when shared"""
+    index: Dict[str, Union[int, Tuple[int, ...]]] = {}
+    for word_id, word in enumerate(words):
+        for variant in deletes(word, max_distance):
+            existing = index.get(variant)
+            if existing is None:
+                index[variant] = word_id
+            elif isinstance(existing, int):
+                index[variant] = (existing, word_id)
+            else:
+                index[variant] = existing + (word_id,)
+    return index
+
+
+class SymSpellIndex:
+    """SymSpell-style deletion dictionary for bounded-time typo lookups"""
+
+    def __init__(self, words: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.words: List[str] = sorted({normalize_word(word) for word in words if word})
+        self._word_set = frozenset(self.words)
+        self._index = build_delete_index(self.words, max_distance)
+        logger.info(f"Fuzzy index built with {len(self.words)} words and {len(self._index)} delete variants")
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_word(word) in self._word_set
+
+    def _variant_ids(self, variant: str) -> Iterable[int]:
+        found = self._index.get(variant)
+        if found is None:
+            return ()
+        return (found,) if isinstance(found, int) else found
+
+    def _word(self, word_id: int) -> str:
+        return self.words[word_id]
+
+    def lookup(self, term: str, max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return (word, distance) for every known word within max_distance, closest first"""
+        term = normalize_word(term)
+        if not term:
+            return []
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        if term in self:
+            return [(term, 0)]
+
+        candidate_ids: Set[int] = set()
+        for variant in deletes(term, max_distance):
+            candidate_ids.update(self._variant_ids(variant))
+
+        matches = []
+        for word_id in candidate_ids:
+            word = self._word(word_id)
+            distance = edit_distance(term, word, max_distance)
+            if distance <= max_distance:
+                matches.append((word, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def suggest(self, term: str, prefer: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """Return the best correction for a term, favouring words `prefer` accepts"""
+        matches = self.lookup(term)
+        if not matches:
+            return None
+        if prefer is not None:
+            best_distance = matches[0][1]
+            for word, distance in matches:
+                if distance == best_distance and prefer(word):
+                    return word
+        return matches[0][0]
+
+
+class CompiledSymSpellIndex(SymSpellIndex):
+    """SymSpellIndex whose deletion dictionary was compiled into the mapped lexicon"""
+
+    def __init__(self, compiled):
+        self.lexicon = compiled
+        self.max_distance = compiled.max_edit_distance
+        logger.info(f"Using the {compiled.variant_count} delete variants compiled into {compiled.path}")
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.lexicon
+
+    def _variant_ids(self, variant: str) -> Iterable[int]:
+        return self.lexicon.variant_word_ids(variant)
+
+    def _word(self, word_id: int) -> str:
+        return self.lexicon.word_at(word_id)
+
+
+def load_fuzzy_index(source, graph):
+    """Use the deletion index compiled into a mapped lexicon, or build one from the lexicon and graph words"""
+    from compiled_lexicon import CompiledLexicon
+    if isinstance(source, CompiledLexicon):
+        return CompiledSymSpellIndex(source)
+    return SymSpellIndex(set(source.words) | set(graph.words))
+
+
+# Create singleton instance
+fuzzy_index = load_fuzzy_index(lexicon, word_graph)
@@ -0,0 +1,114 @@
+import logging
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game_config import DIFFICULTY_SETTINGS
+from lexicon import lexicon, lexicon_tables, normalize_word
+from word_graph import word_graph
+
+logger = logging.getLogger(__name__)
+
+# Hint tiers, from vaguest to most revealing
+TIER_CATEGORY = 1
+TIER_PREFIX = 2
+TIER_WORD = 3
+MAX_TIER = TIER_WORD
+
+DEFAULT_DIFFICULTY = 'medium'
+
+# Candidate = (follow-up word, category it shares with the current word or None)
+Candidate = Tuple[str, Optional[str]]
+
+
+def min_length_for(difficulty: Optional[str]) -> int:
+    settings = DIFFICULTY_SETTINGS.get(difficulty) or DIFFICULTY_SETTINGS[DEFAULT_DIFFICULTY]
+    return settings['min_word_length']
+
+
+class HintEngine:
+    """Precomputed word -> ranked follow-up candidates, one table per minimum word length"""
+
+    def __init__(self, lexicon=lexicon, graph=word_graph, opposites=None):
+        self.lexicon = lexicon
+        if opposites is None:
+            opposites = lexicon_tables(lexicon)[1]
+        opposite_pairs = {
+            (normalize_word(word), normalize_word(other))
+            for word, others in opposites.items() for other in others
+        }
+        opposite_pairs |= {(b, a) for a, b in opposite_pairs}
+
+        ranked: Dict[str, Tuple[Candidate, ...]] = {}
+        for word in graph.words:
+            candidates = []
+            for candidate, _ in graph.neighbors(word):
+                category = self.shared_category(word, candidate)
+                if category is None and (word, candidate) not in opposite_pairs:
+                    continue
+                candidates.append((candidate, category))
+            ranked[word] = tuple(candidates)
+
+        lengths = sorted({settings['min_word_length'] for settings in DIFFICULTY_SETTINGS.values()})
+        self._tables = MappingProxyType({
+            length: MappingProxyType({
+                word: tuple(c for c in candidates if len(c[0]) >= length)
+                for word, candidates in ranked.items()
+            })
+            for length in lengths
+        })
+        logger.info(f"Hint engine built for {len(ranked)} words and minimum lengths {lengths}")
+
+    def shared_category(self, word: str, other: str) -> Optional[str]:
+        """The first category, in lexicon order, that both words belong to"""
+        shared = self.lexicon.shared_categories(word, other)
+        return min(shared, key=self.lexicon.category_names.index) if shared else None
+
+    def candidates(self, word: str, difficulty: Optional[str] = None) -> Tuple[Candidate, ...]:
+        """Return every valid follow-up for a word, best first"""
+        table = self._tables.get(min_length_for(difficulty)) or self._tables[min(self._tables)]
+        return table.get(normalize_word(word), ())
+
+    def best_candidate(self, word: str, used_words: Iterable[str] = (),
+                       difficulty: Optional[str] = None) -> Optional[Candidate]:
+        """Return the highest ranked follow-up that hasn't been used yet"""
+        used = used_words if isinstance(used_words, (set, frozenset)) else set(used_words)
+        for candidate in self.candidates(word, difficulty):
+            if candidate[0] not in used:
+                return candidate
+        return None
+
+    def hint(self, word: str, tier: int, used_words: Iterable[str] = (),
+             difficulty: Optional[str] = None, ranked: Optional[Iterable[str]] = None) -> Optional[str]:
+        """Return the hint text for a tier, or None if there is no valid follow-up
+
+        `ranked` is a follow-up list ranked ahead of time (a daily challenge's
+        follow_ups); when given it is used instead of this engine's table.
+        """
+        if ranked is not None:
+            used = set(used_words)
+            follow_up = next((candidate for candidate in ranked if candidate not in used), None)
+            if follow_up is None:
+                return None
+            category = self.shared_category(word, follow_up)
+        else:
+            candidate = self.best_candidate(word, used_words, difficulty)
+            if candidate is None:
+                return None
+            follow_up, category = candidate
+        tier = max(TIER_CATEGORY, min(tier, MAX_TIER))
+        if tier == TIER_CATEGORY:
+            if category:
+                return f"Try a word from the '{category}' category."
+            return f"Try a word that means the opposite of '{word}'."
+        if tier == TIER_PREFIX:
+            prefix = follow_up[:2] if len(follow_up) > 3 else follow_up[:1]
+            return f"Try a {len(follow_up)}-letter word starting with '{prefix}'."
+        return f"Try '{follow_up}'."
+
+    def ranked_words(self, word: str, difficulty: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+        words = [candidate for candidate, _ in self.candidates(word, difficulty)]
+        return words[:limit] if limit is not None else words
+
+
+# Create singleton instance
+hint_engine = HintEngine()
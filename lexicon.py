@@ -0,0 +1,99 @@
+import logging
+import os
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from game_config import WORD_CATEGORIES, OPPOSITES
+
+logger = logging.getLogger(__name__)
+
+EMPTY_CATEGORIES: FrozenSet[str] = frozenset()
+
+
+def normalize_word(word: Optional[str]) -> str:
+    """Normalize a word the same way for indexing and for lookups"""
+    if not word:
+        return ''
+    return word.strip().lower()
+
+
+class Lexicon:
+    """Immutable word -> categories index built once from a category table"""
+
+    def __init__(self, categories: Dict[str, Dict[str, list]]):
+        self.category_names = tuple(categories.keys())
+        index: Dict[str, set] = {}
+        for category, content in categories.items():
+            for word in content.get('words', []) + content.get('common_words', []):
+                key = normalize_word(word)
+                if key:
+                    index.setdefault(key, set()).add(category)
+
+        # Primary category keeps the old first-match semantics of get_word_category
+        order = {name: position for position, name in enumerate(self.category_names)}
+        self._index = MappingProxyType({word: frozenset(cats) for word, cats in index.items()})
+        self._primary = MappingProxyType({
+            word: min(cats, key=order.__getitem__) for word, cats in index.items()
+        })
+        logger.info(f"Lexicon built with {len(self._index)} words in {len(self.category_names)} categories")
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_word(word) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def words(self) -> Iterable[str]:
+        return self._index.keys()
+
+    def get_categories(self, word: str) -> FrozenSet[str]:
+        """Return every category a word belongs to"""
+        return self._index.get(normalize_word(word), EMPTY_CATEGORIES)
+
+    def get_primary_category(self, word: str) -> Optional[str]:
+        """Return the first category (in config order) a word belongs to"""
+        return self._primary.get(normalize_word(word))
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        """Two words are related if they share at least one category"""
+        cats1 = self._index.get(normalize_word(word1))
+        if not cats1:
+            return False
+        cats2 = self._index.get(normalize_word(word2))
+        return bool(cats2) and not cats1.isdisjoint(cats2)
+
+    def shared_categories(self, word1: str, word2: str) -> FrozenSet[str]:
+        """Return the categories two words have in common"""
+        return self.get_categories(word1) & self.get_categories(word2)
+
+
+def load_lexicon(categories=None, opposites=None):
+    """Map the compiled lexicon if WORDWEAVER_LEXICON_PATH is set, else index the categories
+
+    With a compiled lexicon, categories passed in (a reload) are compiled together
+    with its external words into a companion file, and that file is mapped.
+    """
+    path = os.environ.get('WORDWEAVER_LEXICON_PATH')
+    if path:
+        from compiled_lexicon import CompiledLexicon, recompile_lexicon
+        if categories is not None:
+            path = recompile_lexicon(path, categories, opposites)
+        return CompiledLexicon(path)
+    return Lexicon(WORD_CATEGORIES if categories is None else categories)
+
+
+def lexicon_tables(source, categories=None, opposites=None):
+    """Return the (categories, opposites) tables to build graphs and hints from
+
+    A compiled lexicon carries its own tables, so indexes built from them agree with
+    what it answers; otherwise the given tables (default: game_config's) are used.
+    """
+    if hasattr(source, 'opposite_table'):
+        return source.category_table(), source.opposite_table()
+    return (WORD_CATEGORIES if categories is None else categories,
+            OPPOSITES if opposites is None else opposites)
+
+
+# Create singleton instance
+lexicon = load_lexicon()
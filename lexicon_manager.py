@@ -0,0 +1,210 @@
+import importlib
+import logging
+import os
+import time
+from threading import Lock, Thread, Timer
+from typing import Any, Dict, FrozenSet, Optional
+
+import game_config
+import relatedness
+from fuzzy_lookup import fuzzy_index, load_fuzzy_index
+from hint_engine import HintEngine, hint_engine
+from lexicon import lexicon, lexicon_tables, load_lexicon
+from morphology import lemmatizer, load_lemmatizer
+from word_graph import WordGraph, read_pair_file, word_graph
+from word_ladder import WordLadderEngine, load_ladder_words, word_ladder_engine
+
+logger = logging.getLogger(__name__)
+
+# How long a swapped-out compiled lexicon stays mapped for requests still using it
+RETIRE_SECONDS = 60.0
+
+
+def _gevent_patched() -> bool:
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+
+class LexiconSnapshot:
+    """One immutable vocabulary version together with every index built from it
+
+    Request handlers grab a snapshot once and use it for the whole request, so a
+    reload that lands halfway through never mixes two vocabularies.
+    """
+
+    def __init__(self, version, categories, opposites, lexicon, graph, backend,
+                 hints, fuzzy, lemmatizer, ladder):
+        self.version = version
+        self.categories = categories
+        self.opposites = opposites
+        self.lexicon = lexicon
+        self.graph = graph
+        self.backend = backend
+        self.hints = hints
+        self.fuzzy = fuzzy
+        self.lemmatizer = lemmatizer
+        self.ladder = ladder
+        self.loaded_at = time.time()
+
+    @classmethod
+    def build(cls, version: int, categories, opposites, pairs=()) -> 'LexiconSnapshot':
+        """Build every index for a vocabulary; slow, so call it off the request path"""
+        new_lexicon = load_lexicon(categories, opposites)
+        # A compiled lexicon has the categories compiled in; build from its tables
+        graph_categories, graph_opposites = lexicon_tables(new_lexicon, categories, opposites)
+        graph = WordGraph.build(graph_categories, graph_opposites, pairs)
+        return cls(
+            version=version,
+            categories=categories,
+            opposites=opposites,
+            lexicon=new_lexicon,
+            graph=graph,
+            backend=relatedness.create_backend(new_lexicon, graph),
+            hints=HintEngine(new_lexicon, graph, graph_opposites),
+            fuzzy=load_fuzzy_index(new_lexicon, graph),
+            lemmatizer=load_lemmatizer(new_lexicon, graph),
+            ladder=WordLadderEngine(load_ladder_words(new_lexicon)),
+        )
+
+    def replace(self, **changes) -> 'LexiconSnapshot':
+        """Return a copy with some components swapped and the version bumped"""
+        fields = {name: getattr(self, name) for name in (
+            'categories', 'opposites', 'lexicon', 'graph', 'backend', 'hints', 'fuzzy', 'lemmatizer', 'ladder'
+        )}
+        fields.update(changes)
+        return LexiconSnapshot(self.version + 1, **fields)
+
+    def lemmatize(self, word: str) -> str:
+        return self.lemmatizer.lemmatize(word)
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        return self.backend.are_related(word1, word2)
+
+    def score(self, word1: str, word2: str) -> float:
+        return self.backend.score(word1, word2)
+
+    def get_categories(self, word: str) -> FrozenSet[str]:
+        return self.lexicon.get_categories(word)
+
+    def suggest_correction(self, current_word: str, word: str) -> Optional[str]:
+        """Suggest a known word close to a misspelled submission, favouring related ones"""
+        if word in self.fuzzy:
+            return None
+        return self.fuzzy.suggest(word, prefer=lambda candidate: self.backend.are_related(current_word, candidate))
+
+
+class LexiconManager:
+    """Holds the current LexiconSnapshot and swaps in new versions built in the background
+
+    Readers only ever load `self._snapshot`, a single reference assignment, so the
+    read path takes no locks. The lock only serializes concurrent reloads.
+    """
+
+    def __init__(self, snapshot: LexiconSnapshot):
+        self._snapshot = snapshot
+        self._reload_lock = Lock()
+        self.reloading = False
+        self.last_error: Optional[str] = None
+        self.last_reload_seconds: Optional[float] = None
+
+    def current(self) -> LexiconSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def swap(self, snapshot: LexiconSnapshot) -> None:
+        """Atomically make `snapshot` the current vocabulary"""
+        previous = self._snapshot
+        self._snapshot = snapshot
+        logger.info(f"Lexicon version {snapshot.version} is now active ({len(snapshot.lexicon)} words)")
+        # The import-time lexicon is shared with module singletons, so only reloaded ones are closed
+        retired = previous.lexicon
+        if retired is not snapshot.lexicon and retired is not lexicon and hasattr(retired, 'close'):
+            timer = Timer(RETIRE_SECONDS, self._close_retired, args=(retired,))
+            timer.daemon = True
+            timer.start()
+
+    def _close_retired(self, retired) -> None:
+        """Unmap a swapped-out lexicon once in-flight requests are done with it"""
+        if self._snapshot.lexicon is not retired:
+            retired.close()
+            logger.info(f"Closed retired lexicon {retired.path}")
+
+    def set_backend(self, backend) -> None:
+        self.swap(self._snapshot.replace(backend=backend))
+
+    def reload(self) -> LexiconSnapshot:
+        """Re-read game_config (and any association file) and swap in the rebuilt indexes"""
+        with self._reload_lock:
+            self.reloading = True
+            start = time.time()
+            try:
+                if _gevent_patched():
+                    # The rebuild is CPU-bound; a real OS thread keeps the event loop running
+                    from gevent import get_hub
+                    snapshot = get_hub().threadpool.apply(self._rebuild, (self.version + 1,))
+                else:
+                    snapshot = self._rebuild(self.version + 1)
+                self.swap(snapshot)
+                self.last_error = None
+                return snapshot
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Error reloading lexicon: {str(e)}")
+                raise
+            finally:
+                self.last_reload_seconds = time.time() - start
+                self.reloading = False
+
+    @staticmethod
+    def _rebuild(version: int) -> LexiconSnapshot:
+        config = importlib.reload(game_config)
+        path = os.environ.get('WORDWEAVER_ASSOCIATIONS_PATH')
+        pairs = list(read_pair_file(path)) if path else ()
+        return LexiconSnapshot.build(version, config.WORD_CATEGORIES, config.OPPOSITES, pairs)
+
+    def reload_async(self) -> bool:
+        """Start a background reload; returns False if one is already running"""
+        if self.reloading:
+            return False
+        thread = Thread(target=self._reload_quietly)
+        thread.daemon = True
+        thread.start()
+        return True
+
+    def _reload_quietly(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            pass  # Already logged and recorded in last_error
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            'version': snapshot.version,
+            'words': len(snapshot.lexicon),
+            'loaded_at': snapshot.loaded_at,
+            'reloading': self.reloading,
+            'last_reload_seconds': self.last_reload_seconds,
+            'last_error': self.last_error,
+        }
+
+
+# Create singleton instance from the indexes built at import time
+lexicon_manager = LexiconManager(LexiconSnapshot(
+    version=1,
+    categories=game_config.WORD_CATEGORIES,
+    opposites=game_config.OPPOSITES,
+    lexicon=lexicon,
+    graph=word_graph,
+    backend=relatedness.backend,
+    hints=hint_engine,
+    fuzzy=fuzzy_index,
+    lemmatizer=lemmatizer,
+    ladder=word_ladder_engine,
+))
@@ -24,6 +24,19 @@ class Game(db.Model):
     start_time = db.Column(db.DateTime, default=datetime.utcnow)
     end_time = db.Column(db.DateTime, nullable=True)
     final_score = db.Column(db.Integer, default=0)
+    is_multiplayer = db.Column(db.Boolean, default=False)
+    room_code = db.Column(db.String(6), index=True, nullable=True)
+
+class Player(db.Model):
+    __tablename__ = 'players'
+
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id', ondelete='CASCADE'))
+    name = db.Column(db.String(64), nullable=False)
+    is_host = db.Column(db.Boolean, default=False)
+    score = db.Column(db.Integer, default=0)
+    streak = db.Column(db.Integer, default=0)
+    last_active = db.Column(db.DateTime, default=datetime.utcnow)
 
 class WordChain(db.Model):
     __tablename__ = 'word_chains'
@@ -34,4 +47,14 @@ class WordChain(db.Model):
     previous_word = db.Column(db.String(100))
     points = db.Column(db.Integer, default=0)
     player_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+
+class DailyChallenge(db.Model):
+    __tablename__ = 'daily_challenges'
+
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, unique=True, nullable=False)
+    word = db.Column(db.String(100), nullable=False)
+    par_score = db.Column(db.Integer, default=0)
+    follow_ups = db.Column(db.Text)  # JSON list of valid follow-up words
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,132 @@
+import logging
+from types import MappingProxyType
+from typing import Dict, Iterable, Set
+
+from lexicon import lexicon, normalize_word
+from word_graph import word_graph
+
+logger = logging.getLogger(__name__)
+
+VOWELS = set('aeiou')
+
+# Only these get -er/-est forms; applied to every lemma they invent words (bee -> beer, cat -> cater)
+COMPARABLE_ADJECTIVES = frozenset((
+    'airy angry big bitter black blue bold brave bright broad brown bumpy busy calm cheap chilly '
+    'clean clear close cloudy coarse cold cool crisp cruel dark deep dim dirty dry dull dusty early '
+    'easy faint fair fast feeble fierce filthy fine firm flat fresh full funny gentle gloomy grand '
+    'gray great green grimy happy hard harsh heavy high hot humid hungry kind large late lazy lean '
+    'light little lonely long loose loud lovely low lucky lush mild misty moist murky narrow near '
+    'neat needy new nice noisy old pale plain poor proud pure quick quiet rare red rich ripe rough '
+    'round rude sad safe salty shallow sharp shiny short shy silly simple slender slim slow small '
+    'smart smooth snowy soft sour stormy strange strict strong sunny sweet tall tame tart thick thin '
+    'tidy tight tiny tough ugly warm weak wet white wide wild windy wise young'
+).split())
+
+
+def _ends_cvc(word: str) -> bool:
+    """Short consonant-vowel-consonant endings double their last letter (stop -> stopped)"""
+    return (len(word) >= 3 and word[-1] not in VOWELS and word[-1] not in 'wxy'
+            and word[-2] in VOWELS and word[-3] not in VOWELS)
+
+
+def inflections(lemma: str) -> Set[str]:
+    """Generate plural, verb and (for COMPARABLE_ADJECTIVES) comparative forms of a lemma"""
+    forms = set()
+    if len(lemma) < 2 or not lemma.isalpha():
+        return forms
+
+    # Plurals / third person
+    if lemma.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        forms.add(lemma + 'es')
+    elif lemma[-1] == 'y' and lemma[-2] not in VOWELS:
+        forms.add(lemma[:-1] + 'ies')
+    else:
+        forms.add(lemma + 's')
+
+    # Past tense, participles and comparatives
+    comparable = lemma in COMPARABLE_ADJECTIVES
+    if lemma[-1] == 'e':
+        # see -> seeing, not seing (nor bee -> being)
+        forms.update({lemma + 'd', (lemma if lemma[-2] in 'eoy' else lemma[:-1]) + 'ing'})
+        if comparable:
+            forms.update({lemma + 'r', lemma + 'st'})
+    elif lemma[-1] == 'y' and lemma[-2] not in VOWELS:
+        stem = lemma[:-1] + 'i'
+        forms.update({stem + 'ed', lemma + 'ing'})
+        if comparable:
+            forms.update({stem + 'er', stem + 'est'})
+    else:
+        stems = {lemma}
+        if _ends_cvc(lemma) and len(lemma) <= 4:
+            stems.add(lemma + lemma[-1])
+        for stem in stems:
+            forms.update({stem + 'ed', stem + 'ing'})
+            if comparable:
+                forms.update({stem + 'er', stem + 'est'})
+
+    forms.discard(lemma)
+    return forms
+
+
+def build_lemma_table(vocabulary: Iterable[str]) -> Dict[str, str]:
+    """Map every generated inflected form to its lemma
+
+    Forms that are words in their own right (e.g. 'feeling') are left alone, and
+    when two lemmas generate the same form the alphabetically first one wins.
+    """
+    lemmas = sorted({normalize_word(word) for word in vocabulary if word})
+    known = set(lemmas)
+    table: Dict[str, str] = {}
+    for lemma in lemmas:
+        for form in inflections(lemma):
+            if form not in known and form not in table:
+                table[form] = lemma
+    return table
+
+
+class Lemmatizer:
+    """Precomputed inflected form -> lemma lookup"""
+
+    def __init__(self, vocabulary: Iterable[str]):
+        self._table = MappingProxyType(build_lemma_table(vocabulary))
+        logger.info(f"Lemma table built with {len(self._table)} inflected forms")
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def lemmatize(self, word: str) -> str:
+        """Return the lexicon lemma for a word, or the normalized word itself"""
+        word = normalize_word(word)
+        return self._table.get(word, word)
+
+
+class CompiledLemmatizer:
+    """Inflected form -> lemma lookup answered from the table compiled into the lexicon"""
+
+    def __init__(self, compiled):
+        self.lexicon = compiled
+        logger.info(f"Using the {compiled.form_count} inflected forms compiled into {compiled.path}")
+
+    def __len__(self) -> int:
+        return self.lexicon.form_count
+
+    def lemmatize(self, word: str) -> str:
+        """Return the lexicon lemma for a word, or the normalized word itself"""
+        word = normalize_word(word)
+        return self.lexicon.lemma(word) or word
+
+
+def load_lemmatizer(source, graph):
+    """Look lemmas up in a compiled lexicon, or build the table from the lexicon and graph words"""
+    from compiled_lexicon import CompiledLexicon
+    if isinstance(source, CompiledLexicon):
+        return CompiledLemmatizer(source)
+    return Lemmatizer(set(source.words) | set(graph.words))
+
+
+# Create singleton instance
+lemmatizer = load_lemmatizer(lexicon, word_graph)
+
+
+def lemmatize(word: str) -> str:
+    return lemmatizer.lemmatize(word)
@@ -1,54 +1,207 @@
 from flask_socketio import emit, join_room, leave_room
 from flask import request
 from app import socketio, db
-from models import Game, Player, WordChain
+from models import Game, Player
+import json
 import random
-import string
-from datetime import datetime
 import logging
-from game_config import WORD_CATEGORIES
+import time
+from datetime import datetime
 from debug_monitor import debug_monitor, monitor_execution
+import relatedness
+from lexicon_manager import lexicon_manager
+from room_state import Room, PlayerState
+from room_store import create_room_store
+from room_snapshots import create_snapshotter
+from session_registry import session_registry
+from db_executor import db_executor
+from write_behind import write_behind
+from timer_wheel import TimerWheel
+from room_codes import room_code_allocator
+from spectators import SpectatorHub, load_max_fps
+import wire_format
+from wire_format import wire_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-# Store active game rooms
-active_rooms = {}
+# Active game rooms; shared between workers when WORDWEAVER_ROOM_STORE points at a shared backend.
+# Under gevent a shared store's blocking calls run on real threads, so a lock wait never stalls the hub
+rooms = create_room_store(run_blocking=db_executor.run if socketio.async_mode == 'gevent' else None)
+
+# Crash recovery for in-process rooms, enabled by WORDWEAVER_ROOM_SNAPSHOT; file writes go through the executor
+room_snapshots = create_snapshotter(rooms, db_executor.run)
+
+# Codes are issued fresh a few times if another process already holds them
+ROOM_CODE_ATTEMPTS = 5
+_room_codes_seeded = False
+
+# How often parked seats of disconnected players are checked for expiry
+REAPER_INTERVAL = 1.0
+_reaper_started = False
+
+# Turn deadlines for every room in this process, fired by a single background task
+turn_timers = TimerWheel()
+_turn_driver_started = False
+
+def load_spectator_frame(room_code, known_seq):
+    """Serialize a room once for all its spectators; None once it is gone"""
+    with rooms.read(room_code) as room:
+        if room is None:
+            return None
+        if room.seq == known_seq:
+            return room.seq, None
+        # Encoded inside the read, so the frame is never caught mid-update
+        return room.seq, json.dumps({
+            'room_code': room_code,
+            'seq': room.seq,
+            'game_state': room.to_dict()
+        })
+
+def send_to_spectators(event, payload, sids):
+    # Only this worker's spectators; the packet is still encoded once for all of them
+    socketio.emit(event, payload, to=sids)
+
+def spectator_backlog(sid):
+    """Packets still queued for a socket on this server"""
+    server = socketio.server
+    eio_sid = server.manager.eio_sid_from_sid(sid, '/')
+    eio_socket = server.eio.sockets.get(eio_sid) if eio_sid else None
+    return eio_socket.queue.qsize() if eio_socket is not None else 0
+
+# Rate-limited fan-out to spectators; players never wait on it
+spectator_hub = SpectatorHub(load_spectator_frame, send_to_spectators, spectator_backlog,
+                             max_fps=load_max_fps())
+_spectator_pump_started = False
+
+debug_monitor.register_metrics('relatedness_cache', relatedness.cache_stats)
+debug_monitor.register_metrics('lexicon', lexicon_manager.stats)
+debug_monitor.register_metrics('sessions', session_registry.stats)
+debug_monitor.register_metrics('db_executor', db_executor.stats)
+debug_monitor.register_metrics('write_behind', write_behind.stats)
+debug_monitor.register_metrics('turn_timers', turn_timers.stats)
+debug_monitor.register_metrics('room_codes', room_code_allocator.stats)
+debug_monitor.register_metrics('spectators', spectator_hub.stats)
+debug_monitor.register_metrics('wire', wire_registry.stats)
+
+def binary_channel(room_code):
+    return f"{room_code}:bin"
+
+def player_channel(room_code):
+    """Socket.IO room the requesting player joins; binary clients get their own"""
+    return binary_channel(room_code) if wire_registry.is_binary(request.sid) else room_code
+
+def encode_binary(payload):
+    return wire_format.encode(payload, wire_format.word_table(lexicon_manager.current()))
+
+def reply(event, payload):
+    """Send to the requesting client in the wire format it negotiated"""
+    emit(event, encode_binary(payload) if wire_registry.is_binary(request.sid) else payload)
+
+def broadcast(event, payload, room_code, skip_sid=None):
+    """Send to every player in a room, encoding the payload once per wire format"""
+    socketio.emit(event, payload, to=room_code, skip_sid=skip_sid)
+    # Always emit: with a message queue the binary members may sit on another worker
+    socketio.emit(event, encode_binary(payload), to=binary_channel(room_code), skip_sid=skip_sid)
 
-@monitor_execution
 def generate_room_code():
-    """Generate a unique 6-character room code"""
-    while True:
-        code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-        if code not in active_rooms:
-            return code
+    """Issue a unique 6-character room code (see room_codes.py)"""
+    global _room_codes_seeded
+    if not _room_codes_seeded:
+        _room_codes_seeded = True
+        # A shared store may hold rooms from before this process started
+        if rooms.name != 'memory':
+            for code in rooms.codes():
+                room_code_allocator.reserve(code)
+    return room_code_allocator.allocate()
 
 @monitor_execution
 def are_words_related(word1, word2):
     """Check if two words are related"""
-    word1, word2 = word1.lower(), word2.lower()
-    # Get categories for both words
-    cat1 = get_word_category(word1)
-    cat2 = get_word_category(word2)
-    # Words are related if they share a category
-    return cat1 is not None and cat2 is not None and cat1 == cat2
+    return lexicon_manager.current().are_related(word1, word2)
+
+def get_association_strength(word1, word2, snapshot=None):
+    """Return how strongly two words are associated (0.0 if unrelated)"""
+    snapshot = snapshot or lexicon_manager.current()
+    return round(snapshot.score(word1, word2), 3)
+
+def suggest_correction(current_word, word):
+    """Suggest a known word close to a misspelled submission, favouring related ones"""
+    return lexicon_manager.current().suggest_correction(current_word, word)
 
 @monitor_execution
 def get_word_category(word):
     """Find which category a word belongs to"""
-    word = word.lower()
-    for category, content in WORD_CATEGORIES.items():
-        if word in content['words'] or word in content['common_words']:
-            return category
-    return None
+    return lexicon_manager.current().lexicon.get_primary_category(word)
+
+def get_word_categories(word):
+    """Find every category a word belongs to"""
+    return lexicon_manager.current().get_categories(word)
+
+# Blocking database work; handlers run these through db_executor
+
+def create_game_record(room_code, host_name):
+    """Insert the Game and host Player rows; returns (game_id, host_id)"""
+    game = Game(
+        is_multiplayer=True,
+        room_code=room_code,
+        difficulty='medium'
+    )
+    db.session.add(game)
+    db.session.flush()
+    host = Player(
+        game_id=game.id,
+        name=host_name,
+        is_host=True
+    )
+    db.session.add(host)
+    db.session.commit()
+    return game.id, host.id
+
+def delete_game_record(game_id):
+    """Remove a Game row and its players, e.g. when its room could not be stored"""
+    Player.query.filter_by(game_id=game_id).delete()
+    Game.query.filter_by(id=game_id).delete()
+    db.session.commit()
+
+def create_player_record(game_id, name):
+    """Insert a Player row and return its id"""
+    player = Player(
+        game_id=game_id,
+        name=name
+    )
+    db.session.add(player)
+    db.session.commit()
+    return player.id
+
+def delete_player_record(player_id):
+    """Remove a Player row, e.g. when its room closed before the player got in"""
+    Player.query.filter_by(id=player_id).delete()
+    db.session.commit()
 
 @socketio.on('connect')
-def handle_connect():
-    """Handle client connection"""
+def handle_connect(auth=None):
+    """Handle client connection; clients may ask for the binary wire format in `auth`"""
     logger.info(f"Client connected: {request.sid}")
     debug_monitor.log_connection(connected=True)
-    emit('connect_response', {'message': 'Connected successfully'})
+    wire = wire_format.negotiate(auth)
+    wire_registry.set(request.sid, wire)
+    response = {'message': 'Connected successfully', 'wire': wire}
+    if wire == wire_format.WIRE_BINARY:
+        table = wire_format.word_table(lexicon_manager.current())
+        response['lexicon_version'] = table.version
+        if auth.get('lexicon_version') != table.version:
+            # Sent once; clients cache it per lexicon version
+            response['words'] = table.words
+    emit('connect_response', response)
+
+@socketio.on('request_word_table')
+def on_request_word_table(data=None):
+    """Send the word ids for a lexicon version, e.g. after a reload"""
+    version = (data or {}).get('lexicon_version')
+    table = wire_format.cached_table(version) or wire_format.word_table(lexicon_manager.current())
+    emit('word_table', {'lexicon_version': table.version, 'words': table.words})
 
 @socketio.on('create_room')
 @monitor_execution
@@ -59,66 +212,47 @@ def on_create_room(data):
         player_name = data.get('player_name')
         if not player_name:
             logger.warning("Player name missing")
-            emit('error', {'message': 'Player name is required'})
+            reply('error', {'message': 'Player name is required'})
             return
 
-        room_code = generate_room_code()
-        logger.info(f"Generated room code: {room_code}")
-
-        game = Game(
-            is_multiplayer=True,
-            room_code=room_code,
-            difficulty='medium'
-        )
-        db.session.add(game)
-        db.session.commit()
-        logger.info(f"Created game with ID: {game.id}")
-
-        host = Player(
-            game_id=game.id,
-            name=player_name,
-            is_host=True
-        )
-        db.session.add(host)
-        db.session.commit()
-        logger.info(f"Created host player with ID: {host.id}")
-
-        random_category = random.choice(list(WORD_CATEGORIES.keys()))
-        start_word = random.choice(WORD_CATEGORIES[random_category]['words'])
+        categories = lexicon_manager.current().categories
+        random_category = random.choice(list(categories.keys()))
+        start_word = random.choice(categories[random_category]['words'])
         logger.info(f"Selected start word: {start_word} from category: {random_category}")
 
-        room_state = {
-            'game_id': game.id,
-            'players': [{
-                'id': host.id,
-                'name': host.name,
-                'score': 0,
-                'streak': 0,
-                'is_host': True
-            }],
-            'current_word': start_word,
-            'used_words': set([start_word]),
-            'turn_index': 0,
-            'round_time': 30,
-            'last_update': datetime.utcnow().timestamp(),
-            'is_paused': False
-        }
-        active_rooms[room_code] = room_state
-        debug_monitor.update_room_state(room_code, room_state)
+        for _ in range(ROOM_CODE_ATTEMPTS):
+            room_code = generate_room_code()
+            # Another worker or an earlier run may hold the code in a shared store
+            if room_code in rooms:
+                logger.warning(f"Room code {room_code} is already in use; issuing another")
+                continue
+            game_id, host_id = db_executor.run(create_game_record, room_code, player_name)
+            room = Room(room_code, game_id, start_word, round_time=30,
+                        players=[PlayerState(host_id, player_name, is_host=True)])
+            if rooms.add(room):
+                break
+            # Taken between the check and the add; don't leave the game row behind
+            logger.warning(f"Room code {room_code} was taken concurrently; issuing another")
+            db_executor.run(delete_game_record, game_id)
+        else:
+            raise RuntimeError("Could not find a free room code")
+        logger.info(f"Created game {game_id} with host player {host_id} in room {room_code}")
+        debug_monitor.update_room_state(room_code, room)
 
-        join_room(room_code)
+        join_room(player_channel(room_code))
+        release_previous_seat(session_registry.bind(request.sid, room_code, host_id))
         response_data = {
             'room_code': room_code,
-            'player_id': host.id,
-            'game_state': {**room_state, 'used_words': list(room_state['used_words'])}
+            'player_id': host_id,
+            'game_state': room.to_dict()
         }
         logger.info(f"Emitting room_created event with data: {response_data}")
-        emit('room_created', response_data)
+        reply('room_created', response_data)
 
     except Exception as e:
         logger.error(f"Error creating room: {str(e)}", exc_info=True)
         debug_monitor.log_error(e, {'event': 'create_room', 'data': data})
-        emit('error', {'message': f'Error creating room: {str(e)}'})
+        reply('error', {'message': f'Error creating room: {str(e)}'})
 
 @socketio.on('toggle_pause')
 @monitor_execution
@@ -130,36 +264,40 @@ def on_toggle_pause(data):
         is_paused = data.get('is_paused', False)
 
         if not room_code or not player_id:
-            emit('error', {'message': 'Invalid request'})
-            return
-
-        if room_code not in active_rooms:
-            emit('error', {'message': 'Room not found'})
+            reply('error', {'message': 'Invalid request'})
             return
 
-        room = active_rooms[room_code]
-        player = next((p for p in room['players'] if p['id'] == player_id), None)
-
-        if not player or not player.get('is_host', False):
-            emit('error', {'message': 'Only the host can pause/resume the game'})
-            return
-
-        room['is_paused'] = is_paused
-        if not is_paused:
-            room['last_update'] = datetime.utcnow().timestamp()
-
-        room_state = {**room, 'used_words': list(room['used_words'])}
-        debug_monitor.update_room_state(room_code, room_state)
-        emit('game_paused', {
-            'game_state': room_state,
-            'is_paused': is_paused,
-            'player_name': player['name']
-        }, to=room_code)
+        with rooms.transaction(room_code) as room:
+            if room is None:
+                reply('error', {'message': 'Room not found'})
+                return
+
+            player = room.get_player(player_id)
+            if not player or not player.is_host:
+                reply('error', {'message': 'Only the host can pause/resume the game'})
+                return
+
+            room.set_paused(is_paused)
+            if is_paused:
+                turn_timers.cancel(room_code)
+            elif room.turn_deadline is not None:
+                # The clock resumes with the time that was left when it stopped
+                schedule_turn_timeout(room_code, room.turn_deadline)
+            else:
+                start_turn(room)
+            debug_monitor.update_room_state(room_code, room)
+            broadcast('game_paused', room.delta(
+                is_paused=is_paused,
+                last_update=room.last_update,
+                turn_deadline=room.turn_deadline,
+                turn_remaining=room.turn_remaining,
+                player_name=player.name
+            ), room_code)
 
     except Exception as e:
         logger.error(f"Error toggling pause: {str(e)}")
         debug_monitor.log_error(e, {'event': 'toggle_pause', 'data': data})
-        emit('error', {'message': f'Error toggling pause: {str(e)}'})
+        reply('error', {'message': f'Error toggling pause: {str(e)}'})
 
 @socketio.on('join_room')
 @monitor_execution
@@ -170,45 +308,88 @@ def on_join_room(data):
         player_name = data.get('player_name')
 
         if not room_code or not player_name:
-            emit('error', {'message': 'Room code and player name are required'})
+            reply('error', {'message': 'Room code and player name are required'})
             return
 
-        if room_code not in active_rooms:
-            emit('error', {'message': 'Room not found'})
+        room = rooms.get(room_code)
+        if room is None:
+            reply('error', {'message': 'Room not found'})
             return
 
-        room = active_rooms[room_code]
-        game_id = room['game_id']
-
-        player = Player(
-            game_id=game_id,
-            name=player_name
-        )
-        db.session.add(player)
-        db.session.commit()
-
-        player_data = {
-            'id': player.id,
-            'name': player_name,
-            'score': 0,
-            'streak': 0,
-            'is_host': False
-        }
-        room['players'].append(player_data)
-        debug_monitor.update_room_state(room_code, room)
-
-        join_room(room_code)
-
-        room_state = {**room, 'used_words': list(room['used_words'])}
-        emit('player_joined', {
-            'room_code': room_code,
-            'player': player_data,
-            'game_state': room_state
-        }, to=room_code)
+        player_db_id = db_executor.run(create_player_record, room.game_id, player_name)
+
+        with rooms.transaction(room_code) as room:
+            if room is None:
+                # Closed after the Player row was written; don't leave the row behind
+                db_executor.run(delete_player_record, player_db_id)
+                reply('error', {'message': 'Room not found'})
+                return
+
+            player_state = PlayerState(player_db_id, player_name)
+            room.add_player(player_state)
+            if room.turn_deadline is None and not room.is_paused:
+                # The clock starts once there is someone to pass the turn to
+                start_turn(room)
+            debug_monitor.update_room_state(room_code, room)
+
+            join_room(player_channel(room_code))
+            previous_seat = session_registry.bind(request.sid, room_code, player_state.id)
+
+            # Everyone else applies the delta; the newcomer starts from a full snapshot
+            delta = room.delta(room_code=room_code, player=player_state.to_dict(),
+                               turn_deadline=room.turn_deadline)
+            reply('room_snapshot', {
+                'room_code': room_code,
+                'player_id': player_state.id,
+                'game_state': room.to_dict()
+            })
+            broadcast('player_joined', delta, room_code, skip_sid=request.sid)
+        release_previous_seat(previous_seat)
 
     except Exception as e:
         debug_monitor.log_error(e, {'event': 'join_room', 'data': data})
-        emit('error', {'message': f'Error joining room: {str(e)}'})
+        reply('error', {'message': f'Error joining room: {str(e)}'})
+
+@socketio.on('request_snapshot')
+def on_request_snapshot(data):
+    """Send the full room state to a client that missed a delta"""
+    room_code = (data or {}).get('room_code', '').upper()
+    # A consistent read, so the snapshot is never caught mid-update
+    with rooms.read(room_code) as room:
+        if room is None:
+            reply('error', {'message': 'Room not found'})
+            return
+        reply('room_snapshot', {
+            'room_code': room_code,
+            'game_state': room.to_dict()
+        })
+
+@socketio.on('spectate_room')
+def on_spectate_room(data):
+    """Watch a room without taking a seat; updates arrive as spectator_frame JSON text"""
+    room_code = (data or {}).get('room_code', '').upper()
+    with rooms.read(room_code) as room:
+        if room is None:
+            reply('error', {'message': 'Room not found'})
+            return
+        spectator_hub.watch(request.sid, room_code, room.seq)
+        reply('room_snapshot', {
+            'room_code': room_code,
+            'spectating': True,
+            'game_state': room.to_dict()
+        })
+    ensure_spectator_pump_started()
+
+@socketio.on('stop_spectating')
+def on_stop_spectating(data=None):
+    """Stop receiving spectator frames"""
+    spectator_hub.unwatch(request.sid)
+
+def ensure_spectator_pump_started():
+    global _spectator_pump_started
+    if not _spectator_pump_started:
+        _spectator_pump_started = True
+        socketio.start_background_task(spectator_hub.run, socketio.sleep)
 
 @socketio.on('submit_word')
 @monitor_execution
@@ -217,125 +398,256 @@ def on_submit_word(data):
     try:
         room_code = data.get('room_code')
         player_id = data.get('player_id')
-        word = data.get('word', '').lower().strip()
+        # Use one lexicon version for the whole submission, even if a reload lands meanwhile
+        snapshot = lexicon_manager.current()
+        # Inflected forms count as their lemma, so 'trees' dedupes against 'tree'
+        word = snapshot.lemmatize(data.get('word', ''))
 
         if not all([room_code, player_id, word]):
-            emit('error', {'message': 'Invalid submission'})
-            return
-
-        if room_code not in active_rooms:
-            emit('error', {'message': 'Room not found'})
+            reply('error', {'message': 'Invalid submission'})
             return
 
-        room = active_rooms[room_code]
+        with rooms.transaction(room_code) as room:
+            if room is None:
+                reply('error', {'message': 'Room not found'})
+                return
+
+            if room.is_paused:
+                reply('error', {'message': 'Game is paused'})
+                return
+
+            current_word = room.current_word.lower()
+
+            # Find player in room
+            player = room.get_player(player_id)
+            if not player:
+                reply('error', {'message': 'Player not found'})
+                return
+
+            # Check if it's the player's turn
+            if room.current_player is not player:
+                reply('error', {'message': "It's not your turn!"})
+                return
+
+            # Check if word was already used
+            if word in room.used_words:
+                broadcast('word_rejected', {
+                    'message': 'Word already used',
+                    'seq': room.seq
+                }, room_code)
+                return
+
+            # Validate word association
+            corrected_from = None
+            if not snapshot.are_related(current_word, word):
+                suggestion = snapshot.suggest_correction(current_word, word)
+                if (suggestion and suggestion not in room.used_words
+                        and snapshot.are_related(current_word, suggestion)):
+                    # Auto-correct typos that are one edit away from a related word
+                    corrected_from, word = word, suggestion
+                else:
+                    message = f'"{word}" is not related to "{current_word}"'
+                    if suggestion:
+                        message += f'. Did you mean "{suggestion}"?'
+                    broadcast('word_rejected', {
+                        'message': message,
+                        'suggestion': suggestion,
+                        'seq': room.seq
+                    }, room_code)
+                    return
 
-        if room['is_paused']:
-            emit('error', {'message': 'Game is paused'})
-            return
+            # Update player stats
+            bonus_points = min(player.streak, 4)
+            points = 1 + bonus_points
+            player.record_word(points)
+
+            # Update game state
+            room.play_word(word)
+            room.advance_turn()
+            start_turn(room)
+            debug_monitor.update_room_state(room_code, room)
+
+            next_player = room.current_player
+            # Stamped under the lock so the rows keep move order however they are enqueued
+            game_id, score, streak, played_at = room.game_id, player.score, player.streak, datetime.utcnow()
+
+            broadcast('word_accepted', room.delta(
+                word=word,
+                corrected_from=corrected_from,
+                points=points,
+                bonus_points=bonus_points,
+                strength=get_association_strength(current_word, word, snapshot),
+                player=player.to_dict(),
+                turn_index=room.turn_index,
+                turn_deadline=room.turn_deadline,
+                last_update=room.last_update,
+                next_player=next_player.name
+            ), room_code)
+
+        # Queued for a batched write after the room lock is released: a full queue blocks
+        # word_chains.player_id references users.id; room players are rows in
+        # players, so the move is recorded without an owner
+        write_behind.record_word_chain(game_id, word, current_word, points, None, played_at)
+        write_behind.record_player_stats(player_id, score, streak, played_at)
 
-        current_word = room['current_word'].lower()
+    except Exception as e:
+        debug_monitor.log_error(e, {'event': 'submit_word', 'data': data})
+        reply('error', {'message': f'Error submitting word: {str(e)}'})
 
-        # Find player in room
-        player = next((p for p in room['players'] if p['id'] == player_id), None)
-        if not player:
-            emit('error', {'message': 'Player not found'})
+def remove_player_from_room(room_code, player_id):
+    """Take a player out of a room, closing the room once it is empty"""
+    with rooms.transaction(room_code) as room:
+        if room is None:
             return
-
-        # Check if it's the player's turn
-        current_player = room['players'][room['turn_index']]
-        if current_player['id'] != player_id:
-            emit('error', {'message': "It's not your turn!"})
+        had_turn = room.current_player is room.get_player(player_id)
+        player = room.remove_player(player_id)
+        if player is None:
             return
-
-        # Check if word was already used
-        if word in room['used_words']:
-            emit('word_rejected', {
-                'message': 'Word already used',
-                'game_state': {**room, 'used_words': list(room['used_words'])}
-            }, to=room_code)
+        closed = not room.players
+        if closed:
+            # Decided and deleted under the same transaction, so a concurrent join
+            # either lands first (and keeps the room) or finds it gone
+            rooms.delete(room_code)
+            turn_timers.cancel(room_code)
+        else:
+            if had_turn or len(room) < 2:
+                start_turn(room)
+            debug_monitor.update_room_state(room_code, room)
+            broadcast('player_left', room.delta(
+                player=player.to_dict(),
+                turn_index=room.turn_index,
+                turn_deadline=room.turn_deadline
+            ), room_code)
+    if closed:
+        spectator_hub.end(room_code)
+        room_code_allocator.release(room_code)
+        debug_monitor.remove_room(room_code)
+        logger.info(f"Closed empty room {room_code}")
+
+def release_previous_seat(seat):
+    """A socket that took a new seat leaves its old one, as if it had disconnected from it"""
+    if seat is None:
+        return
+    leave_room(player_channel(seat.room_code))
+    remove_player_from_room(seat.room_code, seat.player_id)
+
+def start_turn(room):
+    """Start the clock on the current player's turn; it only runs with two or more players"""
+    if len(room) < 2 or room.is_paused:
+        turn_timers.cancel(room.code)
+        room.set_turn_deadline(None)
+        return
+    deadline = time.time() + room.round_time
+    room.set_turn_deadline(deadline)
+    schedule_turn_timeout(room.code, deadline)
+
+def schedule_turn_timeout(room_code, deadline):
+    """Fire on_turn_timeout at `deadline`, replacing the room's previous timer"""
+    global _turn_driver_started
+    turn_timers.schedule(room_code, max(0.0, deadline - time.time()),
+                         lambda: on_turn_timeout(room_code, deadline))
+    if not _turn_driver_started:
+        _turn_driver_started = True
+        socketio.start_background_task(turn_timers.run, socketio.sleep)
+
+def on_turn_timeout(room_code, deadline):
+    """The current player ran out of time: reset their streak and pass the turn"""
+    with rooms.transaction(room_code) as room:
+        # A move, pause or departure since scheduling replaces the deadline
+        if room is None or room.is_paused or room.turn_deadline != deadline:
             return
-
-        # Validate word association
-        if not are_words_related(current_word, word):
-            emit('word_rejected', {
-                'message': f'"{word}" is not related to "{current_word}"',
-                'game_state': {**room, 'used_words': list(room['used_words'])}
-            }, to=room_code)
-            return
-
-        # Update player stats
-        player['streak'] += 1
-        bonus_points = min(player['streak'] - 1, 4)
-        points = 1 + bonus_points
-        player['score'] += points
-
-        # Update game state
-        room['used_words'].add(word)
-        room['current_word'] = word
-        room['last_update'] = datetime.utcnow().timestamp()
-        room['turn_index'] = (room['turn_index'] + 1) % len(room['players'])
+        player = room.current_player
+        player.reset_streak()
+        room.advance_turn()
+        start_turn(room)
+        stats = (player.id, player.score, player.streak, datetime.utcnow())
         debug_monitor.update_room_state(room_code, room)
+        broadcast('turn_timeout', room.delta(
+            player=player.to_dict(),
+            turn_index=room.turn_index,
+            turn_deadline=room.turn_deadline,
+            next_player=room.current_player.name
+        ), room_code)
+    write_behind.record_player_stats(*stats)
+
+def reap_disconnected_players():
+    """Background task removing players whose reconnect grace period ran out"""
+    while True:
+        socketio.sleep(REAPER_INTERVAL)
+        for seat in session_registry.expired():
+            try:
+                remove_player_from_room(seat.room_code, seat.player_id)
+            except Exception as e:
+                logger.error(f"Error removing disconnected player: {str(e)}")
+
+def ensure_reaper_started():
+    global _reaper_started
+    if not _reaper_started:
+        _reaper_started = True
+        socketio.start_background_task(reap_disconnected_players)
+
+@socketio.on('rejoin_room')
+@monitor_execution
+def on_rejoin_room(data):
+    """Reattach a reconnecting player to their seat before the grace period ends"""
+    try:
+        room_code = data.get('room_code', '').upper()
+        player_id = data.get('player_id')
 
-        # Save to database
-        word_chain = WordChain(
-            game_id=room['game_id'],
-            word=word,
-            previous_word=current_word,
-            points=points,
-            player_id=player_id,
-            timestamp=datetime.utcnow()
-        )
-        db.session.add(word_chain)
-
-        # Update player in database
-        db_player = Player.query.get(player_id)
-        if db_player:
-            db_player.score = player['score']
-            db_player.streak = player['streak']
-            db_player.last_active = datetime.utcnow()
-
-        db.session.commit()
-
-        next_player = room['players'][room['turn_index']]
-        room_state = {**room, 'used_words': list(room['used_words'])}
-
-        emit('word_accepted', {
-            'word': word,
-            'points': points,
-            'bonus_points': bonus_points,
-            'player': player,
-            'game_state': room_state,
-            'next_player': next_player['name']
-        }, to=room_code)
-
+        with rooms.transaction(room_code) as room:
+            if room is None or room.get_player(player_id) is None:
+                reply('error', {'message': 'Seat no longer available'})
+                return
+
+            previous_seat = session_registry.bind(request.sid, room_code, player_id)
+            join_room(player_channel(room_code))
+            reply('room_snapshot', {
+                'room_code': room_code,
+                'player_id': player_id,
+                'game_state': room.to_dict()
+            })
+        release_previous_seat(previous_seat)
     except Exception as e:
-        debug_monitor.log_error(e, {'event': 'submit_word', 'data': data})
-        emit('error', {'message': f'Error submitting word: {str(e)}'})
+        debug_monitor.log_error(e, {'event': 'rejoin_room', 'data': data})
+        reply('error', {'message': f'Error rejoining room: {str(e)}'})
 
 @socketio.on('disconnect')
 @monitor_execution
-def on_disconnect():
+def on_disconnect(reason=None):
     """Handle player disconnection"""
     try:
-        for room_code, room in active_rooms.items():
-            for player in room['players']:
-                if player['id'] == request.sid:
-                    room['players'].remove(player)
-                    leave_room(room_code)
-
-                    if room['players']:
-                        # Update turn index if necessary
-                        if room['turn_index'] >= len(room['players']):
-                            room['turn_index'] = 0
-                        room_state = {**room, 'used_words': list(room['used_words'])}
-                        debug_monitor.update_room_state(room_code, room_state)
-                        emit('player_left', {
-                            'player': player,
-                            'game_state': room_state
-                        }, to=room_code)
-                    else:
-                        del active_rooms[room_code]
-                    return
+        debug_monitor.log_connection(connected=False)
+        spectator_hub.unwatch(request.sid)
+        wire_registry.discard(request.sid)
+        # O(1): the registry knows which seat this socket held
+        seat = session_registry.disconnect(request.sid)
+        if seat is not None:
+            remove_player_from_room(seat.room_code, seat.player_id)
+        elif session_registry.grace_seconds > 0:
+            ensure_reaper_started()
     except Exception as e:
         debug_monitor.log_error(e, {'event': 'disconnect'})
-        print(f"Error handling disconnect: {str(e)}")
\ No newline at end of file
+        print(f"Error handling disconnect: {str(e)}")
+
+def restore_rooms():
+    """Bring back the rooms saved before a restart and start snapshotting"""
+    restored = room_snapshots.restore()
+    for room in restored:
+        room_code_allocator.reserve(room.code)
+        debug_monitor.update_room_state(room.code, room)
+        # Players have the usual grace period to rejoin their seats
+        for player in room.players:
+            session_registry.park(room.code, player.id)
+        with rooms.transaction(room.code) as restored_room:
+            if restored_room.turn_deadline is not None:
+                # The old deadline ran out while the server was down; start the turn afresh
+                start_turn(restored_room)
+                # A new seq so the next snapshot records the new deadline
+                restored_room.delta()
+    if restored:
+        ensure_reaper_started()
+    debug_monitor.register_metrics('room_snapshots', room_snapshots.stats)
+    socketio.start_background_task(room_snapshots.run, socketio.sleep)
+
+if room_snapshots is not None:
+    restore_rooms()
@@ -0,0 +1,160 @@
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Tuple
+
+from lexicon import lexicon, normalize_word
+from relatedness_cache import LRUCache, DEFAULT_CACHE_SIZE
+from word_graph import word_graph, CATEGORY_WEIGHT, OPPOSITE_WEIGHT
+
+logger = logging.getLogger(__name__)
+
+
+class RelatednessBackend:
+    """Interface every relatedness backend implements"""
+
+    name = 'base'
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        raise NotImplementedError
+
+    def score(self, word1: str, word2: str) -> float:
+        raise NotImplementedError
+
+    def score_many(self, word: str, candidates: Iterable[str]) -> List[float]:
+        """Score one word against many candidates"""
+        return [self.score(word, candidate) for candidate in candidates]
+
+    def related_many(self, word: str, candidates: Iterable[str]) -> List[bool]:
+        """Check one word against many candidates"""
+        return [self.are_related(word, candidate) for candidate in candidates]
+
+
+class CategoryBackend(RelatednessBackend):
+    """Shared categories from the lexicon plus edges from the association graph
+
+    A compiled lexicon also answers opposites from its mapped pairs, so with one
+    configured the graph is only needed for imported associations.
+    """
+
+    name = 'category'
+
+    def __init__(self, lexicon=lexicon, graph=word_graph):
+        self.lexicon = lexicon
+        self.graph = graph
+        self._opposites = getattr(lexicon, 'are_opposites', None)
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        if self.lexicon.are_related(word1, word2):
+            return True
+        if self._opposites is not None and self._opposites(word1, word2):
+            return True
+        return self.graph.are_related(word1, word2)
+
+    def score(self, word1: str, word2: str) -> float:
+        strength = self.graph.strength(word1, word2)
+        if not strength:
+            # The graph skips very large categories; fall back to the lexicon's own answers
+            if self._opposites is not None and self._opposites(word1, word2):
+                strength = OPPOSITE_WEIGHT
+            elif self.lexicon.are_related(word1, word2):
+                strength = CATEGORY_WEIGHT
+        return strength
+
+
+class CachedBackend(RelatednessBackend):
+    """Memoizes (related, score) verdicts of another backend per unordered word pair"""
+
+    def __init__(self, backend: RelatednessBackend, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.backend = backend
+        self.name = f"cached-{backend.name}"
+        self.cache = LRUCache(maxsize)
+
+    @staticmethod
+    def _key(word1: str, word2: str) -> Tuple[str, str]:
+        word1, word2 = normalize_word(word1), normalize_word(word2)
+        return (word1, word2) if word1 <= word2 else (word2, word1)
+
+    def verdict(self, word1: str, word2: str) -> Tuple[bool, float]:
+        key = self._key(word1, word2)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = (self.backend.are_related(*key), self.backend.score(*key))
+            self.cache.put(key, cached)
+        return cached
+
+    def are_related(self, word1: str, word2: str) -> bool:
+        return self.verdict(word1, word2)[0]
+
+    def score(self, word1: str, word2: str) -> float:
+        return self.verdict(word1, word2)[1]
+
+    def score_many(self, word, candidates):
+        # Batch calls are usually one-off sweeps; skip the cache so they don't evict hot pairs
+        return self.backend.score_many(word, candidates)
+
+    def related_many(self, word, candidates):
+        return self.backend.related_many(word, candidates)
+
+    def invalidate(self) -> None:
+        """Drop every cached verdict, e.g. after the lexicon is reloaded"""
+        self.cache.clear()
+        logger.info("Relatedness cache invalidated")
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+def create_backend(lexicon=lexicon, graph=word_graph) -> RelatednessBackend:
+    """Create the backend selected by WORDWEAVER_RELATEDNESS (default: category)
+
+    The backend is wrapped in an LRU verdict cache unless
+    WORDWEAVER_RELATEDNESS_CACHE_SIZE is 0.
+    """
+    kind = os.environ.get('WORDWEAVER_RELATEDNESS', 'category')
+    if kind == 'embedding':
+        from embeddings import EmbeddingBackend
+        path = os.environ['WORDWEAVER_VECTORS_PATH']
+        threshold = float(os.environ.get('WORDWEAVER_SIMILARITY_THRESHOLD', 0.5))
+        created = EmbeddingBackend.from_file(path, threshold=threshold,
+                                             fallback=CategoryBackend(lexicon, graph))
+    else:
+        if kind != 'category':
+            logger.warning(f"Unknown relatedness backend {kind}, using category backend")
+        created = CategoryBackend(lexicon, graph)
+
+    cache_size = int(os.environ.get('WORDWEAVER_RELATEDNESS_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+    if cache_size > 0:
+        created = CachedBackend(created, cache_size)
+    return created
+
+
+# Backend for the vocabulary loaded at import time; lexicon_manager owns it from then on
+backend = create_backend()
+
+
+def get_backend() -> RelatednessBackend:
+    """Return the backend of the current lexicon snapshot"""
+    from lexicon_manager import lexicon_manager
+    return lexicon_manager.current().backend
+
+
+def set_backend(new_backend: RelatednessBackend) -> None:
+    """Swap the active backend"""
+    from lexicon_manager import lexicon_manager
+    lexicon_manager.set_backend(new_backend)
+    logger.info(f"Relatedness backend set to {new_backend.name}")
+
+
+def invalidate_cache() -> None:
+    """Drop cached verdicts of the active backend, if it caches"""
+    active = get_backend()
+    if hasattr(active, 'invalidate'):
+        active.invalidate()
+
+
+def cache_stats() -> dict:
+    """Return hit/miss/eviction counters of the active backend's cache"""
+    active = get_backend()
+    if hasattr(active, 'stats'):
+        return active.stats()
+    return {}
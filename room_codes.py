@@ -0,0 +1,154 @@
+"""Room code allocation without retries.
+
+Codes are six characters over A-Z0-9, 36^6 possibilities. A counter is mapped
+onto that space by a keyed Feistel network, a bijection, so distinct counter
+values always give distinct codes yet consecutive rooms get unrelated-looking
+codes. 36^6 = 46656^2, so the network works on two base-46656 halves and
+covers the space exactly.
+
+Workers share the key and take disjoint slices of the counter (worker i of n
+uses i, i + n, i + 2n, ...), so codes never collide across processes. Codes of
+closed rooms are quarantined for a while before being issued again, so a
+stale link never lands in someone else's new game.
+
+Codes already in use when the process starts (restored or shared rooms) are
+passed to `reserve()`. With a stable key they decode to the counter values
+they were issued from, so the counter just moves past them; with a random
+per-process key they say nothing about the counter and are skipped one by
+one instead.
+"""
+import hashlib
+import logging
+import os
+import string
+import time
+from collections import deque
+from threading import Lock
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+ALPHABET = string.ascii_uppercase + string.digits
+CODE_LENGTH = 6
+HALF = len(ALPHABET) ** (CODE_LENGTH // 2)
+CODE_SPACE = HALF * HALF
+ROUNDS = 4
+DEFAULT_QUARANTINE_SECONDS = 3600.0
+_INDEX = {char: value for value, char in enumerate(ALPHABET)}
+
+
+class RoomCodeAllocator:
+    """Issues unique room codes in O(1): recycled ones first, else the next counter value"""
+
+    def __init__(self, key: bytes, worker_id: int = 0, worker_count: int = 1,
+                 quarantine_seconds: float = DEFAULT_QUARANTINE_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, stable_key: bool = True):
+        if not 0 <= worker_id < worker_count:
+            raise ValueError(f"worker_id {worker_id} is outside 0..{worker_count - 1}")
+        self._round_keys = [hashlib.sha256(key + bytes([index])).digest()[:16] for index in range(ROUNDS)]
+        self.worker_id = worker_id
+        self.worker_count = worker_count
+        self.quarantine_seconds = quarantine_seconds
+        self.clock = clock
+        self.stable_key = stable_key
+        self._next = worker_id
+        # Counter values ahead of _next whose codes are already in use
+        self._reserved = set()
+        self._quarantine = deque()
+        self._lock = Lock()
+        self.issued = 0
+        self.recycled = 0
+
+    def _round(self, index: int, value: int) -> int:
+        digest = hashlib.blake2b(value.to_bytes(4, 'little'), key=self._round_keys[index], digest_size=8).digest()
+        return int.from_bytes(digest, 'little') % HALF
+
+    def permute(self, number: int) -> int:
+        left, right = divmod(number, HALF)
+        for index in range(ROUNDS):
+            left, right = right, (left + self._round(index, right)) % HALF
+        return left * HALF + right
+
+    def unpermute(self, number: int) -> int:
+        left, right = divmod(number, HALF)
+        for index in reversed(range(ROUNDS)):
+            left, right = (right - self._round(index, left)) % HALF, left
+        return left * HALF + right
+
+    def encode(self, counter: int) -> str:
+        value = self.permute(counter)
+        chars = []
+        for _ in range(CODE_LENGTH):
+            value, digit = divmod(value, len(ALPHABET))
+            chars.append(ALPHABET[digit])
+        return ''.join(reversed(chars))
+
+    def decode(self, code: str) -> int:
+        """Counter value a code was issued from"""
+        value = 0
+        for char in code.upper():
+            value = value * len(ALPHABET) + _INDEX[char]
+        return self.unpermute(value)
+
+    def allocate(self) -> str:
+        with self._lock:
+            if self._quarantine and self._quarantine[0][0] <= self.clock():
+                self.recycled += 1
+                return self._quarantine.popleft()[1]
+            while True:
+                counter = self._next
+                if counter >= CODE_SPACE:
+                    raise RuntimeError("Room code space exhausted")
+                self._next += self.worker_count
+                if counter not in self._reserved:
+                    break
+                self._reserved.discard(counter)
+            self.issued += 1
+        return self.encode(counter)
+
+    def release(self, code: str) -> None:
+        """Return a closed room's code; it is issued again after the quarantine period"""
+        with self._lock:
+            # Every code waits the same time, so the queue stays in release order
+            self._quarantine.append((self.clock() + self.quarantine_seconds, code))
+
+    def reserve(self, code: str) -> None:
+        """Mark an existing code (e.g. a restored room) as used so it is not issued again"""
+        counter = self.decode(code)
+        with self._lock:
+            if counter % self.worker_count != self.worker_id or counter < self._next:
+                return
+            if self.stable_key:
+                # Codes before it were issued by earlier runs too
+                self._next = counter + self.worker_count
+                self._reserved = {reserved for reserved in self._reserved if reserved >= self._next}
+            else:
+                self._reserved.add(counter)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'issued': self.issued,
+            'recycled': self.recycled,
+            'quarantined': len(self._quarantine),
+            'reserved': len(self._reserved),
+            'worker': f"{self.worker_id}/{self.worker_count}",
+        }
+
+
+def load_allocator() -> RoomCodeAllocator:
+    """Allocator configured from WORDWEAVER_ROOM_CODE_KEY / _WORKER_ID / _WORKER_COUNT"""
+    worker_id = int(os.environ.get('WORDWEAVER_WORKER_ID', 0))
+    worker_count = int(os.environ.get('WORDWEAVER_WORKER_COUNT', 1))
+    key = os.environ.get('WORDWEAVER_ROOM_CODE_KEY')
+    if key is None:
+        if worker_count > 1:
+            logger.warning("WORDWEAVER_ROOM_CODE_KEY is not set; workers need a shared key to avoid collisions")
+        key_bytes = os.urandom(16)
+    else:
+        key_bytes = key.encode('utf-8')
+    quarantine = float(os.environ.get('WORDWEAVER_ROOM_CODE_QUARANTINE', DEFAULT_QUARANTINE_SECONDS))
+    return RoomCodeAllocator(key_bytes, worker_id, worker_count, quarantine, stable_key=key is not None)
+
+
+# Create singleton instance
+room_code_allocator = load_allocator()
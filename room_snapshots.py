@@ -0,0 +1,272 @@
+"""Crash recovery for rooms held in this process.
+
+MemoryRoomStore keeps rooms only in memory, so without this a restart ends
+every game. RoomSnapshotter appends each room that changed since its last pass
+to a local log, one line per record:
+
+    CODE<TAB>{"game_id": ...}      the room's state
+    CODE<TAB>-                     the room was closed
+
+Changes are spotted by comparing each room's seq with the last one logged, so
+handlers do no extra work. A room is locked only while it is serialized; the
+file is appended to and fsynced with no room lock held. Once the log holds
+`compact_ratio` times more records than there are live rooms, it is rewritten
+with one record per room and swapped in atomically.
+
+On startup `restore()` replays the log, the last record for a code winning, and
+skips a final line torn by the crash. The SQLite and Redis stores persist rooms
+themselves and do not need this.
+
+Each process holds its own rooms, so each needs its own log: with
+WORDWEAVER_WORKER_COUNT above 1 worker i uses `<path>.<i>`. A log is locked by
+the process using it, and a second process pointed at the same file (e.g.
+workers started without distinct WORDWEAVER_WORKER_IDs) runs without
+snapshots rather than overwriting the first one's.
+"""
+import logging
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; logs are not locked there
+    fcntl = None
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from room_state import Room
+from room_store import RoomStore, deserialize_room, serialize_room
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ENV = 'WORDWEAVER_ROOM_SNAPSHOT'
+DEFAULT_INTERVAL = 1.0
+DEFAULT_COMPACT_RATIO = 4
+MIN_COMPACT_RECORDS = 1000
+TOMBSTONE = '-'
+
+
+def read_log(path: str) -> Dict[str, str]:
+    """Latest serialized state per live room code in a snapshot log"""
+    states: Dict[str, str] = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    logger.warning(f"Skipping torn record at the end of {path}")
+                    break
+                code, _, payload = line[:-1].partition('\t')
+                if payload == TOMBSTONE:
+                    states.pop(code, None)
+                elif payload:
+                    states[code] = payload
+    except FileNotFoundError:
+        pass
+    return states
+
+
+def _call(func, *args):
+    return func(*args)
+
+
+def worker_log_path(path: str, worker_id: int, worker_count: int) -> str:
+    """The log for one worker; a single worker uses `path` itself"""
+    return f"{path}.{worker_id}" if worker_count > 1 else path
+
+
+def lock_log(path: str):
+    """Lock `path` for this process; returns the open lock file, or None if another process holds it"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    lock_file = open(f"{path}.lock", 'a')
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+    return lock_file
+
+
+class RoomSnapshotter:
+    """Periodically appends changed rooms to a log and restores them after a restart
+
+    `run_blocking(func, *args)` runs the file writes; pass an executor under
+    gevent so an fsync never blocks the event loop.
+    """
+
+    def __init__(self, path: str, store: RoomStore, interval: float = DEFAULT_INTERVAL,
+                 compact_ratio: int = DEFAULT_COMPACT_RATIO,
+                 run_blocking: Callable[..., Any] = _call):
+        self.path = path
+        self.store = store
+        self.interval = interval
+        self.compact_ratio = compact_ratio
+        self.run_blocking = run_blocking
+        # Held for the snapshotter's lifetime; see lock_log()
+        self.lock_file = None
+        # Seq of each room as last written to the log
+        self._written: Dict[str, int] = {}
+        self._records = 0
+        self._file = None
+        self._lock = Lock()
+        self._running = False
+        self.snapshots = 0
+        self.compactions = 0
+        self.restored = 0
+        self.restore_seconds = 0.0
+        self.last_snapshot_ms = 0.0
+
+    def restore(self) -> List[Room]:
+        """Add the rooms saved in the log to the store; returns the restored rooms"""
+        start = time.perf_counter()
+        restored = []
+        for code, payload in read_log(self.path).items():
+            try:
+                room = deserialize_room(code, payload)
+            except Exception as e:
+                logger.error(f"Error restoring room {code}: {str(e)}")
+                continue
+            if self.store.add(room):
+                restored.append(room)
+        # Start the new log from exactly what was restored; nothing is serving yet, so write inline
+        self._rewrite([f"{room.code}\t{serialize_room(room)}\n" for room in restored])
+        self._written = {room.code: room.seq for room in restored}
+        self._records = len(restored)
+        self.restored = len(restored)
+        self.restore_seconds = time.perf_counter() - start
+        logger.info(f"Restored {len(restored)} rooms from {self.path} in {self.restore_seconds:.3f}s")
+        return restored
+
+    def _serialize_changed(self, codes: List[str], written: Dict[str, int], seqs: Dict[str, int]) -> List[str]:
+        lines = []
+        for code in codes:
+            room = self.store.get(code)
+            if room is None or room.seq == written.get(code):
+                continue
+            # Hold the room's lock only while it is serialized
+            with self.store.read(code) as room:
+                if room is not None:
+                    seqs[code] = room.seq
+                    lines.append(f"{code}\t{serialize_room(room)}\n")
+        return lines
+
+    def snapshot(self) -> int:
+        """Append every room that changed since the last pass; returns records written"""
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> int:
+        start = time.perf_counter()
+        codes = self.store.codes()
+        seqs: Dict[str, int] = {}
+        lines = self._serialize_changed(codes, self._written, seqs)
+        live = set(codes)
+        closed = [code for code in self._written if code not in live]
+        lines += [f"{code}\t{TOMBSTONE}\n" for code in closed]
+        if lines:
+            self.run_blocking(self._append, lines)
+            self._written.update(seqs)
+            for code in closed:
+                del self._written[code]
+            self._records += len(lines)
+        self.snapshots += 1
+        self.last_snapshot_ms = (time.perf_counter() - start) * 1000
+        if self._records > max(MIN_COMPACT_RECORDS, self.compact_ratio * len(self._written)):
+            self._compact()
+        return len(lines)
+
+    def compact(self) -> None:
+        """Rewrite the log with one record per live room"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        seqs: Dict[str, int] = {}
+        lines = self._serialize_changed(self.store.codes(), {}, seqs)
+        self.run_blocking(self._rewrite, lines)
+        self._written = seqs
+        self._records = len(lines)
+        self.compactions += 1
+
+    def _append(self, lines: List[str]) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.writelines(lines)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _rewrite(self, lines: List[str]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.replace(temp_path, self.path)
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def run(self, sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Snapshot every `interval` seconds until stop() is called"""
+        self._running = True
+        while self._running:
+            sleep(self.interval)
+            try:
+                self.snapshot()
+            except Exception as e:
+                logger.error(f"Error writing room snapshot: {str(e)}")
+
+    def stop(self) -> None:
+        self._running = False
+
+    def close(self) -> None:
+        """Write a final snapshot and close the log"""
+        self.stop()
+        with self._lock:
+            self._snapshot()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.lock_file is not None:
+                self.lock_file.close()
+                self.lock_file = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'rooms': len(self._written),
+            'records': self._records,
+            'snapshots': self.snapshots,
+            'compactions': self.compactions,
+            'last_snapshot_ms': round(self.last_snapshot_ms, 3),
+            'restored': self.restored,
+            'restore_seconds': round(self.restore_seconds, 3),
+        }
+
+
+def create_snapshotter(store: RoomStore, run_blocking: Callable[..., Any] = _call,
+                       path: Optional[str] = None) -> Optional[RoomSnapshotter]:
+    """Snapshotter for `path` or WORDWEAVER_ROOM_SNAPSHOT; None when unset, not needed or in use"""
+    path = path if path is not None else os.environ.get(SNAPSHOT_ENV)
+    if not path:
+        return None
+    if store.name != 'memory':
+        logger.info(f"The {store.name} room store persists rooms itself; not snapshotting")
+        return None
+    path = worker_log_path(path, int(os.environ.get('WORDWEAVER_WORKER_ID', 0)),
+                           int(os.environ.get('WORDWEAVER_WORKER_COUNT', 1)))
+    lock_file = lock_log(path)
+    if lock_file is None:
+        logger.warning(f"Room snapshot log {path} is in use by another process; not snapshotting. "
+                       f"Give each worker its own WORDWEAVER_WORKER_ID and WORDWEAVER_WORKER_COUNT")
+        return None
+    snapshotter = RoomSnapshotter(path, store, run_blocking=run_blocking)
+    snapshotter.lock_file = lock_file
+    return snapshotter
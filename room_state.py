@@ -0,0 +1,166 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class PlayerState:
+    """In-memory state of one player in a multiplayer room"""
+
+    __slots__ = ('id', 'name', 'is_host', 'score', 'streak')
+
+    def __init__(self, player_id: int, name: str, is_host: bool = False, score: int = 0, streak: int = 0):
+        self.id = player_id
+        self.name = name
+        self.is_host = is_host
+        self.score = score
+        self.streak = streak
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PlayerState':
+        return cls(data['id'], data['name'], data.get('is_host', False), data.get('score', 0), data.get('streak', 0))
+
+    def record_word(self, points: int) -> None:
+        self.streak += 1
+        self.score += points
+
+    def reset_streak(self) -> None:
+        self.streak = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'id': self.id, 'name': self.name, 'score': self.score, 'streak': self.streak, 'is_host': self.is_host}
+
+
+class Room:
+    """In-memory state of a multiplayer room with O(1) player lookup
+
+    State lives in slots; `to_dict()` builds the serialized view when a full
+    snapshot is actually needed.
+
+    Broadcasts carry only what changed: `delta()` bumps the room's sequence number
+    and stamps it on the changes, so a client that sees a gap knows to ask for a
+    full snapshot.
+    """
+
+    __slots__ = ('code', 'game_id', 'players', '_players_by_id', 'current_word', 'used_words', 'turn_index',
+                 'round_time', 'last_update', 'is_paused', 'seq', 'turn_deadline', 'turn_remaining')
+
+    def __init__(self, code: str, game_id: int, start_word: str, round_time: int = 30,
+                 players: Iterable[PlayerState] = (), used_words: Optional[Iterable[str]] = None,
+                 turn_index: int = 0, is_paused: bool = False, last_update: Optional[float] = None,
+                 seq: int = 0):
+        self.code = code
+        self.game_id = game_id
+        self.players: List[PlayerState] = []
+        self._players_by_id: Dict[int, PlayerState] = {}
+        self.current_word = start_word
+        # A dict answers membership checks in O(1), keeps play order for the view,
+        # and is far smaller than a set grown one word at a time
+        self.used_words: Dict[str, None] = dict.fromkeys(used_words if used_words is not None else [start_word])
+        self.turn_index = turn_index
+        self.round_time = round_time
+        self.last_update = last_update if last_update is not None else time.time()
+        self.is_paused = is_paused
+        self.seq = seq
+        # Wall-clock time the current turn ends (None until the game has two players)
+        self.turn_deadline: Optional[float] = None
+        # Time left on the turn while the game is paused
+        self.turn_remaining: Optional[float] = None
+        for player in players:
+            self.add_player(player)
+
+    @classmethod
+    def from_dict(cls, code: str, data: Dict[str, Any]) -> 'Room':
+        """Rebuild a room from its serialized view, e.g. one loaded from a shared store"""
+        room = cls(
+            code,
+            data['game_id'],
+            data['current_word'],
+            round_time=data.get('round_time', 30),
+            players=[PlayerState.from_dict(player) for player in data.get('players', ())],
+            used_words=data.get('used_words'),
+            turn_index=data.get('turn_index', 0),
+            is_paused=data.get('is_paused', False),
+            last_update=data.get('last_update'),
+            seq=data.get('seq', 0),
+        )
+        room.turn_deadline = data.get('turn_deadline')
+        room.turn_remaining = data.get('turn_remaining')
+        return room
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def set_turn_deadline(self, deadline: Optional[float]) -> None:
+        self.turn_deadline = deadline
+        self.turn_remaining = None
+
+    def delta(self, **changes) -> Dict[str, Any]:
+        """Advance the sequence number and return `changes` stamped with it"""
+        self.seq += 1
+        changes['seq'] = self.seq
+        return changes
+
+    def get_player(self, player_id) -> Optional[PlayerState]:
+        return self._players_by_id.get(player_id)
+
+    def add_player(self, player: PlayerState) -> None:
+        self.players.append(player)
+        self._players_by_id[player.id] = player
+
+    def remove_player(self, player_id) -> Optional[PlayerState]:
+        """Remove a player, keeping the turn on the same next player where possible"""
+        player = self._players_by_id.pop(player_id, None)
+        if player is None:
+            return None
+        position = self.players.index(player)
+        del self.players[position]
+        turn_index = self.turn_index
+        if position < turn_index:
+            turn_index -= 1
+        if turn_index >= len(self.players):
+            turn_index = 0
+        self.turn_index = turn_index
+        return player
+
+    @property
+    def current_player(self) -> Optional[PlayerState]:
+        return self.players[self.turn_index] if self.players else None
+
+    def advance_turn(self) -> None:
+        self.turn_index = (self.turn_index + 1) % len(self.players) if self.players else 0
+
+    def play_word(self, word: str) -> None:
+        """Record an accepted word as the new current word"""
+        self.used_words[word] = None
+        self.current_word = word
+        self.touch()
+
+    def set_paused(self, is_paused: bool, now: Optional[float] = None) -> None:
+        """Pause or resume; the turn clock stops while paused and picks up where it left off"""
+        now = now if now is not None else time.time()
+        if is_paused and not self.is_paused and self.turn_deadline is not None:
+            self.turn_remaining = max(0.0, self.turn_deadline - now)
+            self.turn_deadline = None
+        elif not is_paused and self.is_paused and self.turn_remaining is not None:
+            self.turn_deadline = now + self.turn_remaining
+            self.turn_remaining = None
+        self.is_paused = is_paused
+        if not is_paused:
+            self.touch(now)
+
+    def touch(self, timestamp: Optional[float] = None) -> None:
+        self.last_update = timestamp if timestamp is not None else time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'game_id': self.game_id,
+            'players': [player.to_dict() for player in self.players],
+            'current_word': self.current_word,
+            'used_words': list(self.used_words),
+            'turn_index': self.turn_index,
+            'round_time': self.round_time,
+            'last_update': self.last_update,
+            'is_paused': self.is_paused,
+            'seq': self.seq,
+            'turn_deadline': self.turn_deadline,
+            'turn_remaining': self.turn_remaining,
+        }
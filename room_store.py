@@ -0,0 +1,391 @@
+"""Where multiplayer rooms live.
+
+Handlers go through `transaction(code)`, which yields the room (or None) and
+saves it back when the block exits cleanly, so the same handler code works
+whether rooms are plain objects in this process or shared between workers.
+Calling `delete(code)` inside the block removes the room as part of the same
+transaction instead of saving it. Handlers that only look at a room use
+`read(code)`, which never takes a backend's write lock.
+
+
+    MemoryRoomStore   rooms are live Room objects in a dict (single process);
+                      the transaction takes the room's striped lock
+    SQLiteRoomStore   rooms are JSON rows in a shared SQLite file; the
+                      transaction takes the database write lock
+    RedisRoomStore    rooms are JSON values in Redis behind a per-room lock
+
+WORDWEAVER_ROOM_STORE selects the backend: unset or `memory`, `sqlite:///path`,
+or a `redis://` URL.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+from room_state import Room
+
+try:
+    import redis
+except ImportError:  # Only needed for the Redis backend
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+ROOM_STORE_ENV = 'WORDWEAVER_ROOM_STORE'
+LOCK_TIMEOUT = 5.0
+LOCK_STRIPES = 1024
+
+
+def serialize_room(room: Room) -> str:
+    return json.dumps(room.to_dict(), separators=(',', ':'))
+
+
+def deserialize_room(code: str, payload) -> Room:
+    return Room.from_dict(code, json.loads(payload))
+
+
+class RoomStore:
+    """Interface shared by the room store backends"""
+
+    name = 'base'
+
+    def __init__(self):
+        # Codes with a transaction open on this thread, and whether it deleted the room
+        self._open = threading.local()
+
+    def _open_transactions(self) -> dict:
+        open_codes = getattr(self._open, 'codes', None)
+        if open_codes is None:
+            open_codes = self._open.codes = {}
+        return open_codes
+
+    def _begin(self, code: str) -> None:
+        self._open_transactions()[code] = False
+
+    def _defer_delete(self, code: str) -> bool:
+        """Inside a transaction on `code`, delete at commit instead; returns whether it deferred"""
+        open_codes = self._open_transactions()
+        if code not in open_codes:
+            return False
+        open_codes[code] = True
+        return True
+
+    def _commit(self, code: str, room: Optional[Room]) -> None:
+        """Delete the room if the block asked to, else save it"""
+        if self._open_transactions().pop(code, False):
+            self._delete(code)
+        elif room is not None:
+            self.save(room)
+
+    def _abandon(self, code: str) -> None:
+        self._open_transactions().pop(code, None)
+
+    def get(self, code: str) -> Optional[Room]:
+        raise NotImplementedError
+
+    def add(self, room: Room) -> bool:
+        """Store a new room; returns False if the code is already taken"""
+        raise NotImplementedError
+
+    def save(self, room: Room) -> None:
+        raise NotImplementedError
+
+    def delete(self, code: str) -> None:
+        if not self._defer_delete(code):
+            self._delete(code)
+
+    def _delete(self, code: str) -> None:
+        raise NotImplementedError
+
+    def codes(self) -> List[str]:
+        raise NotImplementedError
+
+    @contextmanager
+    def transaction(self, code: str) -> Iterator[Optional[Room]]:
+        """Yield the room for read-modify-write and save it if the block succeeds"""
+        self._begin(code)
+        try:
+            room = self.get(code)
+            yield room
+        except BaseException:
+            self._abandon(code)
+            raise
+        self._commit(code, room)
+
+    @contextmanager
+    def read(self, code: str) -> Iterator[Optional[Room]]:
+        """Yield a consistent view of the room for a read-only look; nothing is saved"""
+        yield self.get(code)
+
+    def __contains__(self, code: str) -> bool:
+        return self.get(code) is not None
+
+    def __len__(self) -> int:
+        return len(self.codes())
+
+
+class StripedLocks:
+    """A fixed pool of locks shared out by hashing the key
+
+    Events for one room always take the same lock, so they run one at a time;
+    rooms on different stripes never contend, and there is no global lock.
+    """
+
+    def __init__(self, stripes: int = LOCK_STRIPES):
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def for_key(self, key: str) -> threading.RLock:
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class MemoryRoomStore(RoomStore):
+    """Rooms held as live objects in this process, mutated under per-room striped locks"""
+
+    name = 'memory'
+
+    def __init__(self, stripes: int = LOCK_STRIPES):
+        super().__init__()
+        self._rooms = {}
+        self.locks = StripedLocks(stripes)
+
+    def get(self, code: str) -> Optional[Room]:
+        return self._rooms.get(code)
+
+    def add(self, room: Room) -> bool:
+        if room.code in self._rooms:
+            return False
+        self._rooms[room.code] = room
+        return True
+
+    def save(self, room: Room) -> None:
+        # Rooms are mutated in place, so there is nothing to write back
+        self._rooms[room.code] = room
+
+    def delete(self, code: str) -> None:
+        # Already under the room's lock inside a transaction, so delete right away
+        self._rooms.pop(code, None)
+
+    def codes(self) -> List[str]:
+        return list(self._rooms)
+
+    @contextmanager
+    def transaction(self, code: str) -> Iterator[Optional[Room]]:
+        with self.locks.for_key(code):
+            yield self._rooms.get(code)
+
+    @contextmanager
+    def read(self, code: str) -> Iterator[Optional[Room]]:
+        # The room is a live object, so reads take its lock too
+        with self.locks.for_key(code):
+            yield self._rooms.get(code)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._rooms
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+
+def _call(func, *args):
+    return func(*args)
+
+
+def _fetch(conn: sqlite3.Connection, sql: str, params=()) -> list:
+    return conn.execute(sql, params).fetchall()
+
+
+class SQLiteRoomStore(RoomStore):
+    """Rooms shared between processes through one SQLite file
+
+    A transaction runs under BEGIN IMMEDIATE, so concurrent read-modify-writes
+    from any worker are serialized by SQLite; `read()` is a plain SELECT and
+    never takes the write lock. Waiting for that lock can take up to
+    LOCK_TIMEOUT, so every statement goes through `run_blocking(func, *args)`:
+    pass an executor under gevent and the wait parks one greenlet, not the hub.
+
+    SQLite has a single writer anyway, so within a process writers queue on a
+    lock first. At most one of them waits in SQLite, and a writer that holds
+    the database lock never waits behind others for a free executor thread.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str, run_blocking: Callable[..., Any] = _call):
+        super().__init__()
+        self.path = path
+        self.run_blocking = run_blocking
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS rooms ('
+                     'code TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)')
+
+    def _connection(self) -> sqlite3.Connection:
+        # One per thread (greenlet under gevent); statements may run on executor threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT, isolation_level=None,
+                                   check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _query(self, sql: str, params=()) -> list:
+        return self.run_blocking(_fetch, self._connection(), sql, params)
+
+    def get(self, code: str) -> Optional[Room]:
+        rows = self._query('SELECT state FROM rooms WHERE code = ?', (code,))
+        return deserialize_room(code, rows[0][0]) if rows else None
+
+    def add(self, room: Room) -> bool:
+        with self._write_lock:
+            try:
+                self._query('INSERT INTO rooms (code, state, updated_at) VALUES (?, ?, ?)',
+                            (room.code, serialize_room(room), time.time()))
+                return True
+            except sqlite3.IntegrityError:
+                return False
+
+    def save(self, room: Room) -> None:
+        with self._write_lock:
+            self._query('INSERT OR REPLACE INTO rooms (code, state, updated_at) VALUES (?, ?, ?)',
+                        (room.code, serialize_room(room), time.time()))
+
+    def _delete(self, code: str) -> None:
+        with self._write_lock:
+            self._query('DELETE FROM rooms WHERE code = ?', (code,))
+
+    def codes(self) -> List[str]:
+        return [row[0] for row in self._query('SELECT code FROM rooms')]
+
+    @staticmethod
+    def _load_for_update(conn: sqlite3.Connection, code: str) -> Optional[str]:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT state FROM rooms WHERE code = ?', (code,)).fetchone()
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return row[0] if row else None
+
+    @staticmethod
+    def _finish(conn: sqlite3.Connection, code: str, state: Optional[str], deleted: bool) -> None:
+        try:
+            if deleted:
+                conn.execute('DELETE FROM rooms WHERE code = ?', (code,))
+            elif state is not None:
+                conn.execute('INSERT OR REPLACE INTO rooms (code, state, updated_at) VALUES (?, ?, ?)',
+                             (code, state, time.time()))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    @contextmanager
+    def transaction(self, code: str) -> Iterator[Optional[Room]]:
+        conn = self._connection()
+        with self._write_lock:
+            state = self.run_blocking(self._load_for_update, conn, code)
+            room = deserialize_room(code, state) if state is not None else None
+            self._begin(code)
+            try:
+                yield room
+            except BaseException:
+                self._abandon(code)
+                self.run_blocking(conn.execute, 'ROLLBACK')
+                raise
+            deleted = self._open_transactions().pop(code, False)
+            state = serialize_room(room) if room is not None and not deleted else None
+            self.run_blocking(self._finish, conn, code, state, deleted)
+
+    @contextmanager
+    def read(self, code: str) -> Iterator[Optional[Room]]:
+        # A single SELECT already sees one committed state; no write lock needed
+        yield self.get(code)
+
+
+class RedisRoomStore(RoomStore):
+    """Rooms shared between processes and nodes through Redis
+
+    A transaction holds a per-room lock that expires after LOCK_TIMEOUT in case
+    its worker dies. A handler that runs longer than that may have lost the lock
+    to another worker, so the lock is reacquired, which checks that it is still
+    ours and renews it, before anything is written; if it is gone the write is
+    refused and the transaction fails instead of overwriting the other worker's update.
+    """
+
+    name = 'redis'
+
+    def __init__(self, url: str, prefix: str = 'wordweaver:room:'):
+        if redis is None:
+            raise RuntimeError("The Redis room store needs the redis package (pip install redis)")
+        super().__init__()
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def _key(self, code: str) -> str:
+        return f"{self.prefix}{code}"
+
+    def get(self, code: str) -> Optional[Room]:
+        payload = self.client.get(self._key(code))
+        return deserialize_room(code, payload) if payload is not None else None
+
+    def add(self, room: Room) -> bool:
+        return bool(self.client.set(self._key(room.code), serialize_room(room), nx=True))
+
+    def save(self, room: Room) -> None:
+        self.client.set(self._key(room.code), serialize_room(room))
+
+    def _delete(self, code: str) -> None:
+        self.client.delete(self._key(code))
+
+    def codes(self) -> List[str]:
+        offset = len(self.prefix)
+        return [key.decode('utf-8')[offset:] for key in self.client.scan_iter(match=f"{self.prefix}*")]
+
+    @contextmanager
+    def transaction(self, code: str) -> Iterator[Optional[Room]]:
+        # Lock keys live outside the room prefix so codes() never sees them
+        lock = self.client.lock(f"{self.prefix.rstrip(':')}-lock:{code}",
+                                timeout=LOCK_TIMEOUT, blocking_timeout=LOCK_TIMEOUT)
+        with lock:
+            self._begin(code)
+            try:
+                room = self.get(code)
+                yield room
+                # Fencing: fails if the lock expired during the handler and another worker took it
+                try:
+                    lock.reacquire()
+                except redis.exceptions.LockError:
+                    logger.error(f"Lost the lock on room {code}; not saving")
+                    raise
+            except BaseException:
+                self._abandon(code)
+                raise
+            self._commit(code, room)
+
+
+def create_room_store(url: Optional[str] = None,
+                      run_blocking: Optional[Callable[..., Any]] = None) -> RoomStore:
+    """Build the backend named by `url` or WORDWEAVER_ROOM_STORE (in-process by default)
+
+    `run_blocking` runs the SQLite store's statements (inline if None); see SQLiteRoomStore.
+    """
+    url = url if url is not None else os.environ.get(ROOM_STORE_ENV, '')
+    if not url or url == 'memory':
+        return MemoryRoomStore()
+    if url.startswith('sqlite:///'):
+        store = SQLiteRoomStore(url[len('sqlite:///'):], run_blocking or _call)
+    elif url.startswith(('redis://', 'rediss://', 'unix://')):
+        store = RedisRoomStore(url)
+    else:
+        raise ValueError(f"Unknown room store {url!r}")
+    logger.info(f"Using the {store.name} room store")
+    return store
@@ -124,12 +124,16 @@ def start_game():
 @main.route('/daily_challenge')
 def daily_challenge():
     """Daily challenge page"""
+    from daily_challenge import daily_challenge_cache, top_daily_games
+    challenge = daily_challenge_cache.get()
+    # Get top games for leaderboard
+    top_games = top_daily_games(challenge.day)
     # Create a dictionary with daily challenge data
     daily_challenge_data = {
-        'top_score': 0  # Default value, replace with actual logic later
+        'date': challenge.day.isoformat(),
+        'par_score': challenge.par_score,
+        'top_score': (top_games[0].final_score or 0) if top_games else 0
     }
-    # Get top games for leaderboard (empty list for now)
-    top_games = []
     
     # Create form for CSRF protection
     form = FlaskForm()
@@ -164,9 +168,10 @@ def start_daily_challenge():
 
         # Initialize game session with session data
         session.clear()  # Clear any existing session data
-        from game_config import DAILY_CHALLENGE_WORDS
-        # Use daily challenge words list for better experience
-        initial_word = random.choice(DAILY_CHALLENGE_WORDS)
+        # Every player gets the same precomputed word for the day
+        from daily_challenge import daily_challenge_cache
+        challenge = daily_challenge_cache.get()
+        initial_word = challenge.word
         
         success = GameSession.initialize_game(
             game=game,
@@ -187,6 +192,8 @@ def start_daily_challenge():
             flash('Failed to initialize daily challenge. Please try again.', 'error')
             return redirect(url_for('main.daily_challenge'))
 
+        session['daily_par'] = challenge.par_score
+
         logger.info(f"Started new daily challenge (ID: {game.id})")
         return redirect(url_for('main.game'))
 
@@ -310,7 +317,9 @@ def game():
             current_level=session.get('current_level', 1),
             level_progress=session.get('level_progress', 0),
             time_remaining=int(session.get('time_limit', 60) - elapsed_time),
-            is_word_ladder=False,
+            is_word_ladder=session.get('is_word_ladder', False),
+            ladder_target=session.get('ladder_target'),
+            ladder_par=session.get('ladder_par'),
             current_category=None
         )
     except Exception as e:
@@ -324,6 +333,117 @@ def word_ladder():
     """Word ladder game page"""
     return render_template('word_ladder.html')
 
+@main.route('/start_word_ladder', methods=['POST'])
+def start_word_ladder():
+    """Start a new word ladder game with a generated start/target pair"""
+    try:
+        form = FlaskForm()
+        if not form.validate_on_submit():
+            flash('Invalid form submission', 'error')
+            return redirect(url_for('main.word_ladder'))
+
+        from lexicon_manager import lexicon_manager
+        from word_ladder import DEFAULT_WORD_LENGTH
+        word_length = int(request.form.get('length', DEFAULT_WORD_LENGTH))
+        puzzle = lexicon_manager.current().ladder.generate_puzzle(word_length)
+        if not puzzle:
+            flash(f'No word ladder available for {word_length}-letter words.', 'error')
+            return redirect(url_for('main.word_ladder'))
+
+        time_limit = 120  # Default time limit for word ladder
+
+        game = Game(
+            difficulty='word_ladder',
+            time_limit=time_limit,
+            start_time=datetime.utcnow()
+        )
+        if current_user.is_authenticated:
+            game.user_id = current_user.id
+
+        db.session.add(game)
+        db.session.commit()
+
+        session.clear()  # Clear any existing session data
+        success = GameSession.initialize_game(
+            game=game,
+            initial_word=puzzle['start'],
+            mode_settings={
+                'time_limit': time_limit,
+                'hints': 3,
+                'difficulty': 'word_ladder',
+                'start_time': game.start_time.timestamp()
+            }
+        )
+
+        if not success or not GameSession.validate_game_state():
+            db.session.delete(game)
+            db.session.commit()
+            flash('Failed to initialize word ladder. Please try again.', 'error')
+            return redirect(url_for('main.word_ladder'))
+
+        session['is_word_ladder'] = True
+        session['ladder_target'] = puzzle['target']
+        session['ladder_par'] = puzzle['par']
+
+        logger.info(f"Started new word ladder (ID: {game.id}): {puzzle['start']} -> {puzzle['target']}")
+        return redirect(url_for('main.game'))
+
+    except Exception as e:
+        logger.error(f"Error starting word ladder: {str(e)}")
+        flash('Failed to start word ladder. Please try again.', 'error')
+        return redirect(url_for('main.word_ladder'))
+
+def submit_ladder_move(snapshot, submitted_word):
+    """Handle a word ladder move: change exactly one letter of the current word"""
+    current_word = session.get('current_word', '')
+    previous_words = session.get('previous_words', [])
+    target = session.get('ladder_target', '')
+
+    if submitted_word in previous_words or submitted_word == current_word:
+        return jsonify({
+            'success': False,
+            'error': 'Word already used in this ladder!'
+        }), 400
+
+    if not snapshot.ladder.is_valid_move(current_word, submitted_word):
+        return jsonify({
+            'success': False,
+            'error': f"'{submitted_word}' must be a word that changes one letter of '{current_word}'."
+        }), 400
+
+    # previous_words starts with the start word, so it holds every rung so far
+    previous_words.append(submitted_word)
+    steps = len(previous_words) - 1
+    completed = submitted_word == target
+    points = 10
+    if completed:
+        # Bonus for finishing at or under par
+        par = session.get('ladder_par', steps)
+        points += max(0, par - steps + 1) * 20
+    score = session.get('score', 0) + points
+
+    session['current_word'] = submitted_word
+    session['previous_words'] = previous_words
+    session['score'] = score
+    if completed:
+        session['is_active'] = False
+
+    game_id = session.get('game_id')
+    if game_id and current_user.is_authenticated:
+        from write_behind import write_behind
+        write_behind.record_word_chain(game_id, submitted_word, current_word, points, current_user.id)
+
+    return jsonify({
+        'success': True,
+        'points': points,
+        'newWord': submitted_word,
+        'score': score,
+        'steps': steps,
+        'par': session.get('ladder_par'),
+        'target': target,
+        'completed': completed
+    })
+
 @main.route('/reverse_mode')
 def reverse_mode():
     """Reverse mode game page"""
@@ -335,6 +455,7 @@ def admin_debug_dashboard():
     """Admin debug dashboard"""
     try:
         from debug_monitor import debug_monitor
+        from lexicon_manager import lexicon_manager
         import psutil
         
         # Get system stats
@@ -346,6 +467,7 @@ def admin_debug_dashboard():
             'uptime': time.time() - debug_monitor.start_time,
             'connection_count': debug_monitor.connection_count,
             'error_count': debug_monitor.error_count,
+            'lexicon_version': lexicon_manager.version,
         }
         
         # Get active rooms
@@ -365,6 +487,7 @@ def admin_debug_dashboard():
             system_stats=system_stats,
             active_rooms=active_rooms,
             game_count=game_count,
+            metrics=debug_monitor.collect_metrics(),
             recent_games=recent_games,
             word_chains=word_chains,
             now=now,
@@ -375,13 +498,34 @@ def admin_debug_dashboard():
         flash('Error loading debug dashboard', 'error')
         return redirect(url_for('main.index'))
 
+@main.route('/admin/reload_lexicon', methods=['POST'])
+@login_required
+def admin_reload_lexicon():
+    """Rebuild the lexicon from game_config in the background and swap it in"""
+    try:
+        from lexicon_manager import lexicon_manager
+        started = lexicon_manager.reload_async()
+        return jsonify({
+            'success': True,
+            'started': started,
+            'version': lexicon_manager.version
+        })
+    except Exception as e:
+        logger.error(f"Error reloading lexicon: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Failed to reload lexicon.'
+        }), 500
+
 @main.route('/submit_word', methods=['POST'])
 def submit_word():
     """Handle word submission during a game"""
     try:
         # Get submitted word from request
         data = request.get_json()
-        submitted_word = data.get('word', '').strip().lower()
+        # Use one lexicon version for the whole submission, even if a reload lands meanwhile
+        from lexicon_manager import lexicon_manager
+        snapshot = lexicon_manager.current()
         
         # Validate active game session
         if not GameSession.validate_game_state():
@@ -391,6 +535,18 @@ def submit_word():
                 'redirect': url_for('main.index')
             }), 400
         
+        if session.get('is_word_ladder'):
+            submitted_word = data.get('word', '').strip().lower()
+            if not submitted_word:
+                return jsonify({
+                    'success': False,
+                    'error': 'Please enter a word.'
+                }), 400
+            return submit_ladder_move(snapshot, submitted_word)
+        
+        # Inflected forms count as their lemma, so 'trees' dedupes against 'tree'
+        submitted_word = snapshot.lemmatize(data.get('word', ''))
+        
         # Get current game state from session
         current_word = session.get('current_word', '')
         previous_words = session.get('previous_words', [])
@@ -405,7 +561,7 @@ def submit_word():
             }), 400
         
         # Check if word is already used
-        if submitted_word in previous_words:
+        if submitted_word in previous_words or submitted_word == current_word:
             return jsonify({
                 'success': False,
                 'error': 'Word already used in this game!'
@@ -413,14 +569,24 @@ def submit_word():
         
         # Logic to determine if words are related (simplified for now)
         # Would be improved with actual word association API or algorithm
-        from multiplayer import are_words_related
-        if not are_words_related(current_word, submitted_word):
-            # Decrement streak when words aren't related
-            streak = 0
-            return jsonify({
-                'success': False,
-                'error': f"'{submitted_word}' doesn't seem related to '{current_word}'."
-            }), 400
+        corrected_from = None
+        if not snapshot.are_related(current_word, submitted_word):
+            suggestion = snapshot.suggest_correction(current_word, submitted_word)
+            if (suggestion and suggestion not in previous_words
+                    and snapshot.are_related(current_word, suggestion)):
+                # Auto-correct typos that are one edit away from a related word
+                corrected_from, submitted_word = submitted_word, suggestion
+            else:
+                # Decrement streak when words aren't related
+                streak = 0
+                error = f"'{submitted_word}' doesn't seem related to '{current_word}'."
+                if suggestion:
+                    error += f" Did you mean '{suggestion}'?"
+                return jsonify({
+                    'success': False,
+                    'error': error,
+                    'suggestion': suggestion
+                }), 400
         
         # Calculate points for this word
         # Base points, can be modified based on word length, difficulty, etc.
@@ -444,22 +610,18 @@ def submit_word():
         # If user is authenticated, save word chain to database
         game_id = session.get('game_id')
         if game_id and current_user.is_authenticated:
-            word_chain = WordChain(
-                game_id=game_id,
-                word=submitted_word,
-                previous_word=current_word,
-                points=bonus_points,
-                player_id=current_user.id
-            )
-            db.session.add(word_chain)
-            db.session.commit()
+            # Batched with other moves instead of committing one row per request
+            from write_behind import write_behind
+            write_behind.record_word_chain(game_id, submitted_word, current_word, bonus_points, current_user.id)
         
         # Return success response with updated game state
         return jsonify({
             'success': True,
             'points': bonus_points,
             'multiplier': multiplier,
+            'strength': round(snapshot.score(current_word, submitted_word), 3),
             'newWord': submitted_word,
+            'correctedFrom': corrected_from,
             'score': score,
             'streak': streak
         })
@@ -471,6 +633,17 @@ def submit_word():
             'error': 'An error occurred. Please try again.'
         }), 500
         
+def ladder_hint(snapshot, current_word, target, tier):
+    """Hint the next rung of the shortest ladder: which letter to change, then the word"""
+    path = snapshot.ladder.shortest_path(current_word, target)
+    if not path or len(path) < 2:
+        return None
+    next_word = path[1]
+    if tier <= 1:
+        position = next(i for i, (a, b) in enumerate(zip(current_word, next_word)) if a != b)
+        return f"Change letter {position + 1}. The target is {len(path) - 1} steps away."
+    return f"Try '{next_word}'."
+
 @main.route('/get_hint', methods=['POST'])
 def get_hint():
     """Provide a hint for the current word"""
@@ -498,20 +671,42 @@ def get_hint():
                 'error': 'No current word found.'
             }), 400
         
-        # Generate hint based on word
-        # This is a simplified hint generator - would be improved with a real word API
-        if len(current_word) <= 3:
-            hint = f"This word has {len(current_word)} letters."
+        # Hints get more revealing each time one is asked for the same word
+        from lexicon_manager import lexicon_manager
+        snapshot = lexicon_manager.current()
+        if session.get('hint_word') == current_word:
+            tier = session.get('hint_tier', 0) + 1
         else:
-            # Reveal first and last letter with rest obscured
-            hint = f"Starts with '{current_word[0]}' and ends with '{current_word[-1]}'"
+            tier = 1
+        if session.get('is_word_ladder'):
+            hint = ladder_hint(snapshot, current_word, session.get('ladder_target', ''), tier)
+        else:
+            used_words = set(session.get('previous_words', []))
+            used_words.add(current_word)
+            ranked = None
+            if session.get('difficulty') == 'daily':
+                from daily_challenge import daily_challenge_cache
+                challenge = daily_challenge_cache.get()
+                # The day's word was ranked once when the challenge was stored; every player gets the same hints
+                if current_word == challenge.word:
+                    ranked = challenge.follow_ups
+            hint = snapshot.hints.hint(current_word, tier, used_words, session.get('difficulty'), ranked)
+        if hint is None:
+            # No known follow-up word, fall back to describing the current word
+            if len(current_word) <= 3:
+                hint = f"This word has {len(current_word)} letters."
+            else:
+                hint = f"Starts with '{current_word[0]}' and ends with '{current_word[-1]}'"
         
         # Decrement hints remaining
         session['hints_remaining'] = hints_remaining - 1
+        session['hint_word'] = current_word
+        session['hint_tier'] = tier
         
         return jsonify({
             'success': True,
             'hint': hint,
+            'hintTier': tier,
             'hintsRemaining': hints_remaining - 1
         })
     
@@ -541,9 +736,11 @@ def get_definition():
                 'error': 'No current word found.'
             }), 400
         
-        # For a real implementation, this would call a dictionary API
-        # For now, generate a placeholder definition
-        definition = f"Definition for '{current_word}': (This would fetch from a real dictionary API)"
+        # Served from the local dictionary file, never from an external API
+        from dictionary_store import dictionary_store
+        definition = dictionary_store.definition(current_word) if dictionary_store else None
+        if not definition:
+            definition = f"No definition available for '{current_word}'."
         
         return jsonify({
             'success': True,
@@ -576,9 +773,11 @@ def get_etymology():
                 'error': 'No current word found.'
             }), 400
         
-        # For a real implementation, this would call an etymology API
-        # For now, generate a placeholder etymology
-        etymology = f"Etymology of '{current_word}': (This would fetch from a real etymology API)"
+        # Served from the local dictionary file, never from an external API
+        from dictionary_store import dictionary_store
+        etymology = dictionary_store.etymology(current_word) if dictionary_store else None
+        if not etymology:
+            etymology = f"No etymology available for '{current_word}'."
         
         return jsonify({
             'success': True,
@@ -0,0 +1,71 @@
+"""Production entry point for the Socket.IO server.
+
+    python serve.py --mode gevent --port 5000
+
+In gevent mode every socket is a greenlet rather than an OS thread, so one
+process holds thousands of idle connections; blocking database calls go through
+db_executor's real-thread pool. The same mode under gunicorn:
+
+    WORDWEAVER_ASYNC_MODE=gevent gunicorn -k gevent -w 1 serve:app
+
+gunicorn's gevent worker patches the standard library itself. Run one worker
+per process, and set WORDWEAVER_ROOM_STORE and WORDWEAVER_SOCKETIO_QUEUE when
+running several.
+
+With the in-process room store, rooms are snapshotted to --snapshot
+(instance/rooms.log by default) and restored on the next start.
+"""
+import argparse
+import logging
+import os
+
+MODES = ('gevent', 'threading')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the WordWeaver Socket.IO server")
+    parser.add_argument('--mode', choices=MODES, default=os.environ.get('WORDWEAVER_ASYNC_MODE', 'gevent'))
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--snapshot', default=os.environ.get('WORDWEAVER_ROOM_SNAPSHOT', 'instance/rooms.log'),
+                        help="Room snapshot log for crash recovery; empty to disable")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    os.environ['WORDWEAVER_ASYNC_MODE'] = args.mode
+    os.environ['WORDWEAVER_ROOM_SNAPSHOT'] = args.snapshot
+    if args.mode == 'gevent':
+        # Must run before anything imports socket, threading or ssl
+        from gevent import monkey
+        monkey.patch_all()
+
+from app import app, socketio  # noqa: E402
+from debug_monitor import debug_monitor  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def main(args):
+    logger.info(f"Starting WordWeaver in {socketio.async_mode} mode on {args.host}:{args.port}")
+    debug_monitor.start_monitoring()
+    try:
+        if socketio.async_mode == 'threading':
+            socketio.run(app, host=args.host, port=args.port, allow_unsafe_werkzeug=True)
+        else:
+            socketio.run(app, host=args.host, port=args.port)
+    finally:
+        debug_monitor.stop_monitoring()
+        from multiplayer import room_snapshots
+        if room_snapshots is not None:
+            room_snapshots.close()
+        from db_executor import db_executor
+        from write_behind import write_behind
+        # Flush queued moves before the executor they are written through goes away
+        write_behind.close()
+        db_executor.shutdown()
+
+
+if __name__ == '__main__':
+    main(args)
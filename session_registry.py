@@ -0,0 +1,131 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRACE_SECONDS = 15.0
+
+
+class Seat(NamedTuple):
+    room_code: str
+    player_id: int
+
+
+class SessionRegistry:
+    """Maps socket sids to the (room, player) seat they occupy, and back
+
+    A disconnect only parks the seat: it is released after `grace_seconds` unless
+    the player reconnects first. Every grace period has the same length, so parked
+    seats expire in the order they were parked and an OrderedDict doubles as the
+    expiry queue. Bind, disconnect, reconnect and expiry are all O(1) per seat.
+    """
+
+    def __init__(self, grace_seconds: float = DEFAULT_GRACE_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.grace_seconds = grace_seconds
+        self.clock = clock
+        self._by_sid: Dict[str, Seat] = {}
+        self._by_seat: Dict[Seat, str] = {}
+        self._parked: 'OrderedDict[Seat, float]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_sid)
+
+    def bind(self, sid: str, room_code: str, player_id: int) -> Optional[Seat]:
+        """Record that `sid` plays `player_id` in `room_code`, replacing any older socket
+
+        A socket holds one seat: if `sid` held another, that seat is dropped and
+        returned so the caller can take its player out of the old room.
+        """
+        seat = Seat(room_code, player_id)
+        with self._lock:
+            previous = self._by_sid.get(sid)
+            if previous == seat:
+                previous = None
+            elif previous is not None and self._by_seat.get(previous) == sid:
+                del self._by_seat[previous]
+            self._parked.pop(seat, None)
+            old_sid = self._by_seat.get(seat)
+            if old_sid is not None and old_sid != sid:
+                self._by_sid.pop(old_sid, None)
+            self._by_sid[sid] = seat
+            self._by_seat[seat] = sid
+        return previous
+
+    def lookup(self, sid: str) -> Optional[Seat]:
+        return self._by_sid.get(sid)
+
+    def sid_for(self, room_code: str, player_id: int) -> Optional[str]:
+        return self._by_seat.get(Seat(room_code, player_id))
+
+    def disconnect(self, sid: str) -> Optional[Seat]:
+        """Park the seat of a disconnected socket; returns it if it should be released now"""
+        with self._lock:
+            seat = self._by_sid.pop(sid, None)
+            if seat is None or self._by_seat.get(seat) != sid:
+                return None
+            if self.grace_seconds <= 0:
+                del self._by_seat[seat]
+                return seat
+            self._parked[seat] = self.clock() + self.grace_seconds
+            return None
+
+    def park(self, room_code: str, player_id: int) -> None:
+        """Hold a seat with no socket, e.g. one restored after a restart, for the grace period"""
+        seat = Seat(room_code, player_id)
+        with self._lock:
+            if seat not in self._by_seat:
+                self._parked[seat] = self.clock() + self.grace_seconds
+
+    def is_parked(self, room_code: str, player_id: int) -> bool:
+        return Seat(room_code, player_id) in self._parked
+
+    def release(self, room_code: str, player_id: int) -> None:
+        """Forget a seat, e.g. when its room closes"""
+        seat = Seat(room_code, player_id)
+        with self._lock:
+            self._parked.pop(seat, None)
+            sid = self._by_seat.pop(seat, None)
+            if sid is not None:
+                self._by_sid.pop(sid, None)
+
+    def expired(self) -> List[Seat]:
+        """Pop every parked seat whose grace period is over"""
+        now = self.clock()
+        seats = []
+        with self._lock:
+            while self._parked:
+                seat, deadline = next(iter(self._parked.items()))
+                if deadline > now:
+                    break
+                self._parked.popitem(last=False)
+                self._by_seat.pop(seat, None)
+                seats.append(seat)
+        return seats
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'connected': len(self._by_sid),
+            'parked': len(self._parked),
+            'grace_seconds': self.grace_seconds,
+        }
+
+
+def load_grace_seconds() -> float:
+    """Grace window from WORDWEAVER_DISCONNECT_GRACE, in seconds"""
+    value = os.environ.get('WORDWEAVER_DISCONNECT_GRACE')
+    if not value:
+        return DEFAULT_GRACE_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.error(f"Invalid WORDWEAVER_DISCONNECT_GRACE {value!r}, using {DEFAULT_GRACE_SECONDS}")
+        return DEFAULT_GRACE_SECONDS
+
+
+# Create singleton instance
+session_registry = SessionRegistry(load_grace_seconds())
@@ -0,0 +1,169 @@
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FPS = 4.0
+DEFAULT_MAX_BACKLOG = 8
+
+
+class _Channel:
+    __slots__ = ('seq', 'sids', 'behind')
+
+    def __init__(self, seq):
+        self.seq = seq
+        self.sids = set()
+        # Spectators that missed the last frame, with the seq they do have
+        self.behind: Dict[str, int] = {}
+
+
+class SpectatorHub:
+    """Streams rooms to spectators as coalesced frames at no more than `max_fps`
+
+    Player events are broadcast as they happen; spectators instead get one
+    `spectator_frame` per room per tick, carrying the room's full state as of
+    that tick. However many moves landed in between, they cost one frame, built
+    and serialized once and sent in one emit.
+
+    Each worker's hub only knows the spectators connected to it and addresses
+    the frame to exactly those sids, so with several workers behind a message
+    queue every spectator still gets one frame per tick, not one per worker.
+
+    A frame is a complete state, so a spectator that misses one loses nothing
+    that the next one won't carry. That makes slow consumers cheap to handle:
+    a socket with more than `max_backlog` packets still queued is skipped and
+    catches up, with everything merged, on a later tick.
+
+    `load_frame(room_code, known_seq)` returns None once the room is gone,
+    otherwise `(seq, payload)` with payload None if the room is still at
+    `known_seq`; `send(event, payload, sids)` emits to a list of sids, and
+    `backlog(sid)` reports how many packets a socket has yet to drain.
+    """
+
+    def __init__(self, load_frame: Callable[[str, Optional[int]], Optional[Tuple[int, Any]]],
+                 send: Callable[..., None], backlog: Callable[[str], int] = lambda sid: 0,
+                 max_fps: float = DEFAULT_MAX_FPS, max_backlog: int = DEFAULT_MAX_BACKLOG):
+        self.load_frame = load_frame
+        self.send = send
+        self.backlog = backlog
+        self.interval = 1.0 / max_fps
+        self.max_backlog = max_backlog
+        self._channels: Dict[str, _Channel] = {}
+        self._room_by_sid: Dict[str, str] = {}
+        self._lock = Lock()
+        self._running = False
+        self.frames = 0
+        self.deliveries = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._room_by_sid)
+
+    def watch(self, sid: str, room_code: str, seq: int = -1) -> None:
+        """Add a spectator; `seq` is the state it already has, e.g. from a snapshot"""
+        with self._lock:
+            self._remove(sid)
+            channel = self._channels.get(room_code)
+            if channel is None:
+                channel = self._channels[room_code] = _Channel(seq)
+            channel.sids.add(sid)
+            if seq != channel.seq:
+                channel.behind[sid] = seq
+            self._room_by_sid[sid] = room_code
+
+    def unwatch(self, sid: str) -> Optional[str]:
+        """Remove a spectator; returns the room it was watching"""
+        with self._lock:
+            return self._remove(sid)
+
+    def _remove(self, sid: str) -> Optional[str]:
+        room_code = self._room_by_sid.pop(sid, None)
+        if room_code is not None:
+            channel = self._channels[room_code]
+            channel.sids.discard(sid)
+            channel.behind.pop(sid, None)
+            if not channel.sids:
+                del self._channels[room_code]
+        return room_code
+
+    def end(self, room_code: str) -> List[str]:
+        """Drop a closed room's spectators and tell them; returns their sids"""
+        with self._lock:
+            channel = self._channels.pop(room_code, None)
+            sids = list(channel.sids) if channel is not None else []
+            for sid in sids:
+                del self._room_by_sid[sid]
+        if sids:
+            self.send('spectate_ended', {'room_code': room_code}, sids)
+        return sids
+
+    def pump(self) -> int:
+        """Send one frame to every room with spectators behind; returns frames sent"""
+        with self._lock:
+            room_codes = list(self._channels)
+        sent = 0
+        for room_code in room_codes:
+            try:
+                sent += self._pump_room(room_code)
+            except Exception as e:
+                logger.error(f"Error sending spectator frame for {room_code}: {str(e)}")
+        return sent
+
+    def _pump_room(self, room_code: str) -> int:
+        channel = self._channels.get(room_code)
+        if channel is None:
+            return 0
+        # With nobody lagging the loader can skip serializing an unchanged room
+        frame = self.load_frame(room_code, None if channel.behind else channel.seq)
+        if frame is None:
+            self.end(room_code)
+            return 0
+        seq, payload = frame
+        if payload is None:
+            return 0
+        with self._lock:
+            if seq != channel.seq:
+                candidates = channel.sids
+            else:
+                # Nothing new: only spectators that missed earlier frames need this one
+                candidates = [sid for sid, seen in channel.behind.items() if seen != seq]
+            recipients, slow = [], []
+            for sid in candidates:
+                (slow if self.backlog(sid) > self.max_backlog else recipients).append(sid)
+            if recipients:
+                channel.behind = {sid: channel.behind.get(sid, channel.seq) for sid in slow}
+                channel.seq = seq
+        self.dropped += len(slow)
+        if not recipients:
+            return 0
+        self.send('spectator_frame', payload, recipients)
+        self.frames += 1
+        self.deliveries += len(recipients)
+        return 1
+
+    def run(self, sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Pump frames until stop() is called; pass socketio.sleep under gevent"""
+        self._running = True
+        while self._running:
+            sleep(self.interval)
+            self.pump()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'spectators': len(self._room_by_sid),
+            'rooms': len(self._channels),
+            'frames': self.frames,
+            'deliveries': self.deliveries,
+            'dropped': self.dropped,
+            'max_fps': round(1.0 / self.interval, 2),
+        }
+
+
+def load_max_fps() -> float:
+    return float(os.environ.get('WORDWEAVER_SPECTATOR_FPS', DEFAULT_MAX_FPS))
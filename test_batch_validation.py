@@ -0,0 +1,23 @@
+import relatedness
+from batch_validation import validate_pairs, validate_pairs_parallel
+
+
+PAIRS = [(None, 'tree'), ('tree', 'river'), ('river', 'lion'), ('hot', 'cold'), ('lion', 'notaword')]
+
+
+def test_validate_pairs_in_chunks():
+    chunks = list(validate_pairs(PAIRS, chunk_size=2))
+    assert [chunk.start for chunk in chunks] == [0, 2, 4]
+    related = [verdict for chunk in chunks for verdict in chunk.related]
+    assert related == [True, True, False, True, False]
+    backend = relatedness.get_backend()
+    scores = [score for chunk in chunks for score in chunk.scores]
+    assert scores[1] == backend.score('tree', 'river')
+
+
+def test_parallel_validation_preserves_order():
+    pairs = PAIRS * 200
+    serial = [verdict for chunk in validate_pairs(pairs, chunk_size=64) for verdict in chunk.related]
+    parallel_chunks = list(validate_pairs_parallel(iter(pairs), chunk_size=64, workers=2))
+    assert [chunk.start for chunk in parallel_chunks] == list(range(0, len(pairs), 64))
+    assert [verdict for chunk in parallel_chunks for verdict in chunk.related] == serial
@@ -0,0 +1,73 @@
+from game_config import WORD_CATEGORIES, OPPOSITES, WORD_LIST, DAILY_CHALLENGE_WORDS
+from compiled_lexicon import CompiledLexicon, compile_lexicon, FLAG_DAILY, FLAG_EXTERNAL, FLAG_START_WORD
+from lexicon import Lexicon
+
+
+def build(tmp_path, word_files=()):
+    path = str(tmp_path / 'lexicon.bin')
+    compile_lexicon(path, WORD_CATEGORIES, OPPOSITES, WORD_LIST, DAILY_CHALLENGE_WORDS, word_files)
+    return CompiledLexicon(path)
+
+
+def test_compiled_lexicon_matches_in_memory_index(tmp_path):
+    compiled = build(tmp_path)
+    lex = Lexicon(WORD_CATEGORIES)
+    for word in lex.words:
+        assert compiled.get_categories(word) == lex.get_categories(word)
+        assert compiled.get_primary_category(word) == lex.get_primary_category(word)
+    assert compiled.are_related('Tree', 'river')
+    assert compiled.are_related('habitat', 'lion')
+    assert not compiled.are_related('tree', 'lion')
+    assert not compiled.are_related('tree', 'notaword')
+    compiled.close()
+
+
+def test_compiled_lexicon_flags_and_opposites(tmp_path):
+    compiled = build(tmp_path)
+    assert compiled.has_flag('sunset', FLAG_START_WORD)
+    assert compiled.has_flag('wisdom', FLAG_DAILY)
+    assert not compiled.has_flag('lion', FLAG_DAILY)
+    assert compiled.are_opposites('cold', 'hot')
+    assert compiled.are_opposites('hot', 'cold')
+    assert not compiled.are_opposites('hot', 'slow')
+    words = list(compiled.words)
+    assert words == sorted(words)
+    compiled.close()
+
+
+def test_external_word_files(tmp_path):
+    extra = tmp_path / 'extra.txt'
+    extra.write_text("# comment\nhedgehog\tanimals\nzeitgeist\nsushi\tfood\n", encoding='utf-8')
+    compiled = build(tmp_path, [str(extra)])
+    assert compiled.are_related('hedgehog', 'lion')
+    assert 'zeitgeist' in compiled
+    assert compiled.has_flag('zeitgeist', FLAG_EXTERNAL)
+    assert compiled.get_categories('sushi') == {'food'}
+    compiled.close()
+
+
+def test_category_backend_asks_the_compiled_file(tmp_path):
+    from relatedness import CategoryBackend
+    from word_graph import CATEGORY_WEIGHT, OPPOSITE_WEIGHT, WordGraph
+
+    compiled = build(tmp_path)
+    # No graph edges at all: categories and opposites must come from the mapped file
+    backend = CategoryBackend(compiled, WordGraph.build({}, {}, ()))
+    assert backend.are_related('hot', 'cold')
+    assert backend.score('hot', 'cold') == OPPOSITE_WEIGHT
+    assert backend.are_related('tree', 'river')
+    assert backend.score('tree', 'river') == CATEGORY_WEIGHT
+    assert not backend.are_related('tree', 'lion')
+    compiled.close()
+
+
+def test_tables_round_trip(tmp_path):
+    compiled = build(tmp_path)
+    categories = compiled.category_table()
+    for name, content in WORD_CATEGORIES.items():
+        expected = {word.lower() for word in content['words'] + content.get('common_words', [])}
+        assert set(categories[name]['words']) == expected
+    assert compiled.opposite_table() == {
+        word: [other.lower() for other in others] for word, others in OPPOSITES.items()
+    }
+    compiled.close()
@@ -0,0 +1,42 @@
+from datetime import date
+
+from daily_challenge import build_challenge, choose_daily_word, compute_par, seed_index
+from hint_engine import HintEngine
+
+
+def test_seed_is_deterministic_per_day():
+    assert seed_index(date(2026, 1, 1), 35) == seed_index(date(2026, 1, 1), 35)
+    indexes = {seed_index(date(2026, 1, day), 35) for day in range(1, 29)}
+    assert len(indexes) > 10
+
+
+def test_daily_word_always_has_follow_ups():
+    hints = HintEngine()
+    for day in range(1, 29):
+        word = choose_daily_word(date(2026, 2, day), hints)
+        assert hints.candidates(word, 'medium')
+
+
+def test_build_challenge_precomputes_follow_ups_and_par():
+    hints = HintEngine()
+    challenge = build_challenge(date(2026, 3, 1), hints)
+    assert challenge == build_challenge(date(2026, 3, 1), hints)
+    assert challenge.follow_ups == tuple(hints.ranked_words(challenge.word, 'medium'))
+    assert challenge.par_score == compute_par(challenge.word, hints) > 0
+
+
+def test_par_follows_submit_scoring():
+    hints = HintEngine()
+    # 10 moves: 10 + 15 + 20 + 25 + 30 * 6
+    assert compute_par('tree', hints) == 250
+    assert compute_par('notaword', hints) == 0
+
+
+def test_daily_hints_come_from_stored_follow_ups():
+    hints = HintEngine()
+    challenge = build_challenge(date(2026, 3, 1), hints)
+    stored = challenge.follow_ups[::-1]
+    used = {challenge.word, stored[0]}
+    # The stored ranking wins over the engine's own, skipping words already played
+    assert hints.hint(challenge.word, 3, used, 'daily', ranked=stored) == f"Try '{stored[1]}'."
+    assert hints.hint(challenge.word, 3, set(stored), 'daily', ranked=stored) is None
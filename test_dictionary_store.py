@@ -0,0 +1,52 @@
+import pytest
+
+from compiled_lexicon import CompiledLexicon, compile_lexicon
+from dictionary_store import DictionaryStore, compile_dictionary, read_entry_file
+
+
+@pytest.fixture
+def store(tmp_path):
+    lexicon_path = str(tmp_path / 'lexicon.bin')
+    compile_lexicon(lexicon_path, {'nature': {'words': ['tree', 'river', 'lake'], 'common_words': []}})
+    lexicon = CompiledLexicon(lexicon_path)
+
+    entries = tmp_path / 'entries.tsv'
+    entries.write_text(
+        "tree\tA tall perennial woody plant.\tOld English trēow\n"
+        "river\tA large natural stream of water.\n"
+        "unknown\tNot in the lexicon.\tnone\n",
+        encoding='utf-8'
+    )
+    dictionary_path = str(tmp_path / 'dictionary.bin')
+    assert compile_dictionary(dictionary_path, lexicon, read_entry_file(str(entries))) == 2
+    store = DictionaryStore(dictionary_path, lexicon, cache_size=1)
+    yield store
+    store.close()
+    lexicon.close()
+
+
+def test_lookup_decompresses_entries_on_demand(store):
+    assert store.definition('Tree') == 'A tall perennial woody plant.'
+    assert store.etymology('tree') == 'Old English trēow'
+    assert store.definition('river') == 'A large natural stream of water.'
+    assert store.etymology('river') is None
+    assert store.lookup('lake') is None
+    assert store.lookup('unknown') is None
+
+
+def test_decoded_entries_are_cached(store):
+    store.lookup('tree')
+    store.lookup('tree')
+    stats = store.cache.stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    store.lookup('river')
+    assert store.cache.stats()['evictions'] == 1
+
+
+def test_rejects_dictionary_for_another_lexicon(store, tmp_path):
+    other_path = str(tmp_path / 'other.bin')
+    compile_lexicon(other_path, {'nature': {'words': ['tree', 'rivers', 'lake'], 'common_words': []}})
+    other = CompiledLexicon(other_path)
+    with pytest.raises(ValueError):
+        DictionaryStore(store.path, other)
+    other.close()
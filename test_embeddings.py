@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from embeddings import EmbeddingBackend, load_vectors
+
+SAMPLE_VECTORS = os.path.join(os.path.dirname(__file__), 'sample_vectors.txt')
+
+
+@pytest.fixture(scope='module')
+def backend():
+    return EmbeddingBackend.from_file(SAMPLE_VECTORS, threshold=0.5)
+
+
+def test_load_vectors_builds_contiguous_float32_matrix():
+    words, matrix = load_vectors(SAMPLE_VECTORS)
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (len(words), 16)
+    assert 'tree' in words
+
+
+def test_cosine_similarity_against_threshold(backend):
+    assert backend.matrix.flags['C_CONTIGUOUS']
+    assert backend.similarity('tree', 'river') > 0.5
+    assert backend.are_related('Tree', 'river')
+    assert not backend.are_related('tree', 'lion')
+
+
+def test_unknown_words_fall_back_to_category_index(backend):
+    # 'ecosystem' is a common word without a vector but shares categories with both
+    assert backend.similarity('ecosystem', 'lion') is None
+    assert backend.are_related('ecosystem', 'lion')
+    assert backend.are_related('hot', 'cold')
+    assert not backend.are_related('tree', 'notaword')
+
+
+def test_batch_scoring_matches_single_pairs(backend):
+    candidates = ['river', 'lion', 'ecosystem', 'notaword'] * 500
+    scores = backend.score_many('tree', candidates)
+    verdicts = backend.related_many('tree', candidates)
+    assert len(scores) == len(verdicts) == len(candidates)
+    for candidate, score, verdict in zip(candidates[:4], scores, verdicts):
+        assert score == pytest.approx(backend.score('tree', candidate), abs=1e-6)
+        assert verdict == backend.are_related('tree', candidate)
+
+
+def test_most_similar(backend):
+    neighbors = backend.most_similar('lion', limit=5)
+    assert len(neighbors) == 5
+    assert 'lion' not in [word for word, _ in neighbors]
+    scores = [score for _, score in neighbors]
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,40 @@
+from fuzzy_lookup import SymSpellIndex, deletes, edit_distance
+
+
+def test_deletes_and_edit_distance():
+    assert deletes('cat', 1) == {'cat', 'at', 'ct', 'ca'}
+    assert edit_distance('elephnat', 'elephant', 1) == 1
+    assert edit_distance('tree', 'trees', 1) == 1
+    assert edit_distance('tree', 'river', 1) == 2
+
+
+def test_lookup_finds_single_edit_typos():
+    index = SymSpellIndex(['elephant', 'cat', 'cot', 'tree'])
+    assert index.lookup('elephnat') == [('elephant', 1)]
+    assert index.lookup('Tree') == [('tree', 0)]
+    assert index.lookup('cxt') == [('cat', 1), ('cot', 1)]
+    assert index.lookup('zebra') == []
+
+
+def test_suggest_prefers_context():
+    index = SymSpellIndex(['cat', 'cot'])
+    assert index.suggest('cxt') == 'cat'
+    assert index.suggest('cxt', prefer=lambda word: word == 'cot') == 'cot'
+    assert index.suggest('zebra') is None
+
+
+def test_compiled_index_matches_built_one(tmp_path):
+    from compiled_lexicon import CompiledLexicon, compile_lexicon
+    from fuzzy_lookup import CompiledSymSpellIndex
+
+    words = ['elephant', 'cat', 'cot', 'tree', 'a']
+    path = str(tmp_path / 'lexicon.bin')
+    compile_lexicon(path, {'misc': {'words': words, 'common_words': []}})
+    compiled = CompiledLexicon(path)
+    index = CompiledSymSpellIndex(compiled)
+    built = SymSpellIndex(words)
+    for term in ['elephnat', 'Tree', 'cxt', 'zebra', 'b', 'at', 'cats']:
+        assert index.lookup(term) == built.lookup(term)
+    assert 'cat' in index and 'dog' not in index
+    assert index.suggest('cxt', prefer=lambda word: word == 'cot') == 'cot'
+    compiled.close()
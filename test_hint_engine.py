@@ -0,0 +1,36 @@
+from hint_engine import HintEngine, TIER_CATEGORY, TIER_PREFIX, TIER_WORD
+
+
+def test_candidates_respect_difficulty_length():
+    engine = HintEngine()
+    easy = engine.ranked_words('tree', 'easy')
+    expert = engine.ranked_words('tree', 'expert')
+    assert 'leaf' in easy
+    assert all(len(word) >= 6 for word in expert)
+    assert set(expert) < set(easy)
+    # Unknown difficulties use the medium table
+    assert engine.ranked_words('tree', 'daily') == engine.ranked_words('tree', 'medium')
+
+
+def test_used_words_are_skipped():
+    engine = HintEngine()
+    first, _ = engine.best_candidate('hot', difficulty='easy')
+    second, _ = engine.best_candidate('hot', {first}, difficulty='easy')
+    assert first != second
+    assert engine.best_candidate('notaword') is None
+
+
+def test_tiers_reveal_progressively():
+    engine = HintEngine()
+    word, category = engine.best_candidate('lion', difficulty='medium')
+    assert category == 'animals'
+    assert 'animals' in engine.hint('lion', TIER_CATEGORY, difficulty='medium')
+    assert f"{len(word)}-letter" in engine.hint('lion', TIER_PREFIX, difficulty='medium')
+    assert engine.hint('lion', TIER_WORD, difficulty='medium') == f"Try '{word}'."
+
+
+def test_opposite_hints():
+    engine = HintEngine()
+    word, category = engine.best_candidate('hot', difficulty='easy')
+    assert word == 'cold' and category is None
+    assert 'opposite' in engine.hint('hot', TIER_CATEGORY, difficulty='easy')
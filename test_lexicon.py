@@ -0,0 +1,25 @@
+from game_config import WORD_CATEGORIES
+from lexicon import Lexicon, normalize_word
+
+
+def test_normalize_word():
+    assert normalize_word('  Tree ') == 'tree'
+    assert normalize_word(None) == ''
+
+
+def test_words_in_multiple_categories_keep_every_category():
+    lex = Lexicon(WORD_CATEGORIES)
+    assert lex.get_categories('habitat') == {'nature', 'animals'}
+    assert lex.get_categories('tropical') == {'nature', 'weather'}
+    # First match in config order is still reported as the primary category
+    assert lex.get_primary_category('habitat') == 'nature'
+
+
+def test_are_related_uses_any_shared_category():
+    lex = Lexicon(WORD_CATEGORIES)
+    assert lex.are_related('tree', 'River')
+    assert lex.are_related('ecosystem', 'lion')
+    assert lex.are_related('ecosystem', 'forest')
+    assert not lex.are_related('tree', 'lion')
+    assert not lex.are_related('tree', 'unknownword')
+    assert 'lion' in lex and 'unknownword' not in lex
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+import relatedness
+from lexicon_manager import LexiconManager, LexiconSnapshot, lexicon_manager
+
+
+@pytest.fixture
+def manager():
+    original = lexicon_manager.current()
+    yield lexicon_manager
+    lexicon_manager.swap(original)
+
+
+def test_swap_keeps_in_flight_snapshot(manager):
+    in_flight = manager.current()
+    categories = {'space': {'words': ['planet', 'comet', 'star'], 'common_words': []}}
+    manager.swap(LexiconSnapshot.build(in_flight.version + 1, categories, {}))
+
+    assert manager.current().are_related('planet', manager.current().lemmatize('comets'))
+    assert not manager.current().are_related('tree', 'river')
+    # A handler that started before the swap still sees its own vocabulary
+    assert in_flight.are_related('tree', 'river')
+    assert relatedness.get_backend() is manager.current().backend
+
+
+def test_reload_rebuilds_and_bumps_version(manager):
+    version = manager.version
+    snapshot = manager.reload()
+    assert snapshot is manager.current()
+    assert manager.version == version + 1
+    assert snapshot.are_related('tree', 'river')
+    assert snapshot.hints.best_candidate('lion') is not None
+    stats = manager.stats()
+    assert stats['version'] == version + 1
+    assert stats['reloading'] is False and stats['last_error'] is None
+
+
+def test_reload_async_runs_in_background():
+    categories = {'space': {'words': ['planet', 'comet'], 'common_words': []}}
+    manager = LexiconManager(LexiconSnapshot.build(1, categories, {}))
+    assert manager.reload_async()
+    for _ in range(200):
+        if manager.version == 2 and not manager.reloading:
+            break
+        time.sleep(0.01)
+    assert manager.version == 2
+    assert manager.current().are_related('tree', 'river')
+
+
+def test_reload_builds_on_a_real_thread_under_gevent(monkeypatch):
+    import threading
+    import lexicon_manager as manager_module
+
+    threads = []
+    rebuild = LexiconManager._rebuild
+
+    def recording_rebuild(version):
+        threads.append(threading.get_ident())
+        return rebuild(version)
+
+    monkeypatch.setattr(manager_module, '_gevent_patched', lambda: True)
+    monkeypatch.setattr(LexiconManager, '_rebuild', staticmethod(recording_rebuild))
+    categories = {'space': {'words': ['planet', 'comet'], 'common_words': []}}
+    manager = LexiconManager(LexiconSnapshot.build(1, categories, {}))
+    manager.reload()
+    assert manager.version == 2
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_reload_with_compiled_lexicon_uses_new_categories(tmp_path, monkeypatch):
+    import lexicon_manager as manager_module
+    from compiled_lexicon import CompiledLexicon, compile_lexicon
+
+    extra = tmp_path / 'extra.txt'
+    extra.write_text("hedgehog\tanimals\n", encoding='utf-8')
+    path = str(tmp_path / 'lexicon.bin')
+    compile_lexicon(path, {'space': {'words': ['planet', 'comet'], 'common_words': []}}, word_files=[str(extra)])
+    monkeypatch.setenv('WORDWEAVER_LEXICON_PATH', path)
+    monkeypatch.setattr(manager_module, 'RETIRE_SECONDS', 0.01)
+
+    manager = LexiconManager(LexiconSnapshot.build(1, {'space': {'words': ['planet'], 'common_words': []}}, {}))
+    first = manager.current().lexicon
+    assert isinstance(first, CompiledLexicon) and first.path != path
+    assert 'comet' not in first and 'hedgehog' in first
+
+    snapshot = manager.reload()
+    assert isinstance(snapshot.lexicon, CompiledLexicon)
+    assert snapshot.are_related('tree', 'river')
+    assert snapshot.lexicon.are_related('hedgehog', 'lion')
+    assert snapshot.are_related('hot', 'cold') and snapshot.hints.best_candidate('lion') is not None
+    assert snapshot.lemmatize('rivers') == 'river'
+    for _ in range(100):
+        if first._mm.closed:
+            break
+        time.sleep(0.01)
+    assert first._mm.closed
+    assert not snapshot.lexicon._mm.closed
+    snapshot.lexicon.close()
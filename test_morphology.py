@@ -0,0 +1,63 @@
+from morphology import Lemmatizer, inflections, lemmatize
+
+
+def test_inflections_follow_suffix_rules():
+    assert {'trees', 'treed'} <= inflections('tree')
+    assert {'happier', 'happiest', 'happies'} <= inflections('happy')
+    assert {'bigger', 'biggest'} <= inflections('big')
+    assert 'boxes' in inflections('box')
+
+
+def test_lemmatize_maps_inflected_forms_to_lexicon_words():
+    assert lemmatize('Trees') == 'tree'
+    assert lemmatize('clouds') == 'cloud'
+    assert lemmatize('happier') == 'happy'
+    assert lemmatize('tree') == 'tree'
+    assert lemmatize('unknownwords') == 'unknownwords'
+
+
+def test_real_words_are_not_collapsed():
+    lemmatizer = Lemmatizer(['feel', 'feeling', 'spirit', 'spirits'])
+    assert lemmatizer.lemmatize('feeling') == 'feeling'
+    assert lemmatizer.lemmatize('spirits') == 'spirits'
+    assert lemmatizer.lemmatize('feels') == 'feel'
+
+
+def test_comparatives_only_for_adjectives():
+    assert {'wider', 'widest'} <= inflections('wide')
+    assert not {'beer', 'beest'} & inflections('bee')
+    assert 'cater' not in inflections('cat')
+    assert 'being' not in inflections('bee')
+    assert 'seeing' in inflections('see')
+
+
+def test_lexicon_words_are_not_lemmatized_away():
+    assert lemmatize('beer') == 'beer'
+    assert lemmatize('being') == 'being'
+    assert lemmatize('cater') == 'cater'
+    assert lemmatize('bigger') == 'big'
+    assert lemmatize('wider') == 'wide'
+    # A word in the vocabulary stands for itself even when a rule could derive it
+    lemmatizer = Lemmatizer(['wide', 'wider', 'bee'])
+    assert lemmatizer.lemmatize('wider') == 'wider'
+    assert lemmatizer.lemmatize('widest') == 'wide'
+
+
+def test_compiled_lemma_table_matches_built_one(tmp_path):
+    from compiled_lexicon import CompiledLexicon, compile_lexicon
+    from morphology import CompiledLemmatizer, build_lemma_table
+
+    path = str(tmp_path / 'lexicon.bin')
+    words = ['tree', 'happy', 'big', 'wide', 'wider', 'bee', 'feel', 'feeling']
+    compile_lexicon(path, {'misc': {'words': words, 'common_words': []}})
+    compiled = CompiledLexicon(path)
+    lemmatizer = CompiledLemmatizer(compiled)
+    table = build_lemma_table(words)
+    assert len(lemmatizer) == len(table)
+    for form, lemma in table.items():
+        assert lemmatizer.lemmatize(form) == lemma
+    assert lemmatizer.lemmatize('Trees') == 'tree'
+    assert lemmatizer.lemmatize('wider') == 'wider'
+    assert lemmatizer.lemmatize('feeling') == 'feeling'
+    assert lemmatizer.lemmatize('unknownwords') == 'unknownwords'
+    compiled.close()
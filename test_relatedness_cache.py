@@ -0,0 +1,38 @@
+import pytest
+
+from relatedness import CachedBackend, CategoryBackend
+from relatedness_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats() == {
+        'size': 2, 'maxsize': 2, 'hits': 3, 'misses': 1, 'evictions': 1, 'hit_rate': 0.75,
+    }
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_cached_backend_shares_entries_for_both_orders():
+    backend = CachedBackend(CategoryBackend(), maxsize=16)
+    assert backend.are_related('tree', 'River')
+    assert backend.are_related('river', 'tree')
+    assert backend.score('river', 'tree') == CategoryBackend().score('tree', 'river')
+    stats = backend.stats()
+    assert stats['size'] == 1
+    assert stats['misses'] == 1
+    assert stats['hits'] == 2
+
+
+def test_invalidate_drops_cached_verdicts():
+    backend = CachedBackend(CategoryBackend(), maxsize=16)
+    backend.are_related('hot', 'cold')
+    backend.invalidate()
+    assert backend.stats()['size'] == 0
+    assert backend.are_related('hot', 'cold')
@@ -0,0 +1,78 @@
+from room_snapshots import RoomSnapshotter, create_snapshotter, read_log
+from room_state import PlayerState, Room
+from room_store import MemoryRoomStore
+
+
+def make_room(code):
+    return Room(code, 1, 'tree', players=[PlayerState(1, 'Ana', is_host=True), PlayerState(2, 'Ben')])
+
+
+def test_rooms_survive_a_restart(tmp_path):
+    path = str(tmp_path / 'rooms.log')
+    store = MemoryRoomStore()
+    store.add(make_room('AAAAAA'))
+    store.add(make_room('BBBBBB'))
+    snapshots = RoomSnapshotter(path, store)
+    snapshots.snapshot()
+    with store.transaction('AAAAAA') as room:
+        room.play_word('forest')
+        room.advance_turn()
+        room.delta(word='forest')
+    store.delete('BBBBBB')
+    snapshots.snapshot()
+
+    restarted = MemoryRoomStore()
+    restored = RoomSnapshotter(path, restarted).restore()
+    assert [room.code for room in restored] == ['AAAAAA']
+    room = restarted.get('AAAAAA')
+    assert room.current_word == 'forest'
+    assert 'forest' in room.used_words
+    assert room.turn_index == 1
+    assert room.to_dict() == store.get('AAAAAA').to_dict()
+
+
+def test_only_changed_rooms_are_appended(tmp_path):
+    store = MemoryRoomStore()
+    for index in range(10):
+        store.add(make_room(f'ROOM{index:02d}'))
+    snapshots = RoomSnapshotter(str(tmp_path / 'rooms.log'), store)
+    assert snapshots.snapshot() == 10
+    assert snapshots.snapshot() == 0
+    store.get('ROOM03').delta(is_paused=True)
+    assert snapshots.snapshot() == 1
+
+
+def test_torn_final_record_is_skipped(tmp_path):
+    path = tmp_path / 'rooms.log'
+    store = MemoryRoomStore()
+    store.add(make_room('AAAAAA'))
+    RoomSnapshotter(str(path), store).snapshot()
+    with open(path, 'a') as f:
+        f.write('BBBBBB\t{"game_id": 1, "curr')
+    assert list(read_log(str(path))) == ['AAAAAA']
+
+
+def test_compaction_keeps_one_record_per_room(tmp_path):
+    path = str(tmp_path / 'rooms.log')
+    store = MemoryRoomStore()
+    store.add(make_room('AAAAAA'))
+    snapshots = RoomSnapshotter(path, store)
+    for _ in range(1100):
+        store.get('AAAAAA').delta()
+        snapshots.snapshot()
+    assert snapshots.stats()['compactions'] == 1
+    with open(path) as f:
+        assert len(f.readlines()) < 200
+    assert read_log(path)['AAAAAA']
+
+
+def test_workers_get_their_own_locked_log(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rooms.log')
+    monkeypatch.setenv('WORDWEAVER_WORKER_COUNT', '2')
+    monkeypatch.setenv('WORDWEAVER_WORKER_ID', '1')
+    first = create_snapshotter(MemoryRoomStore(), path=path)
+    assert first.path == f"{path}.1"
+    # A second process with the same worker id must not take over the log
+    assert create_snapshotter(MemoryRoomStore(), path=path) is None
+    first.close()
+    assert create_snapshotter(MemoryRoomStore(), path=path) is not None
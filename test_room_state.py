@@ -0,0 +1,90 @@
+from room_state import PlayerState, Room
+
+
+def make_room():
+    return Room('ABC123', 1, 'rabbit', players=[
+        PlayerState(1, 'alice', is_host=True),
+        PlayerState(2, 'bob'),
+        PlayerState(3, 'carol'),
+    ])
+
+
+def test_player_lookup_and_turns():
+    room = make_room()
+    assert room.get_player(2).name == 'bob'
+    assert room.get_player(99) is None
+    assert room.current_player.id == 1
+    room.advance_turn()
+    room.advance_turn()
+    room.advance_turn()
+    assert room.current_player.id == 1
+
+
+def test_view_reflects_mutations():
+    room = make_room()
+    player = room.get_player(1)
+    player.record_word(3)
+    room.play_word('wild')
+    room.play_word('rabbit')
+    room.advance_turn()
+    view = room.to_dict()
+    assert view['current_word'] == 'rabbit'
+    assert view['used_words'] == ['rabbit', 'wild']
+    assert view['turn_index'] == 1
+    assert view['players'][0] == {'id': 1, 'name': 'alice', 'score': 3, 'streak': 1, 'is_host': True}
+    player.reset_streak()
+    room.set_paused(True)
+    view = room.to_dict()
+    assert view['players'][0]['streak'] == 0
+    assert view['is_paused'] is True
+    assert Room.from_dict('ABC123', view).to_dict() == view
+
+
+def test_remove_player_keeps_turn_order():
+    room = make_room()
+    room.advance_turn()
+    room.advance_turn()
+    assert room.current_player.name == 'carol'
+    room.remove_player(1)
+    assert room.current_player.name == 'carol'
+    assert [p['name'] for p in room.to_dict()['players']] == ['bob', 'carol']
+    room.remove_player(3)
+    assert room.current_player.name == 'bob'
+    assert room.remove_player(3) is None
+    room.remove_player(2)
+    assert room.current_player is None and len(room) == 0
+
+
+def test_slots_reject_unknown_attributes():
+    for instance in (make_room(), PlayerState(1, 'alice')):
+        try:
+            instance.extra = 1
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"{type(instance).__name__} should not have a __dict__")
+
+
+def test_delta_carries_only_changes_and_sequence():
+    room = make_room()
+    assert room.seq == 0
+    room.play_word('wild')
+    first = room.delta(word='wild', turn_index=room.turn_index)
+    second = room.delta(is_paused=True)
+    assert first == {'word': 'wild', 'turn_index': 0, 'seq': 1}
+    assert second == {'is_paused': True, 'seq': 2}
+    assert room.to_dict()['seq'] == 2
+    assert 'used_words' not in first
+
+
+def test_pause_stops_and_resume_shifts_turn_deadline():
+    room = make_room()
+    room.set_turn_deadline(130.0)
+    room.set_paused(True, now=110.0)
+    assert room.turn_deadline is None and room.turn_remaining == 20.0
+    room.set_paused(True, now=115.0)
+    assert room.turn_remaining == 20.0
+    room.set_paused(False, now=500.0)
+    assert room.turn_deadline == 520.0 and room.turn_remaining is None
+    restored = Room.from_dict('ABC123', room.to_dict())
+    assert restored.turn_deadline == 520.0
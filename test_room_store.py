@@ -0,0 +1,165 @@
+import threading
+import time
+
+from room_state import PlayerState, Room
+from room_store import MemoryRoomStore, SQLiteRoomStore, create_room_store
+
+
+def make_room(code='ABC123'):
+    return Room(code, 7, 'rabbit', players=[PlayerState(1, 'alice', is_host=True), PlayerState(2, 'bob')])
+
+
+def test_create_room_store_defaults_to_memory(tmp_path):
+    assert isinstance(create_room_store(''), MemoryRoomStore)
+    assert isinstance(create_room_store(f"sqlite:///{tmp_path / 'rooms.db'}"), SQLiteRoomStore)
+
+
+def test_memory_store_keeps_live_rooms():
+    store = MemoryRoomStore()
+    room = make_room()
+    assert store.add(room)
+    assert not store.add(make_room())
+    with store.transaction('ABC123') as loaded:
+        assert loaded is room
+        loaded.play_word('wild')
+    assert store.get('ABC123').current_word == 'wild'
+    store.delete('ABC123')
+    assert 'ABC123' not in store
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'rooms.db')
+    worker_a, worker_b = SQLiteRoomStore(path), SQLiteRoomStore(path)
+    assert worker_a.add(make_room())
+    assert not worker_b.add(make_room())
+
+    with worker_b.transaction('ABC123') as room:
+        room.add_player(PlayerState(3, 'carol'))
+        room.get_player(1).record_word(2)
+        room.play_word('wild')
+        room.delta(word='wild')
+
+    room = worker_a.get('ABC123')
+    assert [p.name for p in room.players] == ['alice', 'bob', 'carol']
+    assert room.get_player(1).score == 2
+    assert room.used_words == {'rabbit': None, 'wild': None}
+    assert room.seq == 1
+    assert worker_a.codes() == ['ABC123']
+
+
+def test_sqlite_transaction_rolls_back_on_error(tmp_path):
+    store = SQLiteRoomStore(str(tmp_path / 'rooms.db'))
+    store.add(make_room())
+    try:
+        with store.transaction('ABC123') as room:
+            room.play_word('wild')
+            raise ValueError("handler failed")
+    except ValueError:
+        pass
+    assert store.get('ABC123').current_word == 'rabbit'
+
+
+def test_sqlite_delete_inside_transaction_is_not_saved_back(tmp_path):
+    store = SQLiteRoomStore(str(tmp_path / 'rooms.db'))
+    store.add(make_room())
+    with store.transaction('ABC123') as room:
+        room.remove_player(1)
+        room.remove_player(2)
+        store.delete('ABC123')
+    assert 'ABC123' not in store
+    # A later room under the same code is saved as usual
+    store.add(make_room())
+    with store.transaction('ABC123') as room:
+        room.play_word('wild')
+    assert store.get('ABC123').current_word == 'wild'
+
+
+def test_sqlite_transactions_do_not_lose_updates(tmp_path):
+    path = str(tmp_path / 'rooms.db')
+    SQLiteRoomStore(path).add(make_room())
+
+    def worker():
+        store = SQLiteRoomStore(path)
+        for _ in range(25):
+            with store.transaction('ABC123') as room:
+                room.get_player(1).record_word(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert SQLiteRoomStore(path).get('ABC123').get_player(1).score == 100
+
+
+def test_memory_store_serializes_events_per_room():
+    store = MemoryRoomStore()
+    rooms, moves = 8, 50
+    for index in range(rooms):
+        store.add(make_room(f'ROOM{index:02d}'))
+
+    def play(code, player_id):
+        # Two threads per player, like a double-submitted word racing itself
+        while True:
+            with store.transaction(code) as room:
+                if room.seq >= 2 * moves:
+                    return
+                if room.current_player.id == player_id:
+                    # Yield between the turn check and the update to invite races
+                    time.sleep(0.0001)
+                    room.get_player(player_id).record_word(1)
+                    room.play_word(f'{code}-{player_id}-{room.seq}')
+                    room.delta()
+                    room.advance_turn()
+            time.sleep(0)
+
+    threads = [threading.Thread(target=play, args=(f'ROOM{index:02d}', player_id))
+               for index in range(rooms) for player_id in (1, 1, 2, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index in range(rooms):
+        room = store.get(f'ROOM{index:02d}')
+        assert room.seq == 2 * moves
+        assert [player.score for player in room.players] == [moves, moves]
+        played = room.to_dict()['used_words'][1:]
+        # Turns strictly alternate: alice, bob, alice, ...
+        assert [word.split('-')[1] for word in played] == ['1', '2'] * moves
+
+
+def test_sqlite_read_does_not_wait_for_a_writer(tmp_path):
+    path = str(tmp_path / 'rooms.db')
+    store = SQLiteRoomStore(path)
+    store.add(make_room())
+    writer = SQLiteRoomStore(path)
+    with writer.transaction('ABC123') as room:
+        room.play_word('wild')
+        start = time.perf_counter()
+        with store.read('ABC123') as seen:
+            # Readers see the last committed state without taking the write lock
+            assert seen.current_word == 'rabbit'
+        assert time.perf_counter() - start < 1.0
+    assert store.get('ABC123').current_word == 'wild'
+
+
+def test_sqlite_statements_go_through_run_blocking(tmp_path):
+    calls = []
+
+    def run_blocking(func, *args):
+        calls.append(threading.current_thread().name)
+        result = []
+        worker = threading.Thread(target=lambda: result.append(func(*args)), name='executor')
+        worker.start()
+        worker.join()
+        return result[0]
+
+    store = SQLiteRoomStore(str(tmp_path / 'rooms.db'), run_blocking=run_blocking)
+    store.add(make_room())
+    with store.transaction('ABC123') as room:
+        room.play_word('wild')
+    with store.read('ABC123') as room:
+        assert room.current_word == 'wild'
+    # add, load for update, commit, read
+    assert len(calls) == 4
@@ -0,0 +1,87 @@
+import time
+
+from session_registry import Seat, SessionRegistry
+
+
+def test_disconnect_parks_seat_until_grace_expires(clock):
+    registry = SessionRegistry(grace_seconds=10, clock=clock)
+    registry.bind('sid-1', 'ROOM01', 1)
+    assert registry.lookup('sid-1') == Seat('ROOM01', 1)
+
+    assert registry.disconnect('sid-1') is None
+    assert registry.is_parked('ROOM01', 1)
+    clock.now = 9.9
+    assert registry.expired() == []
+    clock.now = 10
+    assert registry.expired() == [Seat('ROOM01', 1)]
+    assert registry.sid_for('ROOM01', 1) is None
+
+
+def test_reconnect_within_grace_keeps_seat(clock):
+    registry = SessionRegistry(grace_seconds=10, clock=clock)
+    registry.bind('sid-1', 'ROOM01', 1)
+    registry.disconnect('sid-1')
+    registry.bind('sid-2', 'ROOM01', 1)
+    clock.now = 60
+    assert registry.expired() == []
+    assert registry.sid_for('ROOM01', 1) == 'sid-2'
+    # A late disconnect of the replaced socket must not park the new one
+    assert registry.disconnect('sid-1') is None
+    assert not registry.is_parked('ROOM01', 1)
+
+
+def test_zero_grace_releases_immediately():
+    registry = SessionRegistry(grace_seconds=0)
+    registry.bind('sid-1', 'ROOM01', 1)
+    assert registry.disconnect('sid-1') == Seat('ROOM01', 1)
+    assert registry.disconnect('sid-1') is None
+    assert registry.disconnect('unknown') is None
+
+
+def test_100k_simulated_connections(clock):
+    registry = SessionRegistry(grace_seconds=5, clock=clock)
+    connections = 100_000
+
+    start = time.perf_counter()
+    for i in range(connections):
+        registry.bind(f'sid-{i}', f'R{i // 4:05d}', i)
+    for i in range(connections):
+        clock.now = i / connections
+        assert registry.disconnect(f'sid-{i}') is None
+    # Half reconnect before their grace period ends
+    for i in range(0, connections, 2):
+        registry.bind(f'new-{i}', f'R{i // 4:05d}', i)
+    clock.now = 10
+    expired = registry.expired()
+    elapsed = time.perf_counter() - start
+
+    assert len(expired) == connections // 2
+    assert all(seat.player_id % 2 == 1 for seat in expired)
+    assert len(registry) == connections // 2
+    # Linear in the number of connections; a per-disconnect scan would take minutes
+    assert elapsed < 5
+
+
+def test_parked_seat_without_socket_expires_unless_rejoined(clock):
+    registry = SessionRegistry(grace_seconds=10, clock=clock)
+    registry.park('ROOM01', 1)
+    registry.park('ROOM01', 2)
+    registry.bind('sid-2', 'ROOM01', 2)
+    clock.now = 10
+    assert registry.expired() == [Seat('ROOM01', 1)]
+    assert registry.lookup('sid-2') == Seat('ROOM01', 2)
+
+
+def test_rebinding_a_socket_drops_its_old_seat(clock):
+    registry = SessionRegistry(grace_seconds=10, clock=clock)
+    assert registry.bind('sid-1', 'ROOM01', 1) is None
+    assert registry.bind('sid-1', 'ROOM01', 1) is None
+    assert registry.bind('sid-1', 'ROOM02', 7) == Seat('ROOM01', 1)
+    assert registry.sid_for('ROOM01', 1) is None
+    assert registry.lookup('sid-1') == Seat('ROOM02', 7)
+    assert registry.disconnect('sid-1') is None
+    assert registry.is_parked('ROOM02', 7) and not registry.is_parked('ROOM01', 1)
+    # The new seat's owner is untouched when another socket rebinds away from it
+    registry.bind('sid-2', 'ROOM02', 7)
+    assert registry.bind('sid-3', 'ROOM03', 9) is None
+    assert registry.sid_for('ROOM02', 7) == 'sid-2'
@@ -0,0 +1,98 @@
+import json
+
+from spectators import SpectatorHub
+
+
+class FakeRoom:
+    def __init__(self):
+        self.seq = 0
+        self.serialized = 0
+
+    def load(self, room_code, known_seq):
+        if self.seq is None:
+            return None
+        if self.seq == known_seq:
+            return self.seq, None
+        self.serialized += 1
+        return self.seq, json.dumps({'room_code': room_code, 'seq': self.seq})
+
+
+def make_hub(room, backlogs=None):
+    sent = []
+    backlogs = backlogs if backlogs is not None else {}
+    hub = SpectatorHub(room.load, lambda *args: sent.append(args), lambda sid: backlogs.get(sid, 0), max_backlog=4)
+    return hub, sent
+
+
+def test_moves_between_ticks_coalesce_into_one_frame():
+    room = FakeRoom()
+    hub, sent = make_hub(room)
+    for index in range(50):
+        hub.watch(f'sid-{index}', 'ROOM01', seq=0)
+    for _ in range(10):
+        room.seq += 1
+    assert hub.pump() == 1
+    assert room.serialized == 1
+    event, payload, sids = sent[0]
+    assert event == 'spectator_frame'
+    assert sorted(sids) == sorted(f'sid-{index}' for index in range(50))
+    assert json.loads(payload)['seq'] == 10
+    assert hub.stats()['deliveries'] == 50
+
+
+def test_unchanged_room_is_not_serialized_again():
+    room = FakeRoom()
+    hub, sent = make_hub(room)
+    hub.watch('sid-1', 'ROOM01', seq=0)
+    assert hub.pump() == 0
+    room.seq = 1
+    hub.pump()
+    hub.pump()
+    assert room.serialized == 1
+    assert len(sent) == 1
+
+
+def test_slow_spectator_is_skipped_then_catches_up():
+    room = FakeRoom()
+    backlogs = {'slow': 10}
+    hub, sent = make_hub(room, backlogs)
+    hub.watch('fast', 'ROOM01', seq=0)
+    hub.watch('slow', 'ROOM01', seq=0)
+    room.seq = 1
+    hub.pump()
+    assert sent[-1][2] == ['fast']
+    assert hub.stats()['dropped'] == 1
+
+    room.seq = 2
+    backlogs['slow'] = 0
+    hub.pump()
+    assert sorted(sent[-1][2]) == ['fast', 'slow']
+    # Only the slow spectator is behind; the fast one is skipped
+    hub.watch('late', 'ROOM01', seq=2)
+    room.seq = 3
+    backlogs['fast'] = 10
+    hub.pump()
+    assert sorted(sent[-1][2]) == ['late', 'slow']
+    backlogs['fast'] = 0
+    hub.pump()
+    assert sent[-1][2] == ['fast']
+
+
+def test_closed_room_ends_spectating():
+    room = FakeRoom()
+    hub, sent = make_hub(room)
+    hub.watch('sid-1', 'ROOM01', seq=0)
+    room.seq = None
+    hub.pump()
+    assert sent == [('spectate_ended', {'room_code': 'ROOM01'}, ['sid-1'])]
+    assert len(hub) == 0
+
+
+def test_watching_another_room_moves_the_spectator():
+    room = FakeRoom()
+    hub, _ = make_hub(room)
+    hub.watch('sid-1', 'ROOM01')
+    hub.watch('sid-1', 'ROOM02')
+    assert hub.stats()['rooms'] == 1
+    assert hub.unwatch('sid-1') == 'ROOM02'
+    assert hub.unwatch('sid-1') is None
@@ -0,0 +1,82 @@
+from timer_wheel import TimerWheel
+
+
+def run_until(wheel, clock, until, step=0.1):
+    while clock.now < until:
+        clock.now = round(clock.now + step, 6)
+        wheel.advance()
+
+
+def test_timers_fire_in_order_and_never_early(clock):
+    wheel = TimerWheel(tick_seconds=0.1, slots=8, clock=clock)
+    fired = []
+    wheel.schedule('a', 0.3, lambda: fired.append(('a', clock.now)))
+    wheel.schedule('b', 0.05, lambda: fired.append(('b', clock.now)))
+    # Longer than one trip around the 8-slot wheel
+    wheel.schedule('c', 2.0, lambda: fired.append(('c', clock.now)))
+    run_until(wheel, clock, 3)
+    assert [key for key, _ in fired] == ['b', 'a', 'c']
+    assert fired[0][1] >= 0.05 and fired[1][1] >= 0.3 and fired[2][1] >= 2.0
+    assert fired[2][1] < 2.2
+    assert len(wheel) == 0
+
+
+def test_reschedule_and_cancel_replace_timers(clock):
+    wheel = TimerWheel(tick_seconds=0.1, slots=16, clock=clock)
+    fired = []
+    wheel.schedule('room', 0.5, lambda: fired.append('first'))
+    wheel.schedule('room', 1.0, lambda: fired.append('second'))
+    wheel.schedule('other', 0.5, lambda: fired.append('other'))
+    assert wheel.cancel('other')
+    assert not wheel.cancel('missing')
+    run_until(wheel, clock, 2)
+    assert fired == ['second']
+
+
+def test_callback_errors_do_not_stop_the_wheel(clock):
+    wheel = TimerWheel(tick_seconds=0.1, clock=clock)
+    fired = []
+    wheel.schedule('bad', 0.1, lambda: 1 / 0)
+    wheel.schedule('good', 0.1, lambda: fired.append('good'))
+    run_until(wheel, clock, 0.5)
+    assert fired == ['good']
+
+
+def test_tens_of_thousands_of_rooms(clock):
+    wheel = TimerWheel(tick_seconds=0.1, slots=512, clock=clock)
+    fired = []
+    rooms = 50_000
+    for room in range(rooms):
+        wheel.schedule(room, 30 + (room % 100) / 10, lambda room=room: fired.append(room))
+    # Half the rooms move on to a new turn before their deadline
+    for room in range(0, rooms, 2):
+        wheel.schedule(room, 60, lambda room=room: fired.append(-room))
+    run_until(wheel, clock, 45)
+    assert len(fired) == rooms // 2
+    assert all(room % 2 == 1 for room in fired)
+    assert len(wheel) == rooms // 2
+
+
+def test_idle_gap_before_first_schedule_does_not_fire_early(clock):
+    wheel = TimerWheel(tick_seconds=0.1, slots=8, clock=clock)
+    fired = []
+    clock.now = 100
+    wheel.schedule('room', 30, lambda: fired.append(clock.now))
+    clock.now = 100.1
+    wheel.advance()
+    assert fired == []
+    run_until(wheel, clock, 131)
+    assert len(fired) == 1 and 130 <= fired[0] < 130.2
+
+
+def test_lagging_driver_never_fires_before_the_deadline(clock):
+    wheel = TimerWheel(tick_seconds=0.1, slots=8, clock=clock)
+    fired = []
+    wheel.schedule('other', 50, lambda: None)
+    clock.now = 20
+    # The driver has not run for 20s when the next turn is scheduled
+    wheel.schedule('room', 1.0, lambda: fired.append(clock.now))
+    wheel.advance()
+    assert fired == []
+    run_until(wheel, clock, 22)
+    assert len(fired) == 1 and 21 <= fired[0] < 21.2
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+import wire_format
+from wire_format import WordTable, decode, encode, negotiate
+
+
+TABLE = WordTable(['tree', 'forest', 'leaf', 'river'])
+
+
+def test_round_trip_preserves_game_events():
+    payload = {
+        'room_code': 'AB12CD',
+        'seq': 1234,
+        'game_state': {
+            'players': [{'id': 7, 'name': 'Ana', 'score': 63, 'streak': 64, 'is_host': True}],
+            'current_word': 'forest',
+            'used_words': ['tree', 'forest', 'unlisted'],
+            'turn_deadline': 1760000000.25,
+            'turn_remaining': None,
+            'is_paused': False,
+        },
+        'strength': -0.5,
+        'offset': -300,
+        'custom key': ['ünïcode', 3.0],
+    }
+    assert decode(encode(payload, TABLE), lambda version: TABLE) == payload
+
+
+def test_words_and_keys_are_interned():
+    data = encode({'used_words': ['tree', 'forest', 'leaf']}, TABLE)
+    header = len(encode(None, TABLE)) - 1
+    # Header + map (2) + key (1) + list (2) + three two-byte word refs
+    assert len(data) == header + 11
+    assert b'tree' not in data
+
+
+def test_decode_uses_the_table_for_the_encoded_version():
+    seen = []
+    data = encode({'word': 'river'}, TABLE)
+    decode(data, lambda version: seen.append(version) or TABLE)
+    assert seen == [TABLE.version]
+
+
+def test_table_version_depends_only_on_the_words():
+    assert WordTable(['river', 'leaf', 'tree', 'forest', 'tree']).version == TABLE.version
+    assert WordTable(['tree', 'forest', 'leaf']).version != TABLE.version
+
+
+def test_unsupported_version_and_values_are_rejected():
+    with pytest.raises(ValueError):
+        decode(b'\x09\x01\x00')
+    with pytest.raises(TypeError):
+        encode({'when': object()}, TABLE)
+
+
+def test_negotiate_defaults_to_json():
+    assert negotiate(None) == wire_format.WIRE_JSON
+    assert negotiate({'wire': 'msgpack'}) == wire_format.WIRE_JSON
+    assert negotiate({'wire': 'binary'}) == wire_format.WIRE_BINARY
+
+
+def test_word_table_is_shared_by_snapshots_with_the_same_words():
+    def snapshot(version, words):
+        return SimpleNamespace(version=version, lexicon=SimpleNamespace(words=words),
+                               graph=SimpleNamespace(words=()))
+
+    first = wire_format.word_table(snapshot(-10, ['tree', 'leaf']))
+    # Another process, or a reload, numbers its snapshot differently
+    assert wire_format.word_table(snapshot(-20, ['leaf', 'tree'])) is first
+    assert wire_format.cached_table(first.version) is first
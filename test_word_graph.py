@@ -0,0 +1,32 @@
+import pytest
+
+from game_config import WORD_CATEGORIES, OPPOSITES
+from word_graph import WordGraph, CATEGORY_WEIGHT, OPPOSITE_WEIGHT, MAX_WEIGHT, read_pair_file
+
+
+def test_category_and_opposite_edges():
+    graph = WordGraph.build(WORD_CATEGORIES, OPPOSITES)
+    assert graph.strength('tree', 'River') == CATEGORY_WEIGHT
+    assert graph.strength('hot', 'cold') == pytest.approx(OPPOSITE_WEIGHT)
+    assert graph.strength('cold', 'hot') == pytest.approx(OPPOSITE_WEIGHT)
+    assert graph.are_related('hot', 'cold')
+    assert not graph.are_related('tree', 'lion')
+    assert graph.strength('tree', 'notaword') == 0.0
+
+
+def test_weights_from_several_sources_are_capped():
+    # 'happy' and 'sad' share the emotions category and are opposites
+    graph = WordGraph.build(WORD_CATEGORIES, OPPOSITES)
+    assert graph.strength('happy', 'sad') == MAX_WEIGHT
+
+
+def test_imported_pairs_and_neighbors(tmp_path):
+    pairs_file = tmp_path / 'pairs.tsv'
+    pairs_file.write_text("lion\ttree\t0.25\n# comment\nlion\tsavanna\n", encoding='utf-8')
+    graph = WordGraph.build({}, None, read_pair_file(str(pairs_file)))
+    assert graph.strength('lion', 'tree') == 0.25
+    assert graph.neighbors('lion') == [('savanna', 1.0), ('tree', 0.25)]
+    assert graph.neighbors('lion', limit=1) == [('savanna', 1.0)]
+    assert graph.bulk_strength('lion', ['tree', 'savanna', 'nope']) == [0.25, 1.0, 0.0]
+    assert graph.bulk_neighbors(['Tree'])['tree'] == [('lion', 0.25)]
+    assert graph.edge_count == 2
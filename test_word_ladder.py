@@ -0,0 +1,61 @@
+import random
+
+from word_ladder import (DEFAULT_MIN_STEPS, DEFAULT_WORD_LENGTH, LadderGraph, WordLadderEngine,
+                         load_ladder_words)
+
+WORDS = ['cat', 'cot', 'cog', 'dog', 'dot', 'cut', 'hat', 'hot', 'bird', 'word', 'ward', 'warm', 'worm']
+
+
+def test_wildcard_buckets():
+    graph = LadderGraph(3, ['cat', 'cot', 'cut', 'dog'])
+    cat = graph.ids['cat']
+    assert sorted(graph.words[n] for n in graph.neighbors(cat)) == ['cot', 'cut']
+    assert list(graph.neighbors(graph.ids['dog'])) == []
+
+
+def test_valid_moves():
+    engine = WordLadderEngine(WORDS)
+    assert engine.is_valid_move('cat', 'Cot')
+    assert not engine.is_valid_move('cat', 'dog')
+    assert not engine.is_valid_move('cat', 'cab')
+    assert not engine.is_valid_move('cat', 'cat')
+    assert not engine.is_valid_move('cat', 'bird')
+
+
+def test_shortest_path_is_bidirectional_bfs():
+    engine = WordLadderEngine(WORDS)
+    assert engine.shortest_path('cat', 'dog') == ['cat', 'cot', 'cog', 'dog'] or \
+        engine.shortest_path('cat', 'dog') == ['cat', 'cot', 'dot', 'dog']
+    assert engine.shortest_path('word', 'warm') in (['word', 'ward', 'warm'], ['word', 'worm', 'warm'])
+    assert engine.shortest_path('cat', 'dog', max_steps=2) is None
+    assert engine.shortest_path('cat', 'bird') is None
+    assert engine.shortest_path('cat', 'cat') == ['cat']
+
+
+def test_generate_puzzle_is_solvable():
+    engine = WordLadderEngine(WORDS)
+    puzzle = engine.generate_puzzle(length=3, min_steps=2, max_steps=3, rng=random.Random(1))
+    assert puzzle is not None
+    assert 2 <= puzzle['par'] <= 3
+    solution = puzzle['solution']
+    assert solution[0] == puzzle['start'] and solution[-1] == puzzle['target']
+    assert all(engine.is_valid_move(a, b) for a, b in zip(solution, solution[1:]))
+    assert engine.generate_puzzle(length=9) is None
+
+
+def test_default_words_generate_puzzles(monkeypatch):
+    monkeypatch.delenv('WORDWEAVER_LADDER_WORDS', raising=False)
+    engine = WordLadderEngine(load_ladder_words())
+    rng = random.Random(7)
+    for length in (3, 4, 5):
+        for _ in range(5):
+            puzzle = engine.generate_puzzle(length, rng=rng)
+            assert puzzle is not None
+            solution = puzzle['solution']
+            assert len(solution) - 1 == puzzle['par'] >= DEFAULT_MIN_STEPS
+            assert all(engine.is_valid_move(a, b) for a, b in zip(solution, solution[1:]))
+
+
+def test_live_snapshot_serves_default_length():
+    from lexicon_manager import lexicon_manager
+    assert lexicon_manager.current().ladder.generate_puzzle(DEFAULT_WORD_LENGTH) is not None
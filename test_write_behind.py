@@ -0,0 +1,147 @@
+import threading
+import time
+
+from write_behind import WriteBehindQueue
+
+
+class RecordingWriter:
+    def __init__(self, gate=None):
+        self.batches = []
+        self.gate = gate
+        self.entered = threading.Event()
+
+    def __call__(self, word_chains, players):
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait()
+        self.batches.append((list(word_chains), list(players)))
+
+    @property
+    def word_chains(self):
+        return [row for chains, _ in self.batches for row in chains]
+
+
+def test_flushes_on_interval_and_coalesces_player_updates():
+    writer = RecordingWriter()
+    queue = WriteBehindQueue(flush_interval_ms=20, batch_size=1000, writer=writer)
+    queue.record_word_chain(1, 'tree', 'forest', 2, player_id=7)
+    queue.record_player_stats(7, 2, 1)
+    queue.record_player_stats(7, 5, 2)
+    deadline = time.time() + 2
+    while not writer.batches and time.time() < deadline:
+        time.sleep(0.01)
+    queue.close()
+    assert writer.word_chains[0]['word'] == 'tree'
+    players = [player for _, batch in writer.batches for player in batch]
+    assert [(p['id'], p['score'], p['streak']) for p in players] == [(7, 5, 2)]
+
+
+def test_batch_size_triggers_early_flush():
+    writer = RecordingWriter()
+    queue = WriteBehindQueue(flush_interval_ms=10_000, batch_size=10, writer=writer)
+    for i in range(25):
+        queue.record_word_chain(1, f'word{i}', None, 1)
+    deadline = time.time() + 2
+    while len(writer.word_chains) < 20 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(writer.word_chains) >= 20
+    assert all(len(chains) <= 10 for chains, _ in writer.batches)
+    queue.close()
+    assert [row['word'] for row in writer.word_chains] == [f'word{i}' for i in range(25)]
+
+
+def test_backpressure_blocks_producers_when_full():
+    gate = threading.Event()
+    writer = RecordingWriter(gate)
+    queue = WriteBehindQueue(flush_interval_ms=1, batch_size=100, max_pending=4, writer=writer)
+    # Park the flusher inside a write, then fill the queue behind it
+    queue.record_word_chain(1, 'word0', None, 1)
+    assert writer.entered.wait(2)
+    for i in range(1, 5):
+        queue.record_word_chain(1, f'word{i}', None, 1)
+
+    finished = threading.Event()
+
+    def producer():
+        queue.record_word_chain(1, 'word5', None, 1)
+        finished.set()
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    assert not finished.wait(0.2)
+    assert queue.blocked_puts == 1
+    gate.set()
+    assert finished.wait(2)
+    thread.join()
+    queue.close()
+    assert [row['word'] for row in writer.word_chains] == [f'word{i}' for i in range(6)]
+
+
+def test_close_flushes_and_failed_batches_are_retried():
+    attempts = []
+
+    def flaky_writer(word_chains, players):
+        attempts.append(len(word_chains))
+        if len(attempts) == 1:
+            raise RuntimeError("database is locked")
+
+    queue = WriteBehindQueue(flush_interval_ms=10_000, writer=flaky_writer)
+    queue.record_word_chain(1, 'tree', None, 1)
+    queue.close()
+    assert attempts == [1, 1]
+    stats = queue.stats()
+    assert stats['failures'] == 1 and stats['rows_written'] == 1 and stats['pending'] == 0
+    assert stats['flush_ms_max'] >= stats['flush_ms_p50'] >= 0
+
+
+def test_failing_batch_backs_off_then_is_dead_lettered():
+    attempts = []
+
+    def broken_writer(word_chains, players):
+        attempts.append(time.monotonic())
+        raise RuntimeError("cannot schedule new futures after interpreter shutdown")
+
+    queue = WriteBehindQueue(flush_interval_ms=1, writer=broken_writer, max_attempts=3, retry_seconds=0.05)
+    queue.record_word_chain(1, 'tree', None, 1)
+    queue.record_word_chain(1, 'leaf', None, 1)
+    queue.close(timeout=5)
+    # Three whole-batch attempts, then each row once on its own
+    assert len(attempts) == 5
+    assert attempts[1] - attempts[0] >= 0.05 and attempts[2] - attempts[1] >= 0.1
+    stats = queue.stats()
+    assert stats['dead_lettered'] == 2 and stats['pending'] == 0
+    assert [row['word'] for row in queue.dead_letters[0][0]] == ['tree', 'leaf']
+
+
+def test_only_rows_that_fail_on_their_own_are_dead_lettered():
+    written = []
+
+    def picky_writer(word_chains, players):
+        if any(row['word'] == 'bad' for row in word_chains):
+            raise RuntimeError("FOREIGN KEY constraint failed")
+        written.extend(row['word'] for row in word_chains)
+
+    queue = WriteBehindQueue(flush_interval_ms=1, batch_size=100, writer=picky_writer,
+                             max_attempts=2, retry_seconds=0.01)
+    words = [f'word{i}' for i in range(50)]
+    for word in words[:20] + ['bad'] + words[20:]:
+        queue.record_word_chain(1, word, None, 1)
+    queue.record_player_stats(7, 5, 2)
+    queue.close(timeout=5)
+    stats = queue.stats()
+    assert sorted(written) == sorted(words)
+    assert stats['dead_lettered'] == 1 and stats['rows_written'] == 51
+    assert [row['word'] for row in queue.dead_letters[0][0]] == ['bad']
+    assert queue.dead_letters[0][1] == []
+
+
+def test_stale_player_stats_do_not_overwrite_newer_ones():
+    from datetime import datetime, timedelta
+
+    writer = RecordingWriter()
+    queue = WriteBehindQueue(flush_interval_ms=10_000, writer=writer)
+    now = datetime.utcnow()
+    queue.record_player_stats(7, 5, 2, now)
+    queue.record_player_stats(7, 3, 1, now - timedelta(seconds=1))
+    queue.close()
+    assert [(p['score'], p['streak']) for _, batch in writer.batches for p in batch] == [(5, 2)]
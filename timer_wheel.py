@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_SECONDS = 0.1
+DEFAULT_SLOTS = 512
+# Float error allowed when checking a due timer against its deadline
+DEADLINE_SLACK = 1e-9
+
+
+class _Timer:
+    __slots__ = ('key', 'slot', 'rounds', 'callback', 'deadline')
+
+    def __init__(self, key, callback, deadline):
+        self.key = key
+        self.slot = 0
+        self.rounds = 0
+        self.callback = callback
+        self.deadline = deadline
+
+
+class TimerWheel:
+    """Hashed timing wheel: O(1) schedule and cancel, one driver for every timer
+
+    Time is cut into ticks; a timer due in n ticks goes into slot
+    (now + n) % slots with n // slots full turns still to wait. Each tick the
+    driver visits one slot, fires the timers whose rounds are used up and
+    decrements the rest. Timers are keyed, so scheduling a key again replaces
+    its previous timer, which is how a room moves on to the next turn.
+    """
+
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_SLOTS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.tick_seconds = tick_seconds
+        self.clock = clock
+        self._slots: List[Dict[Hashable, _Timer]] = [{} for _ in range(slots)]
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._tick = 0
+        self._last_tick_time = clock()
+        self._lock = threading.Lock()
+        self._running = False
+        self.fired = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[[], Any]) -> None:
+        """Run `callback` once `delay` seconds have passed, replacing any timer for `key`"""
+        with self._lock:
+            now = self.clock()
+            self._remove(key)
+            if not self._timers:
+                self._skip_idle(now)
+            timer = _Timer(key, callback, now + delay)
+            self._insert(timer)
+            self._timers[key] = timer
+
+    def _insert(self, timer: _Timer) -> None:
+        # Count ticks from the wheel's own position, which may trail the clock
+        # while the driver catches up, and round up: never fire early
+        ticks = max(1, int(-(-(timer.deadline - self._last_tick_time) // self.tick_seconds)))
+        timer.slot = (self._tick + ticks) % len(self._slots)
+        timer.rounds = (ticks - 1) // len(self._slots)
+        self._slots[timer.slot][timer.key] = timer
+
+    def _skip_idle(self, now: float) -> None:
+        """Jump an empty wheel to the clock rather than walking every idle tick later"""
+        elapsed = int((now - self._last_tick_time) // self.tick_seconds)
+        if elapsed > 0:
+            self._tick += elapsed
+            self._last_tick_time += elapsed * self.tick_seconds
+
+    def cancel(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del self._slots[timer.slot][key]
+        return True
+
+    def advance(self) -> int:
+        """Process every tick that has elapsed on the clock; returns how many timers fired"""
+        now = self.clock()
+        due = []
+        with self._lock:
+            if not self._timers:
+                self._skip_idle(now)
+            while now - self._last_tick_time >= self.tick_seconds:
+                self._last_tick_time += self.tick_seconds
+                self._tick += 1
+                bucket = self._slots[self._tick % len(self._slots)]
+                for key, timer in list(bucket.items()):
+                    if timer.rounds:
+                        timer.rounds -= 1
+                        continue
+                    del bucket[key]
+                    if timer.deadline > now + DEADLINE_SLACK:
+                        self._insert(timer)
+                        continue
+                    del self._timers[key]
+                    due.append(timer)
+        for timer in due:
+            try:
+                timer.callback()
+            except Exception as e:
+                logger.error(f"Error in timer callback for {timer.key}: {str(e)}")
+        self.fired += len(due)
+        return len(due)
+
+    def run(self, sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Drive the wheel until stop() is called; pass socketio.sleep under gevent"""
+        self._running = True
+        while self._running:
+            sleep(self.tick_seconds)
+            self.advance()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'timers': len(self._timers),
+            'fired': self.fired,
+            'tick_seconds': self.tick_seconds,
+        }
@@ -0,0 +1,256 @@
+"""Compact binary encoding for multiplayer events.
+
+Clients opt in when they connect by passing `{'wire': 'binary'}` as the
+Socket.IO auth payload; everyone else keeps getting JSON. A binary event
+carries the same dict as its JSON twin, encoded as:
+
+    header   version byte, word table version (varint)
+    value    one tag byte, then the body for that tag
+
+Dict keys that appear in game events are sent as one-byte indexes into KEYS,
+and any string found in the lexicon's word table goes out as its id, so
+`used_words` costs a byte or two per word. Ids depend on the word table, whose
+version is a hash of its words, so every worker serving the same lexicon
+encodes with the same version; a client that has not seen that version asks
+for the table with `request_word_table`. KEYS is append-only: existing indexes
+never move.
+"""
+import hashlib
+import struct
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional
+
+WIRE_JSON = 'json'
+WIRE_BINARY = 'binary'
+FORMAT_VERSION = 1
+MAX_TABLES = 2
+
+KEYS = (
+    'room_code', 'player_id', 'game_state', 'game_id', 'players', 'id', 'name', 'score',
+    'streak', 'is_host', 'current_word', 'used_words', 'turn_index', 'round_time', 'last_update',
+    'is_paused', 'seq', 'turn_deadline', 'turn_remaining', 'player', 'word', 'corrected_from',
+    'points', 'bonus_points', 'strength', 'next_player', 'message', 'suggestion', 'player_name',
+    'spectating', 'lexicon_version', 'words', 'wire',
+)
+_KEY_IDS = {key: index + 1 for index, key in enumerate(KEYS)}
+
+# Tags; ints 0..63 are packed into the tag byte itself
+NONE, FALSE, TRUE, UINT, NINT, FLOAT, STR, WORD, LIST, MAP = range(10)
+SMALL_INT = 0x40
+SMALL_INT_MAX = 0x3F
+
+_pack_double = struct.Struct('<d').pack
+_unpack_double = struct.Struct('<d').unpack_from
+
+
+class WordTable:
+    """Ids for a set of words; id 0 is never used
+
+    `version` is derived from the words alone, so it is the same in every
+    process that builds a table from the same lexicon.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = tuple(sorted(set(words)))
+        self.ids = {word: index + 1 for index, word in enumerate(self.words)}
+        digest = hashlib.blake2b('\n'.join(self.words).encode('utf-8'), digest_size=4).digest()
+        self.version = int.from_bytes(digest, 'little')
+
+    def word_at(self, word_id: int) -> str:
+        return self.words[word_id - 1]
+
+
+# Tables by content version, newest last; clients on the previous one may still ask for it
+_tables: Dict[int, WordTable] = {}
+# This process's snapshot versions mapped to their tables, so each snapshot is hashed once
+_snapshot_tables: Dict[int, WordTable] = {}
+_tables_lock = Lock()
+
+
+def word_table(snapshot) -> WordTable:
+    """The word table for a lexicon snapshot, built once per snapshot"""
+    table = _snapshot_tables.get(snapshot.version)
+    if table is None:
+        with _tables_lock:
+            table = _snapshot_tables.get(snapshot.version)
+            if table is None:
+                table = WordTable(set(snapshot.lexicon.words) | set(snapshot.graph.words))
+                # A reload with unchanged words keeps the existing table
+                table = _tables.pop(table.version, table)
+                _tables[table.version] = table
+                while len(_tables) > MAX_TABLES:
+                    del _tables[next(iter(_tables))]
+                for version in [version for version, cached in _snapshot_tables.items()
+                                if cached.version not in _tables]:
+                    del _snapshot_tables[version]
+                _snapshot_tables[snapshot.version] = table
+    return table
+
+
+def cached_table(version: int) -> Optional[WordTable]:
+    return _tables.get(version)
+
+
+def _varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode(out: bytearray, value: Any, ids: Dict[str, int]) -> None:
+    if value is None:
+        out.append(NONE)
+    elif value is True:
+        out.append(TRUE)
+    elif value is False:
+        out.append(FALSE)
+    elif isinstance(value, int):
+        if 0 <= value <= SMALL_INT_MAX:
+            out.append(SMALL_INT | value)
+        elif value > 0:
+            out.append(UINT)
+            _varint(out, value)
+        else:
+            out.append(NINT)
+            _varint(out, -value - 1)
+    elif isinstance(value, float):
+        out.append(FLOAT)
+        out += _pack_double(value)
+    elif isinstance(value, str):
+        word_id = ids.get(value)
+        if word_id is not None:
+            out.append(WORD)
+            _varint(out, word_id)
+        else:
+            data = value.encode('utf-8')
+            out.append(STR)
+            _varint(out, len(data))
+            out += data
+    elif isinstance(value, dict):
+        out.append(MAP)
+        _varint(out, len(value))
+        for key, item in value.items():
+            key_id = _KEY_IDS.get(key)
+            if key_id is not None:
+                _varint(out, key_id)
+            else:
+                data = str(key).encode('utf-8')
+                out.append(0)
+                _varint(out, len(data))
+                out += data
+            _encode(out, item, ids)
+    elif isinstance(value, (list, tuple)):
+        out.append(LIST)
+        _varint(out, len(value))
+        for item in value:
+            _encode(out, item, ids)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} for the binary wire format")
+
+
+def encode(payload: Any, table: WordTable) -> bytes:
+    out = bytearray((FORMAT_VERSION,))
+    _varint(out, table.version)
+    _encode(out, payload, table.ids)
+    return bytes(out)
+
+
+class _Reader:
+    __slots__ = ('data', 'pos', 'table')
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.table = None
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def text(self) -> str:
+        length = self.varint()
+        start, self.pos = self.pos, self.pos + length
+        return self.data[start:self.pos].decode('utf-8')
+
+    def value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag >= SMALL_INT:
+            return tag & SMALL_INT_MAX
+        if tag == NONE:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag == UINT:
+            return self.varint()
+        if tag == NINT:
+            return -self.varint() - 1
+        if tag == FLOAT:
+            self.pos += 8
+            return _unpack_double(self.data, self.pos - 8)[0]
+        if tag == STR:
+            return self.text()
+        if tag == WORD:
+            return self.table.word_at(self.varint())
+        if tag == LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == MAP:
+            result = {}
+            for _ in range(self.varint()):
+                key_id = self.varint()
+                key = KEYS[key_id - 1] if key_id else self.text()
+                result[key] = self.value()
+            return result
+        raise ValueError(f"Unknown wire tag {tag}")
+
+
+def decode(data: bytes, tables: Callable[[int], WordTable] = cached_table) -> Any:
+    """Reference decoder; `tables` maps a word table version to its table"""
+    if data[0] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported wire format version {data[0]}")
+    reader = _Reader(data)
+    reader.pos = 1
+    reader.table = tables(reader.varint())
+    return reader.value()
+
+
+def negotiate(auth: Any) -> str:
+    """Wire format a client asked for in its connect auth payload"""
+    if isinstance(auth, dict) and auth.get('wire') == WIRE_BINARY:
+        return WIRE_BINARY
+    return WIRE_JSON
+
+
+class WireRegistry:
+    """Which sockets speak the binary format; unknown sids get JSON"""
+
+    def __init__(self):
+        self._binary = set()
+
+    def set(self, sid: str, wire: str) -> None:
+        if wire == WIRE_BINARY:
+            self._binary.add(sid)
+        else:
+            self._binary.discard(sid)
+
+    def is_binary(self, sid: Optional[str]) -> bool:
+        return sid in self._binary
+
+    def discard(self, sid: str) -> None:
+        self._binary.discard(sid)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'binary_clients': len(self._binary)}
+
+
+# Create singleton instance
+wire_registry = WireRegistry()
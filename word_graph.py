@@ -0,0 +1,161 @@
+import bisect
+import logging
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lexicon import lexicon, lexicon_tables, normalize_word
+
+logger = logging.getLogger(__name__)
+
+# Edge weights by source; weights from several sources add up to MAX_WEIGHT
+CATEGORY_WEIGHT = 0.5
+OPPOSITE_WEIGHT = 0.8
+MAX_WEIGHT = 1.0
+
+# Categories larger than this are not expanded into pairwise edges
+MAX_CLIQUE_SIZE = 2000
+
+
+def read_pair_file(path: str) -> Iterator[Tuple[str, str, float]]:
+    """Yield (word, word, weight) from a file of `word<TAB>word[<TAB>weight]` lines"""
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            weight = float(parts[2]) if len(parts) > 2 else MAX_WEIGHT
+            yield parts[0], parts[1], weight
+
+
+class WordGraph:
+    """Weighted, undirected word association graph stored as CSR arrays"""
+
+    def __init__(self, words: Tuple[str, ...], offsets: array, neighbors: array, weights: array):
+        self.words = words
+        self._ids = {word: node_id for node_id, word in enumerate(words)}
+        self._offsets = offsets
+        self._neighbors = neighbors
+        self._weights = weights
+
+    @classmethod
+    def build(cls, categories: Dict[str, Dict[str, list]],
+              opposites: Optional[Dict[str, List[str]]] = None,
+              pairs: Iterable[Tuple[str, str, float]] = ()) -> 'WordGraph':
+        """Build the graph from category co-membership, opposites and imported pairs"""
+        ids: Dict[str, int] = {}
+        edges: Dict[Tuple[int, int], float] = {}
+
+        def node(word: str) -> int:
+            word = normalize_word(word)
+            if word not in ids:
+                ids[word] = len(ids)
+            return ids[word]
+
+        def connect(a: int, b: int, weight: float) -> None:
+            if a == b:
+                return
+            key = (a, b) if a < b else (b, a)
+            edges[key] = min(MAX_WEIGHT, edges.get(key, 0.0) + weight)
+
+        for category, content in categories.items():
+            members = sorted({node(word) for word in content.get('words', []) + content.get('common_words', [])})
+            if len(members) > MAX_CLIQUE_SIZE:
+                logger.warning(f"Skipping pairwise edges for category {category} ({len(members)} words)")
+                continue
+            for position, a in enumerate(members):
+                for b in members[position + 1:]:
+                    connect(a, b, CATEGORY_WEIGHT)
+
+        for word, others in (opposites or {}).items():
+            for other in others:
+                connect(node(word), node(other), OPPOSITE_WEIGHT)
+
+        for word1, word2, weight in pairs:
+            connect(node(word1), node(word2), weight)
+
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(len(ids))]
+        for (a, b), weight in edges.items():
+            adjacency[a].append((b, weight))
+            adjacency[b].append((a, weight))
+
+        offsets = array('I', [0])
+        neighbors = array('I')
+        weights = array('f')
+        for row in adjacency:
+            row.sort()
+            neighbors.extend(neighbor for neighbor, _ in row)
+            weights.extend(weight for _, weight in row)
+            offsets.append(len(neighbors))
+
+        words = tuple(sorted(ids, key=ids.__getitem__))
+        logger.info(f"Word graph built with {len(words)} nodes and {len(edges)} edges")
+        return cls(words, offsets, neighbors, weights)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._neighbors) // 2
+
+    def node_id(self, word: str) -> int:
+        """Return the node id for a word, or -1 if it is not in the graph"""
+        return self._ids.get(normalize_word(word), -1)
+
+    def strength(self, word1: str, word2: str) -> float:
+        """Return the association weight between two words (0.0 if unrelated)"""
+        a, b = self.node_id(word1), self.node_id(word2)
+        if a < 0 or b < 0:
+            return 0.0
+        return self._edge_weight(a, b)
+
+    def _edge_weight(self, a: int, b: int) -> float:
+        start, end = self._offsets[a], self._offsets[a + 1]
+        position = bisect.bisect_left(self._neighbors, b, start, end)
+        if position < end and self._neighbors[position] == b:
+            return self._weights[position]
+        return 0.0
+
+    def are_related(self, word1: str, word2: str, threshold: float = 0.0) -> bool:
+        """Check whether two words are associated more strongly than `threshold`"""
+        return self.strength(word1, word2) > threshold
+
+    def neighbors(self, word: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return a word's neighbors ordered by descending weight"""
+        node_id = self.node_id(word)
+        if node_id < 0:
+            return []
+        start, end = self._offsets[node_id], self._offsets[node_id + 1]
+        ranked = sorted(zip(self._neighbors[start:end], self._weights[start:end]),
+                        key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.words[neighbor], weight) for neighbor, weight in ranked]
+
+    def bulk_neighbors(self, words: Iterable[str], limit: Optional[int] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """Return ranked neighbors for many words at once"""
+        return {normalize_word(word): self.neighbors(word, limit) for word in words}
+
+    def bulk_strength(self, word: str, candidates: Iterable[str]) -> List[float]:
+        """Return the association weight between `word` and each candidate"""
+        a = self.node_id(word)
+        if a < 0:
+            return [0.0 for _ in candidates]
+        results = []
+        for candidate in candidates:
+            b = self.node_id(candidate)
+            results.append(self._edge_weight(a, b) if b >= 0 else 0.0)
+        return results
+
+
+def load_word_graph():
+    """Build the graph from the lexicon's tables plus WORDWEAVER_ASSOCIATIONS_PATH pairs if set"""
+    path = os.environ.get('WORDWEAVER_ASSOCIATIONS_PATH')
+    pairs = read_pair_file(path) if path else ()
+    return WordGraph.build(*lexicon_tables(lexicon), pairs)
+
+
+# Create singleton instance
+word_graph = load_word_graph()
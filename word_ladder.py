@@ -0,0 +1,210 @@
+import logging
+import os
+import random
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lexicon import lexicon, normalize_word
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = '_'
+DEFAULT_WORD_LENGTH = 4
+DEFAULT_MIN_STEPS = 3
+DEFAULT_MAX_STEPS = 6
+GENERATION_ATTEMPTS = 50
+BUNDLED_WORDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ladder_words.txt')
+
+
+class LadderGraph:
+    """One-letter-edit graph for words of a single length, stored as wildcard buckets
+
+    Every word of length L belongs to L buckets (`c_t` holds cat, cot, cut). Bucket
+    membership lives in two flat arrays: `bucket_offsets[b]:bucket_offsets[b + 1]`
+    slices `bucket_members`, and `word_buckets[w * L + i]` is word w's bucket for position i.
+    """
+
+    def __init__(self, length: int, words: Iterable[str]):
+        self.length = length
+        self.words: Tuple[str, ...] = tuple(sorted(set(words)))
+        self.ids: Dict[str, int] = {word: word_id for word_id, word in enumerate(self.words)}
+
+        pattern_ids: Dict[str, int] = {}
+        word_buckets = array('I')
+        for word in self.words:
+            for position in range(length):
+                pattern = word[:position] + WILDCARD + word[position + 1:]
+                word_buckets.append(pattern_ids.setdefault(pattern, len(pattern_ids)))
+
+        counts = [0] * (len(pattern_ids) + 1)
+        for bucket in word_buckets:
+            counts[bucket + 1] += 1
+        offsets = array('I', counts)
+        for bucket in range(1, len(offsets)):
+            offsets[bucket] += offsets[bucket - 1]
+
+        members = array('I', bytes(4 * len(word_buckets)))
+        fill = array('I', offsets)
+        for index, bucket in enumerate(word_buckets):
+            members[fill[bucket]] = index // length
+            fill[bucket] += 1
+
+        self.bucket_offsets = offsets
+        self.bucket_members = members
+        self.word_buckets = word_buckets
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def neighbors(self, word_id: int) -> Iterable[int]:
+        """Yield ids of every word one letter away"""
+        length, offsets, members = self.length, self.bucket_offsets, self.bucket_members
+        base = word_id * length
+        for position in range(length):
+            bucket = self.word_buckets[base + position]
+            for index in range(offsets[bucket], offsets[bucket + 1]):
+                neighbor = members[index]
+                if neighbor != word_id:
+                    yield neighbor
+
+    def random_walk(self, word_id: int, steps: int, rng) -> int:
+        """Walk up to `steps` moves without revisiting a word; returns where it ends"""
+        visited = {word_id}
+        current = word_id
+        for _ in range(steps):
+            options = [neighbor for neighbor in self.neighbors(current) if neighbor not in visited]
+            if not options:
+                break
+            current = rng.choice(options)
+            visited.add(current)
+        return current
+
+    def shortest_path(self, start_id: int, target_id: int, max_steps: Optional[int] = None) -> Optional[List[int]]:
+        """Bidirectional BFS; returns the word ids from start to target, or None"""
+        if start_id == target_id:
+            return [start_id]
+        parents = [{start_id: None}, {target_id: None}]
+        frontiers = [[start_id], [target_id]]
+        steps = 0
+        while frontiers[0] and frontiers[1]:
+            if max_steps is not None and steps >= max_steps:
+                return None
+            steps += 1
+            # Always expand the smaller frontier
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            seen, other = parents[side], parents[1 - side]
+            next_frontier = []
+            for current in frontiers[side]:
+                for neighbor in self.neighbors(current):
+                    if neighbor in seen:
+                        continue
+                    seen[neighbor] = current
+                    if neighbor in other:
+                        return self._join(parents, neighbor)
+                    next_frontier.append(neighbor)
+            frontiers[side] = next_frontier
+        return None
+
+    @staticmethod
+    def _join(parents, meeting: int) -> List[int]:
+        forward, backward = parents
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+        node = backward[meeting]
+        while node is not None:
+            path.append(node)
+            node = backward[node]
+        return path
+
+
+class WordLadderEngine:
+    """Word ladder puzzles over the lexicon, one LadderGraph per word length"""
+
+    def __init__(self, words: Iterable[str]):
+        by_length: Dict[int, List[str]] = {}
+        for word in words:
+            word = normalize_word(word)
+            if word.isalpha():
+                by_length.setdefault(len(word), []).append(word)
+        self.graphs: Dict[int, LadderGraph] = {
+            length: LadderGraph(length, group) for length, group in by_length.items() if length >= 2
+        }
+        logger.info(f"Word ladder graphs built for lengths {sorted(self.graphs)}")
+
+    def is_word(self, word: str) -> bool:
+        word = normalize_word(word)
+        graph = self.graphs.get(len(word))
+        return graph is not None and word in graph.ids
+
+    def is_valid_move(self, current_word: str, next_word: str) -> bool:
+        """A move changes exactly one letter and lands on a known word"""
+        current_word, next_word = normalize_word(current_word), normalize_word(next_word)
+        if len(current_word) != len(next_word) or not self.is_word(next_word):
+            return False
+        return sum(a != b for a, b in zip(current_word, next_word)) == 1
+
+    def shortest_path(self, start: str, target: str, max_steps: Optional[int] = None) -> Optional[List[str]]:
+        start, target = normalize_word(start), normalize_word(target)
+        graph = self.graphs.get(len(start))
+        if graph is None or len(start) != len(target):
+            return None
+        start_id, target_id = graph.ids.get(start), graph.ids.get(target)
+        if start_id is None or target_id is None:
+            return None
+        path = graph.shortest_path(start_id, target_id, max_steps)
+        return [graph.words[word_id] for word_id in path] if path else None
+
+    def generate_puzzle(self, length: int = DEFAULT_WORD_LENGTH,
+                        min_steps: int = DEFAULT_MIN_STEPS,
+                        max_steps: int = DEFAULT_MAX_STEPS,
+                        rng: Optional[random.Random] = None) -> Optional[Dict[str, object]]:
+        """Pick a start/target pair whose shortest ladder has min_steps..max_steps moves"""
+        graph = self.graphs.get(length)
+        if graph is None or len(graph) < 2:
+            return None
+        rng = rng or random
+        for _ in range(GENERATION_ATTEMPTS):
+            # A random walk reaches a nearby target cheaply; the bidirectional BFS then
+            # finds the real shortest ladder, which shortcuts can make shorter than the walk
+            start_id = rng.randrange(len(graph))
+            target_id = graph.random_walk(start_id, rng.randint(min_steps, max_steps), rng)
+            path = graph.shortest_path(start_id, target_id, max_steps)
+            if not path or len(path) - 1 < min_steps:
+                continue
+            return {
+                'start': graph.words[start_id],
+                'target': graph.words[target_id],
+                'par': len(path) - 1,
+                'solution': [graph.words[word_id] for word_id in path],
+            }
+        return None
+
+
+def load_ladder_words(source_lexicon=lexicon) -> Iterable[str]:
+    """Words from WORDWEAVER_LADDER_WORDS (one per line) if set, else the bundled list plus the lexicon
+
+    The game lexicon holds too few short words to connect into ladders, so the
+    default adds BUNDLED_WORDS, a list of common 3-5 letter words.
+    """
+    path = os.environ.get('WORDWEAVER_LADDER_WORDS')
+    if path:
+        return _read_words(path)
+    words = set(source_lexicon.words)
+    try:
+        words.update(_read_words(BUNDLED_WORDS))
+    except OSError as e:
+        logger.error(f"Error loading bundled ladder words: {str(e)}")
+    return list(words)
+
+
+def _read_words(path: str) -> List[str]:
+    with open(path, encoding='utf-8') as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+# Create singleton instance
+word_ladder_engine = WordLadderEngine(load_ladder_words())
@@ -0,0 +1,289 @@
+import atexit
+import concurrent.futures.thread  # noqa: F401  Registers its exit hook before ours; see the bottom
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 50
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_PENDING = 20000
+LATENCY_WINDOW = 512
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 0.1
+RETRY_MAX_SECONDS = 5.0
+DEAD_LETTER_WINDOW = 100
+
+
+def write_batch(word_chains: List[Dict[str, Any]], players: List[Dict[str, Any]]) -> None:
+    """Bulk-insert WordChain rows and bulk-update player scores in one transaction"""
+    from db_executor import db_executor
+
+    db_executor.run(_write_batch, word_chains, players)
+
+
+def _write_batch(word_chains, players):
+    from sqlalchemy import insert, update
+
+    from app import db
+    from models import Player, WordChain
+
+    if word_chains:
+        db.session.execute(insert(WordChain), word_chains)
+    if players:
+        # Players are created when they join, so an update by primary key is the upsert
+        db.session.execute(update(Player), players)
+    db.session.commit()
+
+
+class WriteBehindQueue:
+    """Collects move and score writes and flushes them in batches on a background thread
+
+    A flush happens every `flush_interval_ms`, or sooner once `batch_size` rows
+    are waiting. Score updates for the same player coalesce, so only the latest
+    one is written. When `max_pending` rows are queued, producers block until
+    the flusher catches up, so never record while holding a room lock.
+
+    A failed batch goes back on the queue and is retried with exponential
+    backoff, which rides out a database that is briefly locked or down. After
+    `max_attempts` failures in a row the batch is written in halves, recursively,
+    so the rows that still fail on their own are isolated; only those are
+    dead-lettered (logged, counted and kept in `dead_letters`) and the rest of
+    the batch is written.
+    """
+
+    def __init__(self, flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 writer: Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], None] = write_batch,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_seconds: float = RETRY_BASE_SECONDS):
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.writer = writer
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self._attempts = 0
+        self._retry_at = 0.0
+        self._word_chains: List[Dict[str, Any]] = []
+        self._players: Dict[int, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._flush_requested = False
+        self.flushes = 0
+        self.rows_written = 0
+        self.failures = 0
+        self.blocked_puts = 0
+        self.dead_lettered = 0
+        self.dead_letters = deque(maxlen=DEAD_LETTER_WINDOW)
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def __len__(self) -> int:
+        return len(self._word_chains) + len(self._players)
+
+    def record_word_chain(self, game_id, word, previous_word, points, player_id=None, timestamp=None) -> None:
+        self._put(lambda: self._word_chains.append({
+            'game_id': game_id,
+            'word': word,
+            'previous_word': previous_word,
+            'points': points,
+            'player_id': player_id,
+            'timestamp': timestamp or datetime.utcnow(),
+        }))
+
+    def record_player_stats(self, player_id, score, streak, last_active=None) -> None:
+        row = {
+            'id': player_id,
+            'score': score,
+            'streak': streak,
+            'last_active': last_active or datetime.utcnow(),
+        }
+
+        def add():
+            queued = self._players.get(player_id)
+            # Callers record outside the room lock, so a stale update can arrive second
+            if queued is None or queued['last_active'] <= row['last_active']:
+                self._players[player_id] = row
+
+        self._put(add)
+
+    def _put(self, add: Callable[[], None]) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            if len(self) >= self.max_pending:
+                self.blocked_puts += 1
+                # Backpressure: wait for the flusher rather than grow without bound
+                while len(self) >= self.max_pending and not self._closed:
+                    self._cond.wait()
+            add()
+            if len(self) >= self.batch_size:
+                self._cond.notify_all()
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            with self._cond:
+                if self._thread is None and not self._closed:
+                    self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                    self._thread.start()
+
+    def _take_batch(self):
+        word_chains = self._word_chains[:self.batch_size]
+        del self._word_chains[:self.batch_size]
+        players = list(self._players.values())
+        self._players = {}
+        self._in_flight += 1
+        return word_chains, players
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    now = time.monotonic()
+                    if now < self._retry_at:
+                        # Back off after a failure, even when a flush or close is waiting
+                        self._cond.wait(self._retry_at - now)
+                        continue
+                    if self._closed or self._flush_requested or len(self) >= self.batch_size:
+                        break
+                    if deadline <= now:
+                        break
+                    self._cond.wait(deadline - now)
+                if not len(self):
+                    self._flush_requested = False
+                    if self._closed:
+                        return
+                    continue
+                word_chains, players = self._take_batch()
+            self._write(word_chains, players)
+
+    def _write(self, word_chains, players) -> None:
+        start = time.perf_counter()
+        try:
+            self.writer(word_chains, players)
+            self.rows_written += len(word_chains) + len(players)
+            self._attempts = 0
+            self._retry_at = 0.0
+        except Exception as e:
+            self.failures += 1
+            self._attempts += 1
+            logger.error(f"Error flushing {len(word_chains)} moves and {len(players)} players "
+                         f"(attempt {self._attempts}): {str(e)}")
+            if self._attempts >= self.max_attempts:
+                self._attempts = 0
+                self._retry_at = 0.0
+                word_chains, players = self._isolate(word_chains, players)
+                with self._cond:
+                    self.dead_lettered += len(word_chains) + len(players)
+                    self.dead_letters.append((word_chains, players))
+                logger.error(f"Dead-lettered {len(word_chains)} moves and {len(players)} players")
+            else:
+                with self._cond:
+                    # Put the rows back so a later flush retries them; newer scores win
+                    self._word_chains[:0] = word_chains
+                    for player in players:
+                        self._players.setdefault(player['id'], player)
+                    self._retry_at = time.monotonic() + min(
+                        RETRY_MAX_SECONDS, self.retry_seconds * 2 ** (self._attempts - 1))
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+            self.flushes += 1
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _isolate(self, word_chains, players):
+        """Write a batch that keeps failing in halves; returns the rows that fail on their own"""
+        failed = []
+        # The whole batch has just failed, so go straight to its halves
+        parts = [[(True, row) for row in word_chains] + [(False, row) for row in players]]
+        known_bad = True
+        while parts:
+            part = parts.pop()
+            if not known_bad:
+                try:
+                    self.writer([row for is_chain, row in part if is_chain],
+                                [row for is_chain, row in part if not is_chain])
+                    self.rows_written += len(part)
+                    continue
+                except Exception as e:
+                    logger.error(f"Error writing {len(part)} rows on their own: {str(e)}")
+            known_bad = False
+            if len(part) == 1:
+                failed += part
+            else:
+                # Second half underneath so the first half is written first
+                parts += [part[len(part) // 2:], part[:len(part) // 2]]
+        return ([row for is_chain, row in failed if is_chain],
+                [row for is_chain, row in failed if not is_chain])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything queued so far; returns False if it did not finish in time"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = None
+            with self._cond:
+                if not len(self) and not self._in_flight:
+                    return True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                if len(self) and (self._thread is None or not self._thread.is_alive()):
+                    # No flusher running (never started or already stopped): write inline
+                    backoff = self._retry_at - time.monotonic()
+                    if backoff > 0:
+                        self._cond.wait(backoff if remaining is None else min(backoff, remaining))
+                        continue
+                    batch = self._take_batch()
+                else:
+                    self._flush_requested = True
+                    self._cond.notify_all()
+                    self._cond.wait(remaining)
+            if batch is not None:
+                self._write(*batch)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Flush what is queued and stop the flusher"""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        return {
+            'pending': len(self),
+            'flushes': self.flushes,
+            'rows_written': self.rows_written,
+            'failures': self.failures,
+            'blocked_puts': self.blocked_puts,
+            'dead_lettered': self.dead_lettered,
+            'flush_ms_p50': round(latencies[len(latencies) // 2] * 1000, 3) if latencies else 0.0,
+            'flush_ms_p99': round(latencies[int(len(latencies) * 0.99)] * 1000, 3) if latencies else 0.0,
+            'flush_ms_max': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        }
+
+
+# Create singleton instance
+write_behind = WriteBehindQueue(
+    flush_interval_ms=int(os.environ.get('WORDWEAVER_FLUSH_INTERVAL_MS', DEFAULT_FLUSH_INTERVAL_MS)),
+    batch_size=int(os.environ.get('WORDWEAVER_FLUSH_BATCH_SIZE', DEFAULT_BATCH_SIZE)),
+    max_pending=int(os.environ.get('WORDWEAVER_WRITE_QUEUE_SIZE', DEFAULT_MAX_PENDING)),
+)
+try:
+    # Threading exit hooks run in reverse order before the interpreter tears down,
+    # so this final flush runs while concurrent.futures can still take work
+    threading._register_atexit(write_behind.close)
+except AttributeError:
+    atexit.register(write_behind.close)